@@ -0,0 +1,54 @@
+"""
+Benchmark column-parallel fit and transform (the n_jobs option).
+
+Fits and applies the column-wise transforms on a wide matrix with 1, 2, 4,
+... threads up to the number of cores and reports the speedup over one
+thread.
+
+Usage:
+    python benchmarks/bench_column_threads.py [n_rows] [n_cols]
+"""
+
+import sys
+import os
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import numpy as np
+import pandas as pd
+
+from dataruns.core import FillNA, MinMaxScaler, OneHotEncoder, StandardScaler
+
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main(n_rows: int = 200_000, n_cols: int = 256):
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(n_rows, n_cols))
+    data[rng.random(data.shape) < 0.05] = np.nan
+    labels = pd.DataFrame({f"k{i}": rng.integers(0, 100, n_rows).astype(str) for i in range(16)})
+    print(f"{n_rows} rows x {n_cols} cols, {data.nbytes / 2**20:.1f} MiB; {os.cpu_count()} core(s)")
+
+    cases = {
+        'StandardScaler': (lambda n_jobs: StandardScaler(n_jobs=n_jobs), data),
+        'MinMaxScaler': (lambda n_jobs: MinMaxScaler(n_jobs=n_jobs), data),
+        'FillNA(median)': (lambda n_jobs: FillNA(method='median', n_jobs=n_jobs), data),
+        'FillNA(mode)': (lambda n_jobs: FillNA(method='mode', n_jobs=n_jobs), np.round(data)),
+        'OneHotEncoder': (lambda n_jobs: OneHotEncoder(n_jobs=n_jobs), labels),
+    }
+    for label, (make, inputs) in cases.items():
+        baseline = None
+        n_jobs = 1
+        while n_jobs <= (os.cpu_count() or 1):
+            elapsed, _ = _timed(lambda: make(n_jobs).fit(inputs).transform(inputs))
+            baseline = baseline or elapsed
+            print(f"{label:>16} {f'{n_jobs} thread(s)':>12}: {elapsed:7.3f}s  {baseline / elapsed:5.2f}x")
+            n_jobs *= 2
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,51 @@
+"""
+Benchmark CSVSource.extract_parallel against the single-process reader.
+
+Writes a synthetic numeric CSV file and reports parse throughput for an
+increasing number of worker processes.
+
+Usage:
+    python benchmarks/bench_csv_parallel.py [n_rows] [n_cols]
+"""
+
+import sys
+import os
+import tempfile
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import numpy as np
+import pandas as pd
+
+from dataruns.source.datasource import CSVSource
+
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main(n_rows: int = 2_000_000, n_cols: int = 10):
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'synthetic.csv')
+        frame = pd.DataFrame(rng.normal(size=(n_rows, n_cols)), columns=[f"c{i}" for i in range(n_cols)])
+        frame.to_csv(path, index=False)
+        size_mb = os.path.getsize(path) / 2**20
+        print(f"{n_rows} rows x {n_cols} cols, {size_mb:.1f} MiB")
+
+        source = CSVSource(file_path=path)
+        elapsed, _ = _timed(source.extract_data)
+        print(f"{'extract_data':>16}: {elapsed:7.3f}s  {size_mb / elapsed:8.1f} MiB/s")
+
+        workers = 1
+        while workers <= (os.cpu_count() or 1):
+            elapsed, result = _timed(lambda: source.extract_parallel(n_workers=workers))
+            assert len(result) == n_rows
+            print(f"{f'{workers} worker(s)':>16}: {elapsed:7.3f}s  {size_mb / elapsed:8.1f} MiB/s")
+            workers *= 2
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
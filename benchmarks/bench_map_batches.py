@@ -0,0 +1,47 @@
+"""
+Benchmark Pipeline.map_batches against running the pipeline in one process.
+
+Runs a fitted numeric pipeline over a large array with an increasing number
+of worker processes; array batches and results travel through shared memory.
+
+Usage:
+    python benchmarks/bench_map_batches.py [n_rows] [n_cols] [batch_size]
+"""
+
+import sys
+import os
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import numpy as np
+
+from dataruns.core import FillNA, Pipeline, StandardScaler
+
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main(n_rows: int = 4_000_000, n_cols: int = 16, batch_size: int = 250_000):
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(n_rows, n_cols))
+    data[rng.random(data.shape) < 0.05] = np.nan
+    fill = FillNA(method='median').fit(data)
+    pipeline = Pipeline(fill, StandardScaler().fit(fill.transform(data)), np.tanh)
+    print(f"{n_rows} rows x {n_cols} cols, {data.nbytes / 2**20:.1f} MiB, batches of {batch_size} rows")
+
+    baseline, expected = _timed(lambda: pipeline(data))
+    print(f"{'in process':>16}: {baseline:7.3f}s")
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        elapsed, result = _timed(lambda: pipeline.map_batches(data, n_workers=workers, batch_size=batch_size))
+        assert np.allclose(result, expected)
+        print(f"{f'{workers} worker(s)':>16}: {elapsed:7.3f}s  {baseline / elapsed:5.2f}x")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,101 @@
+"""
+Benchmark the vectorized NaN kernels of FillNA and DropNA on wide matrices.
+
+Compares FillNA median/mode fitting and filling against the per-column
+reference loops, and times a DropNA -> FillNA -> DropNA chain run stage by
+stage against the same chain in a TransformComposer, whose stages share one
+missing-value mask, for an increasing number of columns.
+
+Usage:
+    python benchmarks/bench_nan_kernels.py [n_rows] [max_cols]
+"""
+
+import sys
+import os
+import time
+import warnings
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import numpy as np
+
+from dataruns.core import DropNA, FillNA, MissingMask, TransformComposer
+
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def _mode_loop(data):
+    """The per-column np.unique loop the kernels replace."""
+    modes = []
+    for i in range(data.shape[1]):
+        column = data[:, i]
+        column = column[~np.isnan(column)]
+        if len(column) == 0:
+            modes.append(0)
+            continue
+        values, counts = np.unique(column, return_counts=True)
+        modes.append(values[np.argmax(counts)])
+    return np.array(modes)
+
+
+def _median_loop(data):
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        return np.nanmedian(data, axis=0)
+
+
+def _fill_loop(data, fill_values):
+    result = data.copy()
+    mask = np.isnan(result)
+    for i, fill_val in enumerate(fill_values):
+        result[mask[:, i], i] = fill_val
+    return result
+
+
+def _report(label, loop, vectorized, n_cols):
+    print(f"{label:>14}: loop {loop:7.3f}s  vectorized {vectorized:7.3f}s  "
+          f"({loop / vectorized:5.1f}x, {vectorized / n_cols * 1e6:6.2f} us/column)")
+
+
+def main(n_rows: int = 1_000, max_cols: int = 16_000):
+    rng = np.random.default_rng(0)
+    n_cols = 1_000
+    while n_cols <= max_cols:
+        data = rng.integers(0, 50, size=(n_rows, n_cols)).astype(float)
+        data[rng.random(data.shape) < 0.1] = np.nan
+        print(f"{n_rows} rows x {n_cols} cols, {data.nbytes / 2**20:.1f} MiB")
+
+        loop, expected = _timed(lambda: _mode_loop(data))
+        vectorized, fill = _timed(lambda: FillNA(method='mode').fit(data))
+        assert np.array_equal(fill.fill_values_, expected)
+        _report('mode', loop, vectorized, n_cols)
+
+        loop, expected = _timed(lambda: _median_loop(data))
+        vectorized, median = _timed(lambda: FillNA(method='median').fit(data))
+        assert np.allclose(median.fill_values_, expected, equal_nan=True)
+        _report('median', loop, vectorized, n_cols)
+
+        loop, expected = _timed(lambda: _fill_loop(data, fill.fill_values_))
+        vectorized, filled = _timed(lambda: fill.transform(data))
+        assert np.array_equal(filled, expected)
+        _report('fill', loop, vectorized, n_cols)
+
+        chain = (DropNA(axis=1, how='all'), fill, DropNA(axis=1))
+        def run_chain():
+            result = data
+            for stage in chain:
+                result = stage.transform(result)
+            return result
+        loop, expected = _timed(run_chain)
+        mask = MissingMask()
+        shared, result = _timed(lambda: TransformComposer(*chain).transform(data, mask=mask))
+        assert np.array_equal(result, expected) and mask.computed == 1
+        _report('NA chain', loop, shared, n_cols)
+        n_cols *= 4
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
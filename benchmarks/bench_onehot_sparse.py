@@ -0,0 +1,47 @@
+"""
+Benchmark sparse against dense OneHotEncoder output as the cardinality grows.
+
+Encodes one column of n_rows labels with 10, 100, ... categories. The
+number of nonzeros stays at n_rows, so the sparse output only grows by a
+fixed cost per output column, while the dense output grows with
+rows x categories.
+
+Usage:
+    python benchmarks/bench_onehot_sparse.py [n_rows] [max_categories]
+"""
+
+import sys
+import os
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import numpy as np
+import pandas as pd
+
+from dataruns.core import OneHotEncoder
+
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main(n_rows: int = 200_000, max_categories: int = 10_000):
+    rng = np.random.default_rng(0)
+    n_categories = 10
+    while n_categories <= max_categories:
+        labels = pd.DataFrame({'k': rng.integers(0, n_categories, n_rows).astype(str)})
+        dense_encoder = OneHotEncoder(dtype=np.uint8).fit(labels)
+        sparse_encoder = OneHotEncoder(dtype=np.uint8, sparse=True).fit(labels)
+        dense_time, dense = _timed(lambda: dense_encoder.transform(labels))
+        sparse_time, sparse = _timed(lambda: sparse_encoder.transform(labels))
+        nonzeros = sum(column.sparse.npoints for _, column in sparse.items())
+        assert nonzeros == n_rows and sparse.shape == dense.shape
+        print(f"{n_categories:>7} categories: dense {dense_time:7.3f}s  sparse {sparse_time:7.3f}s  "
+              f"({dense_time / sparse_time:6.1f}x, {sparse_time / n_categories * 1e6:7.1f} us/column)")
+        n_categories *= 10
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
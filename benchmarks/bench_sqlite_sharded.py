@@ -0,0 +1,59 @@
+"""
+Benchmark SQLiteSource.extract_sharded against the single-connection path.
+
+Creates a synthetic table and reports read throughput of extract_data and
+of sharded reads with an increasing number of workers.
+
+Usage:
+    python benchmarks/bench_sqlite_sharded.py [n_rows]
+"""
+
+import sys
+import os
+import sqlite3
+import tempfile
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import numpy as np
+
+from dataruns.source.datasource import SQLiteSource
+
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main(n_rows: int = 1_000_000):
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'synthetic.db')
+        with sqlite3.connect(path) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, a REAL, b REAL, c INTEGER, d TEXT)")
+            conn.executemany(
+                "INSERT INTO t VALUES (?, ?, ?, ?, ?)",
+                ((i, float(x), float(y), int(z), f"row{i}")
+                 for i, (x, y, z) in enumerate(zip(rng.normal(size=n_rows), rng.normal(size=n_rows),
+                                                    rng.integers(0, 1000, size=n_rows)))),
+            )
+        print(f"{n_rows} rows, {os.path.getsize(path) / 2**20:.1f} MiB")
+
+        source = SQLiteSource(path, table_name='t')
+        elapsed, _ = _timed(source.extract_data)
+        print(f"{'single connection':>24}: {elapsed:7.3f}s  {n_rows / elapsed:12,.0f} rows/s")
+
+        for executor in ('thread', 'process'):
+            workers = 1
+            while workers <= (os.cpu_count() or 1):
+                elapsed, result = _timed(lambda: source.extract_sharded(n_workers=workers, executor=executor))
+                assert len(result) == n_rows
+                label = f"{workers} {executor}(s)"
+                print(f"{label:>24}: {elapsed:7.3f}s  {n_rows / elapsed:12,.0f} rows/s")
+                workers *= 2
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -32,33 +32,63 @@ __version__ = "0.1.1"
 
 
 
-# Core imports
-from .core import (
-    Pipeline, 
-    Make_Pipeline,
-    Transform,
-    StandardScaler,
-    MinMaxScaler,
-    DropNA,
-    FillNA,
-    SelectColumns,
-    RenameColumns,
-    FilterRows,
-    OneHotEncoder,
-    TransformComposer,
-    create_preprocessing_pipeline
-)
-
-# Source imports
-from .source import (
-    CSVSource,
-    XLSsource,
-    SQLiteSource
-)
-
-# Expose commonly used external dependencies
-import pandas as pd
-import numpy as np
+# Public names are imported on first access (PEP 562), so that
+# ``import dataruns`` stays cheap and does not pull in pandas, numpy,
+# requests or openpyxl until they are actually used.
+_LAZY_IMPORTS = {
+    # Core imports
+    'Pipeline': '.core.pipeline',
+    'Make_Pipeline': '.core.pipeline',
+    'SpeedUp': '.core.pipeline',
+    'Transform': '.core.transforms',
+    'StandardScaler': '.core.transforms',
+    'MinMaxScaler': '.core.transforms',
+    'DropNA': '.core.transforms',
+    'FillNA': '.core.transforms',
+    'SelectColumns': '.core.transforms',
+    'RenameColumns': '.core.transforms',
+    'FilterRows': '.core.transforms',
+    'col': '.core.expr',
+    'OneHotEncoder': '.core.transforms',
+    'HashingEncoder': '.core.transforms',
+    'TransformComposer': '.core.transforms',
+    'create_preprocessing_pipeline': '.core.transforms',
+    'Profiler': '.core.profiling',
+    
+    # Source imports
+    'CSVSource': '.source.datasource',
+    'XLSsource': '.source.datasource',
+    'SQLiteSource': '.source.datasource',
+}
+
+_LAZY_MODULES = {
+    'core': '.core',
+    'source': '.source',
+    
+    # Expose commonly used external dependencies
+    'pd': 'pandas',
+    'np': 'numpy',
+}
+
+
+def __getattr__(name):
+    import importlib
+    
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    elif name in _LAZY_MODULES:
+        module = _LAZY_MODULES[name]
+        value = importlib.import_module(module, __name__ if module.startswith('.') else None)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache it so __getattr__ is only hit once per name
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | set(_LAZY_MODULES))
+
 
 # Make pandas and numpy available at package level for convenience
 __all__ = [
@@ -68,6 +98,7 @@ __all__ = [
     # Core pipeline classes
     'Pipeline',
     'Make_Pipeline',
+    'SpeedUp',
     
     # Transform classes
     'Transform',
@@ -79,8 +110,10 @@ __all__ = [
     'RenameColumns',
     'FilterRows',
     'OneHotEncoder',
+    'HashingEncoder',
     'TransformComposer',
     'create_preprocessing_pipeline',
+    'Profiler',
     
     # Data sources
     'CSVSource',
@@ -108,16 +141,20 @@ def quick_pipeline(*transforms):
         >>> fillna = FillNA(method='mean')
         >>> pipeline = quick_pipeline(fillna, scaler)
     """
+    from .core.pipeline import Pipeline
+    
     if len(transforms) == 1 and isinstance(transforms[0], (list, tuple)):
         transforms = transforms[0]
     return Pipeline(*transforms)
 
-def load_csv(file_path, **kwargs):
+def load_csv(file_path, cache=None, **kwargs):
     """
     Convenience function to load CSV data.
     
     Args:
         file_path (str): Path to CSV file
+        cache (bool or ColumnarCache, optional): Reuse a columnar on-disk copy
+            of the parsed file while it is unchanged
         **kwargs: Additional arguments passed to CSVSource
         
     Returns:
@@ -125,8 +162,15 @@ def load_csv(file_path, **kwargs):
         
     Example:
         >>> data = load_csv('data.csv')
+        >>> data = load_csv('data.csv', cache=True)
     """
+    from .source.cache import resolve_cache
+    from .source.datasource import CSVSource
+    
     source = CSVSource(file_path=file_path, **kwargs)
+    cache = resolve_cache(cache)
+    if cache is not None:
+        return cache.extract(source)
     return source.extract_data()
 
 
@@ -22,7 +22,7 @@ Example Usage:
     >>> result = composer.fit_transform(data)
 """
 # Pipeline imports
-from .pipeline import Pipeline, Make_Pipeline
+from .pipeline import Pipeline, Make_Pipeline, CompiledPipeline, SpeedUp
 # Transform imports
 from .transforms import (
     # Base class
@@ -35,6 +35,7 @@ from .transforms import (
     # Missing value handling
     DropNA,
     FillNA,
+    MissingMask,
     
     # Column operations
     SelectColumns,
@@ -45,21 +46,33 @@ from .transforms import (
     
     # Encoding
     OneHotEncoder,
+    HashingEncoder,
     
     # Composition[The PIPELINE of transforms]
     TransformComposer,
+    FusedAffine,
     
     # Convenience functions
     create_preprocessing_pipeline
 )
+# Optimization passes
+from .optimize import fuse_affine
+# Source planning
+from .expr import Predicate, col
+from .planner import SourcePlan, plan
+from .lazy import LazyPipeline
 # Type imports
 from .types import Function
+# Instrumentation imports
+from .profiling import Profiler, StageHook, StageRecord
 
 # Define what gets exported with "from dataruns.core import *"
 __all__ = [
     # Pipeline classes
     'Pipeline',
     'Make_Pipeline',
+    'CompiledPipeline',
+    'SpeedUp',
     
     # Transform base class
     'Transform',
@@ -71,6 +84,7 @@ __all__ = [
     # Missing value handling
     'DropNA', 
     'FillNA',
+    'MissingMask',
     
     # Column operations
     'SelectColumns',
@@ -81,15 +95,30 @@ __all__ = [
     
     # Encoding
     'OneHotEncoder',
+    'HashingEncoder',
     
     # Composition
     'TransformComposer',
+    'FusedAffine',
+    'fuse_affine',
+    
+    # Source planning
+    'Predicate',
+    'col',
+    'SourcePlan',
+    'plan',
+    'LazyPipeline',
     
     # Convenience functions
     'create_preprocessing_pipeline',
     
     # Core types
-    'Function'
+    'Function',
+    
+    # Instrumentation
+    'Profiler',
+    'StageHook',
+    'StageRecord'
 ]
 
 # Module level convenience functions
@@ -103,7 +132,7 @@ def list_transforms():
     transforms = [
         'StandardScaler', 'MinMaxScaler', 'DropNA', 'FillNA',
         'SelectColumns', 'RenameColumns', 'FilterRows', 'ApplyFunction',
-        'OneHotEncoder'
+        'OneHotEncoder', 'HashingEncoder'
     ]
     return transforms
 
@@ -0,0 +1,162 @@
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from .pipeline import Pipeline
+
+# This file contains the process-pool batch runner behind Pipeline.map_batches.
+#
+# The pipeline (with its fitted state) is pickled once and handed to every
+# worker by the pool initializer. Array inputs are copied once into a shared
+# memory block that workers slice their batches from, and array results come
+# back in shared memory blocks created by the workers, so only small
+# descriptors go through the task queue. Everything else is pickled.
+
+_worker_pipeline = None
+_worker_inputs: Dict[str, Tuple[SharedMemory, np.ndarray]] = {}
+
+
+class _SharedArray:
+    """Name, shape and dtype of an ndarray stored in a shared memory block."""
+    __slots__ = ('name', 'shape', 'dtype')
+
+    def __init__(self, name: str, shape: tuple, dtype: str):
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+
+    def __getstate__(self):
+        return self.name, self.shape, self.dtype
+
+    def __setstate__(self, state):
+        self.name, self.shape, self.dtype = state
+
+    @classmethod
+    def create(cls, array: np.ndarray) -> Tuple[SharedMemory, '_SharedArray']:
+        """Copy array into a new shared memory block; the caller owns (and unlinks) the block."""
+        shm = SharedMemory(create=True, size=max(array.nbytes, 1))
+        np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+        return shm, cls(shm.name, array.shape, array.dtype.str)
+
+    def attach(self) -> Tuple[SharedMemory, np.ndarray]:
+        shm = SharedMemory(name=self.name)
+        return shm, np.ndarray(self.shape, dtype=np.dtype(self.dtype), buffer=shm.buf)
+
+
+def _shareable(value: Any) -> bool:
+    return isinstance(value, np.ndarray) and not value.dtype.hasobject
+
+
+def _init_worker(payload: bytes):
+    global _worker_pipeline
+    _worker_pipeline = pickle.loads(payload)
+
+
+def _run_batch(batch: Any, start: Optional[int] = None, stop: Optional[int] = None) -> Any:
+    """Run the worker's pipeline on one batch. Runs inside worker processes."""
+    if isinstance(batch, _SharedArray):
+        # attach to the input once per worker, batches are views into it
+        if batch.name not in _worker_inputs:
+            _worker_inputs[batch.name] = batch.attach()
+        view = _worker_inputs[batch.name][1][start:stop]
+        # the input is shared with the other workers, in-place transforms must copy
+        view.flags.writeable = False
+        batch = view
+    result = _worker_pipeline(batch)
+    if not _shareable(result):
+        return result
+    shm, shared = _SharedArray.create(result)
+    shm.close()
+    return shared
+
+
+def _collect(result: Any) -> Any:
+    """Turn a worker result back into a local value, releasing its shared memory."""
+    if not isinstance(result, _SharedArray):
+        return result
+    shm, view = result.attach()
+    try:
+        return view.copy()
+    finally:
+        del view
+        shm.close()
+        shm.unlink()
+
+
+def _release(futures: List[Future]):
+    """Unlink the shared memory of batches that finished but were never collected."""
+    for future in futures:
+        if future.cancelled() or future.exception() is not None:
+            continue
+        result = future.result()
+        if isinstance(result, _SharedArray):
+            try:
+                shm = SharedMemory(name=result.name)
+            except FileNotFoundError:
+                continue
+            shm.close()
+            shm.unlink()
+
+
+def _combine(results: List[Any]) -> Any:
+    if results and all(isinstance(result, np.ndarray) for result in results):
+        return np.concatenate(results)
+    if results and all(isinstance(result, (pd.DataFrame, pd.Series)) for result in results):
+        return pd.concat(results)
+    return results
+
+
+def map_batches(pipeline: 'Pipeline', data: Any, n_workers: Optional[int] = None,
+                batch_size: int = 100_000) -> Any:
+    """
+    Run pipeline over row batches of data in a process pool.
+
+    See Pipeline.map_batches.
+    """
+    from .pipeline import Pipeline
+
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    if isinstance(data, list):
+        data = np.array(data)
+    if not isinstance(data, (np.ndarray, pd.DataFrame, pd.Series)):
+        raise TypeError("map_batches expects an ndarray, DataFrame or Series")
+
+    # hooks and compiled buffers stay in this process
+    payload = pickle.dumps(Pipeline(*pipeline.functions))
+    bounds = [(start, min(start + batch_size, len(data))) for start in range(0, len(data), batch_size)]
+    if not bounds:
+        return pipeline(data)
+    n_workers = min(n_workers or os.cpu_count() or 1, len(bounds))
+
+    shared_input = None
+    try:
+        if _shareable(data):
+            shared_input, descriptor = _SharedArray.create(data)
+            batches = [(descriptor, start, stop) for start, stop in bounds]
+        elif isinstance(data, np.ndarray):
+            batches = [(data[start:stop],) for start, stop in bounds]
+        else:
+            batches = [(data.iloc[start:stop],) for start, stop in bounds]
+        with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker, initargs=(payload,)) as pool:
+            futures = [pool.submit(_run_batch, *batch) for batch in batches]
+            results = []
+            try:
+                # collected in submission order, which is row order
+                for future in futures:
+                    results.append(_collect(future.result()))
+            except BaseException:
+                pool.shutdown(wait=True, cancel_futures=True)
+                _release(futures[len(results):])
+                raise
+    finally:
+        if shared_input is not None:
+            shared_input.close()
+            shared_input.unlink()
+    return _combine(results)
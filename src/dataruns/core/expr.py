@@ -0,0 +1,276 @@
+from typing import Any, Iterable, List, Set, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+# This file contains declarative row predicates. Unlike an opaque callable,
+# a predicate can be evaluated vectorized and translated into SQL, so the
+# planner can push it into sources.
+#
+# Predicates follow SQL's three-valued logic: a comparison against a missing
+# value is unknown, and unknown rows are rejected. Evaluating a predicate on
+# a DataFrame therefore selects exactly the rows its WHERE clause would.
+
+
+def _values(data: Union[np.ndarray, pd.DataFrame], name: Union[str, int]) -> np.ndarray:
+    if isinstance(data, pd.DataFrame):
+        return data[name].to_numpy()
+    return np.asarray(data)[:, name]
+
+
+def _isna(values: np.ndarray) -> np.ndarray:
+    return np.asarray(pd.isna(values), dtype=bool)
+
+
+def _sql_value(value: Any) -> Any:
+    # numpy scalars are not supported as sqlite3 parameters
+    return value.item() if isinstance(value, np.generic) else value
+
+
+class Predicate:
+    """
+    Base class of row predicates. Combine predicates with &, | and ~.
+    """
+
+    def _evaluate(self, data: Union[np.ndarray, pd.DataFrame]) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (true, unknown) masks over the rows of data."""
+        raise NotImplementedError("Subclasses must implement this method")
+
+    def evaluate(self, data: Union[np.ndarray, pd.DataFrame]) -> np.ndarray:
+        """Boolean mask of the rows for which the predicate holds."""
+        return self._evaluate(data)[0]
+
+    def to_sql(self) -> Tuple[str, List[Any]]:
+        """Return (clause, params) for a parameterized WHERE clause."""
+        raise NotImplementedError("Subclasses must implement this method")
+
+    def columns(self) -> Set[Union[str, int]]:
+        """Columns the predicate reads."""
+        raise NotImplementedError("Subclasses must implement this method")
+
+    def __call__(self, data: Union[np.ndarray, pd.DataFrame]) -> np.ndarray:
+        return self.evaluate(data)
+
+    def __and__(self, other: 'Predicate') -> 'Predicate':
+        return And(self, other)
+
+    def __or__(self, other: 'Predicate') -> 'Predicate':
+        return Or(self, other)
+
+    def __invert__(self) -> 'Predicate':
+        return Not(self)
+
+    def __bool__(self):
+        raise TypeError("Predicates cannot be used as booleans, combine them with &, | and ~")
+
+
+class Comparison(Predicate):
+    """Comparison of a column against a constant."""
+    _ops = {
+        '==': ('=', np.equal),
+        '!=': ('!=', np.not_equal),
+        '<': ('<', np.less),
+        '<=': ('<=', np.less_equal),
+        '>': ('>', np.greater),
+        '>=': ('>=', np.greater_equal),
+    }
+
+    def __init__(self, column: Union[str, int], op: str, value: Any):
+        if op not in self._ops:
+            raise ValueError(f"Unsupported comparison: {op}")
+        if value is None or (isinstance(value, float) and np.isnan(value)):
+            raise ValueError("Compare against missing values with col(...).isna() instead")
+        self.column = column
+        self.op = op
+        self.value = value
+
+    def _evaluate(self, data):
+        values = _values(data, self.column)
+        unknown = _isna(values)
+        result = np.zeros(len(values), dtype=bool)
+        if unknown.any():
+            # missing values may not be comparable at all (e.g. None in string columns)
+            known = ~unknown
+            result[known] = self._ops[self.op][1](values[known], self.value)
+        else:
+            result[:] = self._ops[self.op][1](values, self.value)
+        return result, unknown
+
+    def to_sql(self):
+        return f"{_quote(self.column)} {self._ops[self.op][0]} ?", [_sql_value(self.value)]
+
+    def columns(self):
+        return {self.column}
+
+    def __repr__(self):
+        return f"(col({self.column!r}) {self.op} {self.value!r})"
+
+
+class IsIn(Predicate):
+    """Membership of a column's values in a set of constants."""
+
+    def __init__(self, column: Union[str, int], values: Iterable[Any]):
+        self.column = column
+        self.values = list(values)
+
+    def _evaluate(self, data):
+        values = _values(data, self.column)
+        unknown = _isna(values)
+        return np.asarray(pd.Series(values).isin(self.values), dtype=bool) & ~unknown, unknown
+
+    def to_sql(self):
+        if not self.values:
+            # false, but unknown for missing values so that NOT keeps rejecting them
+            return f"(CASE WHEN {_quote(self.column)} IS NULL THEN NULL ELSE 0 END)", []
+        placeholders = ', '.join('?' for _ in self.values)
+        return f"{_quote(self.column)} IN ({placeholders})", [_sql_value(value) for value in self.values]
+
+    def columns(self):
+        return {self.column}
+
+    def __repr__(self):
+        return f"col({self.column!r}).isin({self.values!r})"
+
+
+class IsNull(Predicate):
+    """Whether a column's value is missing."""
+
+    def __init__(self, column: Union[str, int]):
+        self.column = column
+
+    def _evaluate(self, data):
+        values = _values(data, self.column)
+        return _isna(values), np.zeros(len(values), dtype=bool)
+
+    def to_sql(self):
+        return f"{_quote(self.column)} IS NULL", []
+
+    def columns(self):
+        return {self.column}
+
+    def __repr__(self):
+        return f"col({self.column!r}).isna()"
+
+
+class And(Predicate):
+    def __init__(self, left: Predicate, right: Predicate):
+        self.left = left
+        self.right = right
+
+    def _evaluate(self, data):
+        left_true, left_unknown = self.left._evaluate(data)
+        right_true, right_unknown = self.right._evaluate(data)
+        false = (~left_true & ~left_unknown) | (~right_true & ~right_unknown)
+        return left_true & right_true, (left_unknown | right_unknown) & ~false
+
+    def to_sql(self):
+        left, left_params = self.left.to_sql()
+        right, right_params = self.right.to_sql()
+        return f"({left} AND {right})", left_params + right_params
+
+    def columns(self):
+        return self.left.columns() | self.right.columns()
+
+    def __repr__(self):
+        return f"({self.left!r} & {self.right!r})"
+
+
+class Or(Predicate):
+    def __init__(self, left: Predicate, right: Predicate):
+        self.left = left
+        self.right = right
+
+    def _evaluate(self, data):
+        left_true, left_unknown = self.left._evaluate(data)
+        right_true, right_unknown = self.right._evaluate(data)
+        true = left_true | right_true
+        return true, (left_unknown | right_unknown) & ~true
+
+    def to_sql(self):
+        left, left_params = self.left.to_sql()
+        right, right_params = self.right.to_sql()
+        return f"({left} OR {right})", left_params + right_params
+
+    def columns(self):
+        return self.left.columns() | self.right.columns()
+
+    def __repr__(self):
+        return f"({self.left!r} | {self.right!r})"
+
+
+class Not(Predicate):
+    def __init__(self, operand: Predicate):
+        self.operand = operand
+
+    def _evaluate(self, data):
+        true, unknown = self.operand._evaluate(data)
+        return ~true & ~unknown, unknown
+
+    def to_sql(self):
+        clause, params = self.operand.to_sql()
+        return f"NOT {clause}" if clause.startswith('(') else f"NOT ({clause})", params
+
+    def columns(self):
+        return self.operand.columns()
+
+    def __repr__(self):
+        return f"~{self.operand!r}"
+
+
+class Column:
+    """
+    Reference to a column, used to build predicates.
+
+    Example:
+        >>> predicate = (col('price') > 10) & col('region').isin(['EU', 'US'])
+        >>> FilterRows(predicate)
+    """
+    __hash__ = None
+
+    def __init__(self, name: Union[str, int]):
+        self.name = name
+
+    def __eq__(self, value):
+        return Comparison(self.name, '==', value)
+
+    def __ne__(self, value):
+        return Comparison(self.name, '!=', value)
+
+    def __lt__(self, value):
+        return Comparison(self.name, '<', value)
+
+    def __le__(self, value):
+        return Comparison(self.name, '<=', value)
+
+    def __gt__(self, value):
+        return Comparison(self.name, '>', value)
+
+    def __ge__(self, value):
+        return Comparison(self.name, '>=', value)
+
+    def isin(self, values: Iterable[Any]) -> Predicate:
+        return IsIn(self.name, values)
+
+    def between(self, low: Any, high: Any) -> Predicate:
+        """Inclusive range check, like SQL BETWEEN."""
+        return (self >= low) & (self <= high)
+
+    def isna(self) -> Predicate:
+        return IsNull(self.name)
+
+    def notna(self) -> Predicate:
+        return Not(IsNull(self.name))
+
+    def __repr__(self):
+        return f"col({self.name!r})"
+
+
+def col(name: Union[str, int]) -> Column:
+    """Reference column name (a label for DataFrames, an index for arrays)."""
+    return Column(name)
+
+
+def _quote(name: Union[str, int]) -> str:
+    if not isinstance(name, str):
+        raise TypeError("Only named columns can be translated to SQL")
+    return '"' + name.replace('"', '""') + '"'
@@ -0,0 +1,415 @@
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+import os
+
+import pandas as pd
+
+from .expr import Predicate
+from .pipeline import _iter_stages
+from .profiling import stage_name
+from .transforms import FilterRows, RenameColumns, SelectColumns
+
+# This file contains the lazy pipeline: a source plus stages recorded as a
+# logical plan, rewritten by a few optimization rules and only run on collect().
+
+# Fraction of rows a filter is assumed to keep when estimating plan sizes
+DEFAULT_SELECTIVITY = 0.33
+
+
+class PlanNode:
+    """A step of a logical plan."""
+
+    def execute(self, data: Any) -> Any:
+        raise NotImplementedError("Subclasses must implement this method")
+
+    def describe(self) -> str:
+        raise NotImplementedError("Subclasses must implement this method")
+
+
+class Scan(PlanNode):
+    """Read a source, with the projection and predicate pushed into it."""
+
+    def __init__(self, source: Any, columns: Optional[List[str]] = None, predicate: Optional[Predicate] = None):
+        self.source = source
+        self.columns = columns
+        self.predicate = predicate
+
+    def physical_source(self) -> Any:
+        source = self.source
+        if self.columns is not None:
+            source = source.with_columns(self.columns)
+        if self.predicate is not None:
+            source = source.with_predicate(self.predicate)
+        return source
+
+    def execute(self, data: Any = None) -> Any:
+        return self.physical_source().extract_data()
+
+    def describe(self) -> str:
+        parts = [f"Scan {self.source.__class__.__name__}"]
+        if self.columns is not None:
+            parts.append(f"columns={self.columns}")
+        if self.predicate is not None:
+            parts.append(f"predicate={self.predicate!r}")
+        return ' '.join(parts)
+
+
+class Filter(PlanNode):
+    def __init__(self, predicate: Predicate):
+        self.predicate = predicate
+
+    def execute(self, data: Any) -> Any:
+        return FilterRows(self.predicate).transform(data)
+
+    def describe(self) -> str:
+        return f"Filter {self.predicate!r}"
+
+
+class Project(PlanNode):
+    def __init__(self, columns: List[Any]):
+        self.columns = list(columns)
+
+    def execute(self, data: Any) -> Any:
+        return SelectColumns(self.columns).transform(data)
+
+    def describe(self) -> str:
+        return f"Project {self.columns}"
+
+
+class Rename(PlanNode):
+    def __init__(self, mapping: Dict[Any, Any]):
+        self.mapping = dict(mapping)
+
+    def execute(self, data: Any) -> Any:
+        return RenameColumns(self.mapping).transform(data)
+
+    def describe(self) -> str:
+        return f"Rename {self.mapping}"
+
+
+class Apply(PlanNode):
+    """Any other stage, treated as a black box unless it declares otherwise."""
+
+    def __init__(self, stage: Callable):
+        self.stage = stage
+
+    def _declares(self, method: str, default: Any) -> Any:
+        declared = getattr(self.stage, method, None)
+        return declared() if callable(declared) else default
+
+    def row_local(self) -> bool:
+        return self._declares('row_local', False)
+
+    def column_local(self) -> bool:
+        return self._declares('column_local', False)
+
+    def modified_columns(self) -> Optional[Set[Any]]:
+        return self._declares('modified_columns', None)
+
+    def execute(self, data: Any) -> Any:
+        return self.stage(data)
+
+    def describe(self) -> str:
+        return f"Apply {stage_name(self.stage)}"
+
+
+def _to_node(stage: Callable) -> PlanNode:
+    if isinstance(stage, FilterRows) and stage.predicate is not None:
+        return Filter(stage.predicate)
+    if isinstance(stage, SelectColumns):
+        return Project(stage.columns)
+    if isinstance(stage, RenameColumns):
+        return Rename(stage.mapping)
+    return Apply(stage)
+
+
+def _named(columns) -> bool:
+    return all(isinstance(column, str) for column in columns)
+
+
+# Optimization rules. Each takes and returns the list of nodes after the Scan.
+
+def eliminate_noop_renames(nodes: List[PlanNode]) -> List[PlanNode]:
+    """Drop identity entries of renames, and renames left empty."""
+    result = []
+    for node in nodes:
+        if isinstance(node, Rename):
+            mapping = {old: new for old, new in node.mapping.items() if old != new}
+            if not mapping:
+                continue
+            node = Rename(mapping) if mapping != node.mapping else node
+        result.append(node)
+    return result
+
+
+def merge_projections(nodes: List[PlanNode]) -> List[PlanNode]:
+    """Collapse adjacent projections into the last one."""
+    result: List[PlanNode] = []
+    for node in nodes:
+        previous = result[-1] if result else None
+        if isinstance(node, Project) and isinstance(previous, Project) and set(node.columns) <= set(previous.columns):
+            result[-1] = node
+        else:
+            result.append(node)
+    return result
+
+
+def _filter_can_pass(predicate: Predicate, node: PlanNode) -> bool:
+    """Whether a filter right after node gives the same result when run before it."""
+    columns = predicate.columns()
+    if isinstance(node, Filter):
+        return True
+    if isinstance(node, Project):
+        return columns <= set(node.columns)
+    if isinstance(node, Rename):
+        return not columns & (set(node.mapping) | set(node.mapping.values()))
+    if isinstance(node, Apply) and node.row_local():
+        # transforms that still need fitting learn statistics from the rows they see
+        needs_fit = getattr(node.stage, 'needs_fit', None)
+        if callable(needs_fit) and needs_fit() and not getattr(node.stage, 'fitted', False):
+            return False
+        modified = node.modified_columns()
+        return modified is not None and not columns & modified
+    return False
+
+
+def push_filters(nodes: List[PlanNode]) -> List[PlanNode]:
+    """
+    Move filters ahead of the row-local stages before them that do not
+    change the columns the predicate reads, and merge adjacent filters.
+    """
+    result: List[PlanNode] = []
+    for node in nodes:
+        if not isinstance(node, Filter):
+            result.append(node)
+            continue
+        position = len(result)
+        while position > 0 and _filter_can_pass(node.predicate, result[position - 1]):
+            position -= 1
+            if isinstance(result[position], Filter):
+                break
+        if position < len(result) and isinstance(result[position], Filter):
+            result[position] = Filter(result[position].predicate & node.predicate)
+        else:
+            result.insert(position, node)
+    return result
+
+
+def _required_columns(nodes: List[PlanNode], start: int, stop: int, columns: List[Any]) -> List[Any]:
+    """Columns that must exist before nodes[start:stop] for columns to exist after them."""
+    required = list(columns)
+    for node in reversed(nodes[start:stop]):
+        if isinstance(node, Filter):
+            required += sorted(set(node.predicate.columns()) - set(required), key=str)
+        elif isinstance(node, Rename):
+            inverse = {new: old for old, new in node.mapping.items()}
+            required = [inverse.get(column, column) for column in required]
+    return required
+
+
+def push_projections(nodes: List[PlanNode]) -> List[PlanNode]:
+    """
+    Drop unused columns early: the columns a projection keeps (plus those
+    the renames and filters before it read) are selected right after the
+    last stage that cannot run on a subset of columns.
+    """
+    result = list(nodes)
+    index = len(result) - 1
+    while index >= 0:
+        node = result[index]
+        if not isinstance(node, Project) or not _named(node.columns):
+            index -= 1
+            continue
+        position = index
+        while position > 0:
+            previous = result[position - 1]
+            if not (isinstance(previous, (Filter, Rename)) or (isinstance(previous, Apply) and previous.column_local())):
+                break
+            position -= 1
+        # filters right at that point already see the fewest rows, project after them
+        while position < index and isinstance(result[position], Filter):
+            position += 1
+        if position == index:
+            index -= 1
+            continue
+        required = _required_columns(result, position, index, node.columns)
+        previous = result[position - 1] if position > 0 else None
+        if isinstance(previous, Project):
+            if set(required) <= set(previous.columns) and len(required) < len(previous.columns):
+                result[position - 1] = Project([column for column in previous.columns if column in required])
+        else:
+            result.insert(position, Project(required))
+        index = position - 1
+    return result
+
+
+def absorb_into_scan(scan: Scan, nodes: List[PlanNode]) -> Tuple[Scan, List[PlanNode]]:
+    """
+    Push the leading projections and filters into the source when it supports them.
+
+    Absorbed filters are dropped from the plan. Sources evaluate predicates
+    on columns they do not return, so the scan only reads the columns of the
+    last leading projection; that projection is kept since sources return
+    columns in their own order.
+    """
+    source = scan.source
+    columns, predicate = scan.columns, scan.predicate
+    projection = None
+    consumed = 0
+    for node in nodes:
+        if isinstance(node, Filter) and hasattr(source, 'with_predicate'):
+            predicate = node.predicate if predicate is None else predicate & node.predicate
+        elif isinstance(node, Project) and _named(node.columns) and hasattr(source, 'with_columns'):
+            projection = node
+        else:
+            break
+        consumed += 1
+    remaining = list(nodes[consumed:])
+    if projection is not None:
+        columns = list(projection.columns)
+        remaining.insert(0, projection)
+    return Scan(source, columns, predicate), remaining
+
+
+OPTIMIZATION_RULES = [eliminate_noop_renames, push_filters, merge_projections, push_projections, merge_projections]
+
+
+def _estimate_scan(source: Any) -> Optional[Tuple[float, Dict[Any, float]]]:
+    """Estimate (rows, bytes per row of each column) of a source from a small sample."""
+    sample_rows = 1000
+    try:
+        if source.__class__.__name__ == 'CSVSource' and source.file_path is not None and source.url is None:
+            options = source._read_csv_options()
+            options.pop('usecols', None)
+            sample = pd.read_csv(source.file_path, nrows=sample_rows, **options)
+            with open(source.file_path, 'rb') as file:
+                lines = [file.readline() for _ in range(sample_rows + 1)]
+            body = [line for line in lines[1:] if line]
+            line_bytes = sum(len(line) for line in body) / max(len(body), 1)
+            rows = (os.path.getsize(source.file_path) - len(lines[0])) / max(line_bytes, 1)
+        elif source.__class__.__name__ == 'SQLiteSource':
+            import sqlite3
+            from contextlib import closing
+
+            with closing(sqlite3.connect(source.connection_string)) as conn:
+                rows = conn.execute(f"SELECT COUNT(*) FROM ({source.query})").fetchone()[0]
+                sample = pd.read_sql_query(f"SELECT * FROM ({source.query}) LIMIT {sample_rows}", conn)
+        elif hasattr(source, 'iter_batches'):
+            sample = next(iter(source.iter_batches(batch_size=sample_rows)), pd.DataFrame())
+            workbook = source._open()
+            try:
+                sheet = workbook[source.sheet_name] if source.sheet_name is not None else workbook.active
+                rows = max((sheet.max_row or len(sample)) - 1, len(sample))
+            finally:
+                workbook.close()
+        else:
+            return None
+    except Exception:
+        # estimates are best effort and must never break explain()
+        return None
+    per_row = sample.memory_usage(index=False, deep=True) / max(len(sample), 1)
+    return float(rows), {column: float(per_row[column]) for column in sample.columns}
+
+
+def _format_bytes(n: float) -> str:
+    for unit in ('B', 'KiB', 'MiB', 'GiB'):
+        if n < 1024 or unit == 'GiB':
+            return f"{n:.0f} {unit}" if unit == 'B' else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} GiB"
+
+
+class LazyPipeline:
+    """
+    A source and pipeline stages recorded as a logical plan and optimized before running.
+
+    Nothing is read until collect(). Before that the plan is rewritten:
+    filters move ahead of row-local transforms that do not change the
+    columns they read, unused columns are dropped right after the scan (or
+    after the last stage that needs them), adjacent projections are merged,
+    no-op renames are removed, and the leading projection and filters are
+    pushed into the source where it supports them.
+
+    Filters are only reordered past transforms that declare, via
+    Transform.row_local() and Transform.modified_columns(), that doing so
+    cannot change the result. Unfitted transforms are never passed. Rows
+    filtered inside a SQLite source come back with a fresh index.
+
+    Example:
+        >>> lazy = LazyPipeline(CSVSource('sales.csv'), fill, RenameColumns({'amt': 'amount'}),
+        ...                     FilterRows(col('region') == 'EU'), SelectColumns(['amount', 'region']))
+        >>> print(lazy.explain())
+        >>> result = lazy.collect()
+    """
+
+    def __init__(self, source: Any, *stages: Callable, selectivity: float = DEFAULT_SELECTIVITY):
+        self.source = source
+        self.stages = list(_iter_stages(stages))
+        self.selectivity = selectivity
+
+    def then(self, *stages: Callable) -> 'LazyPipeline':
+        """Return a new LazyPipeline with stages appended."""
+        return LazyPipeline(self.source, *self.stages, *stages, selectivity=self.selectivity)
+
+    def logical_plan(self) -> List[PlanNode]:
+        """The plan as recorded, before optimization."""
+        return [Scan(self.source)] + [_to_node(stage) for stage in self.stages]
+
+    def optimized_plan(self) -> List[PlanNode]:
+        """The plan after the optimization rules and scan pushdown."""
+        scan, *nodes = self.logical_plan()
+        for rule in OPTIMIZATION_RULES:
+            nodes = rule(nodes)
+        scan, nodes = absorb_into_scan(scan, nodes)
+        return [scan] + nodes
+
+    def collect(self) -> Any:
+        """Optimize the plan, then read the source and run it."""
+        scan, *nodes = self.optimized_plan()
+        data = scan.execute()
+        for node in nodes:
+            data = node.execute(data)
+        return data
+
+    def _estimates(self, plan: List[PlanNode]) -> List[Optional[Tuple[float, float]]]:
+        scan = plan[0]
+        estimate = _estimate_scan(scan.source)
+        if estimate is None:
+            return [None] * len(plan)
+        rows, widths = estimate
+        if scan.columns is not None:
+            widths = {column: width for column, width in widths.items() if column in scan.columns}
+        if scan.predicate is not None:
+            rows *= self.selectivity
+        estimates = [(rows, rows * sum(widths.values()))]
+        for node in plan[1:]:
+            if isinstance(node, Filter):
+                rows *= self.selectivity
+            elif isinstance(node, Project):
+                widths = {column: widths.get(column, 8.0) for column in node.columns}
+            elif isinstance(node, Rename):
+                widths = {node.mapping.get(column, column): width for column, width in widths.items()}
+            estimates.append((rows, rows * sum(widths.values())))
+        return estimates
+
+    def explain(self, optimized: bool = True) -> str:
+        """
+        Describe the (optimized) plan with estimated rows and bytes after each step.
+
+        Estimates come from a sample of the source; filters are assumed to
+        keep a fraction selectivity of their input rows.
+        """
+        plan = self.optimized_plan() if optimized else self.logical_plan()
+        lines = [f"{'step':<60}{'rows':>14}{'bytes':>14}"]
+        for node, estimate in zip(plan, self._estimates(plan)):
+            description = node.describe()
+            if len(description) > 58:
+                description = description[:55] + '...'
+            if estimate is None:
+                lines.append(f"{description:<60}{'?':>14}{'?':>14}")
+            else:
+                rows, nbytes = estimate
+                lines.append(f"{description:<60}{f'~{rows:,.0f}':>14}{f'~{_format_bytes(nbytes)}':>14}")
+        return "\n".join(lines)
+
+    def __repr__(self):
+        return f"LazyPipeline({self.source.__class__.__name__}, {len(self.stages)} stages)"
@@ -0,0 +1,168 @@
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .pipeline import Pipeline
+from .transforms import Transform, FillNA, FusedAffine, TransformComposer
+from .types import Function
+
+# This file contains optimization passes that rewrite pipelines of fitted
+# transforms into cheaper equivalent ones.
+
+
+def _layout(param) -> Optional[tuple]:
+    """Layout key of a per-column parameter; scalars fit any layout."""
+    if isinstance(param, pd.Series):
+        return ('columns', tuple(param.index))
+    if isinstance(param, np.ndarray) and param.ndim > 0:
+        return ('array', param.shape)
+    return None
+
+
+def _fusion_params(transform) -> Optional[tuple]:
+    """Return ('fill', value) or ('affine', (scale, offset)) for fusable transforms."""
+    if isinstance(transform, FillNA):
+        if transform.method in ('forward', 'backward') or transform.fill_values_ is None:
+            return None
+        return 'fill', transform.fill_values_
+    if not isinstance(transform, Transform):
+        return None
+    params = transform.affine_params()
+    return None if params is None else ('affine', params)
+
+
+def _as_values(param, columns: Optional[pd.Index]):
+    if isinstance(param, pd.Series):
+        return param.reindex(columns).to_numpy(dtype=np.float64)
+    return np.asarray(param, dtype=np.float64)
+
+
+def _build_fused(group: List[tuple], copy: bool) -> FusedAffine:
+    """Compose the (transform, kind, params) entries of a group into one FusedAffine."""
+    scale, offset, fill = 1.0, 0.0, None
+    layouts = set()
+    for transform, kind, params in group:
+        if kind == 'fill':
+            fill = params
+            layouts.add(_layout(params))
+            continue
+        step_scale, step_offset = params
+        layouts.update((_layout(step_scale), _layout(step_offset)))
+        scale = scale * step_scale
+        offset = offset * step_scale + step_offset
+        if fill is not None:
+            # NaNs are filled before this step, so the fill value goes through it too
+            fill = fill * step_scale + step_offset
+    layouts.discard(None)
+    layout = next(iter(layouts), None)
+    columns = pd.Index(layout[1]) if layout is not None and layout[0] == 'columns' else None
+    return FusedAffine(
+        [transform for transform, _, _ in group],
+        _as_values(scale, columns),
+        _as_values(offset, columns),
+        None if fill is None else _as_values(fill, columns),
+        columns=columns,
+        copy=copy,
+    )
+
+
+def _compatible(group: List[tuple], kind: str, params) -> bool:
+    if kind == 'fill' and any(entry[1] == 'fill' for entry in group):
+        return False
+    values = [params] if kind == 'fill' else list(params)
+    for _, group_kind, group_params in group:
+        values.extend([group_params] if group_kind == 'fill' else group_params)
+    layouts = {_layout(value) for value in values}
+    layouts.discard(None)
+    return len(layouts) <= 1
+
+
+def _kernel_cost(transform) -> Tuple[int, int]:
+    return getattr(transform, '_kernel_cost', None) or (0, 0)
+
+
+def _fuse_stages(stages: List[Any], unwrap, copy: bool, report: Dict[str, int]) -> List[Any]:
+    fused_stages = []
+    group: List[tuple] = []
+    group_stages: List[Any] = []
+
+    def flush():
+        if len(group) >= 2:
+            fused = _build_fused(group, copy)
+            passes, temporaries = _kernel_cost(fused)
+            if fused.fill_ is not None:
+                passes, temporaries = passes + 2, temporaries + 1
+            if not copy:
+                temporaries -= 1
+            before = [_kernel_cost(transform) for transform, _, _ in group]
+            report['groups'] += 1
+            report['stages_fused'] += len(group)
+            report['passes_eliminated'] += sum(cost[0] for cost in before) - passes
+            report['temporaries_eliminated'] += sum(cost[1] for cost in before) - temporaries
+            fused_stages.append(fused)
+        else:
+            fused_stages.extend(group_stages)
+        group.clear()
+        group_stages.clear()
+
+    for stage in stages:
+        transform = unwrap(stage)
+        if isinstance(transform, TransformComposer):
+            flush()
+            fused_stages.append(_fuse_composer(transform, copy, report))
+            continue
+        fusion = _fusion_params(transform)
+        if fusion is None:
+            flush()
+            fused_stages.append(stage)
+            continue
+        if not _compatible(group, *fusion):
+            flush()
+        group.append((transform, *fusion))
+        group_stages.append(stage)
+    flush()
+    return fused_stages
+
+
+def _fuse_composer(composer: TransformComposer, copy: bool, report: Dict[str, int]) -> TransformComposer:
+    fused = TransformComposer(*_fuse_stages(composer.transforms, lambda stage: stage, copy, report))
+    fused.fitted = composer.fitted
+    return fused
+
+
+def fuse_affine(
+    pipeline: Union[Pipeline, TransformComposer],
+    copy: bool = True
+) -> Tuple[Union[Pipeline, TransformComposer], Dict[str, int]]:
+    """
+    Collapse chains of fitted per-column affine transforms into single kernels.
+
+    Consecutive StandardScaler/MinMaxScaler stages (plus at most one FillNA
+    per chain) fitted on the same layout are replaced by a FusedAffine that
+    applies one scale and offset in a single pass.
+
+    Args:
+        pipeline: Pipeline or TransformComposer to optimize. It is not modified.
+        copy: If False, fused kernels overwrite float64 ndarray inputs in place
+
+    Returns:
+        (optimized pipeline, report) where report counts the fused groups and
+        stages and the passes over the data and full-size temporaries saved
+        per call on ndarray input.
+
+    Example:
+        >>> fast, report = fuse_affine(TransformComposer(FillNA(method='mean'), StandardScaler(), MinMaxScaler()).fit(data))
+        >>> report['passes_eliminated']
+    """
+    report = {'groups': 0, 'stages_fused': 0, 'passes_eliminated': 0, 'temporaries_eliminated': 0}
+    if isinstance(pipeline, TransformComposer):
+        return _fuse_composer(pipeline, copy, report), report
+    if isinstance(pipeline, Pipeline):
+        def unwrap(stage):
+            return stage.func if isinstance(stage, Function) else stage
+        stages = _fuse_stages(pipeline.functions, unwrap, copy, report)
+        fused = Pipeline(*stages)
+        fused.hooks = pipeline.hooks
+        return fused, report
+    raise TypeError("fuse_affine expects a Pipeline or TransformComposer")
@@ -1,5 +1,15 @@
-from typing import Callable, Optional, List
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, Iterator, Optional, List
+import hashlib
+import inspect
+import pickle
+import sys
+import threading
+import types
+
 from .types import Function
+from .profiling import StageHook, run_instrumented
+from .transforms import Transform, TransformComposer, _run_transforms
 
 import numpy as np
 import pandas as pd
@@ -22,6 +32,21 @@ import pandas as pd
 
 # Funtion class has been moved to types.py
 
+def _iter_stages(functions):
+    """Yield the underlying callables of pipeline stages, unwrapping Function and composers."""
+    for function in functions:
+        func = function.func if isinstance(function, Function) else function
+        if isinstance(func, list):
+            yield from _iter_stages(func)
+        elif hasattr(func, 'transforms'):
+            # TransformComposer
+            yield from _iter_stages(func.transforms)
+        elif isinstance(func, Pipeline):
+            yield from _iter_stages(func.functions)
+        else:
+            yield func
+
+
 # This file contains the core pipeline class and the pipeline builder class
 class Pipeline:
     """
@@ -33,6 +58,7 @@ class Pipeline:
             raise ValueError("No functions provided at all")
         # Convert all functions to Function instances
         self.functions = [f if isinstance(f, Function) else Function(f) for f in functions]
+        self.hooks = ()
 
     def __call__(self, data: Optional[np.ndarray | pd.DataFrame]):
         if data is None:
@@ -42,11 +68,100 @@ class Pipeline:
         if isinstance(data, list):
             data = np.array(data)
             
-        result = data
-        for function in self.functions:
-            result = function(result)
-        return result
+        if self.hooks:
+            return run_instrumented(self.functions, data, self.hooks)
+        # unwrapped so consecutive NA-handling transforms can share a missing-value mask
+        stages = [function.func if isinstance(function, Function) and not isinstance(function.func, list)
+                  else function for function in self.functions]
+        return _run_transforms(stages, data, lambda stage, value: stage(value))
+
+    def instrument(self, *hooks: StageHook) -> 'Pipeline':
+        """
+        Attach stage hooks (e.g. a Profiler) to the pipeline.
+
+        Call without arguments to detach all hooks again. Without hooks the
+        pipeline runs its plain, uninstrumented loop.
+        """
+        self.hooks = tuple(hooks)
+        return self
+
+
+    def stream(self, chunks: Iterable[np.ndarray | pd.DataFrame]) -> Iterator[np.ndarray | pd.DataFrame]:
+        """
+        Push each chunk through all stages and yield the results one by one.
+
+        Peak memory depends on the chunk size rather than on the size of the
+        whole dataset. Stages whose output depends on state learned from the
+        full data (e.g. an unfitted StandardScaler) are reported before any
+        chunk is consumed.
+
+        Args:
+            chunks: Iterable of ndarray/DataFrame chunks
+
+        Returns:
+            Generator yielding one transformed result per chunk
+
+        Raises:
+            ValueError: If a stage cannot run chunk-wise
+        """
+        self._check_fitted("stream through")
+        return self._stream(chunks)
+
+    def _check_fitted(self, action: str):
+        """Raise if a stage's output depends on state it has not learned yet."""
+        unfitted = [repr(stage) for stage in _iter_stages(self.functions)
+                    if callable(getattr(stage, 'needs_fit', None))
+                    and stage.needs_fit() and not getattr(stage, 'fitted', False)]
+        if unfitted:
+            raise ValueError(
+                f"Cannot {action} stages that must be fitted on the full data first: "
+                + ", ".join(unfitted)
+            )
+
+    def _stream(self, chunks):
+        for chunk in chunks:
+            yield self(chunk)
+
+    def map_batches(self, data: np.ndarray | pd.DataFrame, n_workers: Optional[int] = None,
+                    batch_size: int = 100_000) -> Any:
+        """
+        Run the pipeline over row batches of data in a process pool.
+
+        The stages (with their fitted state) are pickled once and sent to
+        each worker when it starts. Numeric ndarrays travel through
+        multiprocessing.shared_memory: the input is copied once into a
+        shared block the workers slice their batches from, and each batch
+        result comes back in a block the worker creates. DataFrames and
+        object arrays are pickled. Stages must be picklable (no lambdas),
+        and like stream() every stage must be stateless or already fitted.
+
+        Args:
+            data: ndarray or DataFrame, split into batches along the rows
+            n_workers: Number of worker processes (defaults to the CPU count)
+            batch_size: Rows per batch
+
+        Returns:
+            The batch results concatenated in row order (a list if they
+            are neither all arrays nor all DataFrames/Series)
+
+        Raises:
+            ValueError: If a stage must be fitted first
+        """
+        from .batches import map_batches
 
+        self._check_fitted("map batches through")
+        return map_batches(self, data, n_workers=n_workers, batch_size=batch_size)
+
+    def lazy(self, source) -> 'LazyPipeline':
+        """
+        Bind the stages to a data source as a LazyPipeline.
+
+        Nothing runs until collect(); the logical plan is optimized first
+        and can be inspected with explain().
+        """
+        from .lazy import LazyPipeline
+
+        return LazyPipeline(source, *self.functions)
 
     def __repr__(self):
         format_string = f"{self.__class__.__name__}("
@@ -57,6 +172,127 @@ class Pipeline:
 
 
 
+def _signature(data) -> tuple:
+    """Container type, dtype and shape of a stage input/output."""
+    return type(data), getattr(data, 'dtype', None), getattr(data, 'shape', None)
+
+
+def _accepts_out(func: Callable) -> bool:
+    """Whether func can write its result into a preallocated `out` array."""
+    if isinstance(func, np.ufunc):
+        return func.nin == 1 and func.nout == 1
+    try:
+        return 'out' in inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+class StageSpec:
+    """
+    Container type, dtype and shape a compiled stage produced for the traced input.
+    """
+    __slots__ = ('name', 'container', 'dtype', 'shape', 'buffered')
+
+    def __init__(self, name: str, output, buffered: bool = False):
+        self.name = name
+        self.container, self.dtype, self.shape = _signature(output)
+        self.buffered = buffered
+
+    def __repr__(self):
+        buffer = ", reuses buffer" if self.buffered else ""
+        return f"{self.name} -> {self.container.__name__}[{self.dtype}, {self.shape}]{buffer}"
+
+
+class CompiledPipeline(Pipeline):
+    """
+    Pipeline that traces its stages on a sample input and then runs an
+    execution plan for inputs with the same container type, dtype and shape.
+
+    The plan calls the underlying callables directly, skips the per-call
+    input checks and, for intermediate ndarray stages that accept an `out`
+    argument (e.g. numpy ufuncs), writes into buffers preallocated at compile
+    time. Inputs with a different signature take the regular path and
+    retrace the plan. Buffers are reused between calls, so a compiled
+    pipeline must not be called concurrently from several threads.
+    """
+    def __init__(self, *functions: Optional[Callable | list[Callable]]):
+        super().__init__(*functions)
+        self.plan = None
+        self._input_signature = None
+        self._steps = None
+
+    def compile(self, sample: np.ndarray | pd.DataFrame) -> 'CompiledPipeline':
+        """Trace the pipeline on sample and build the execution plan."""
+        self._trace(sample)
+        return self
+
+    def _trace(self, data):
+        if data is None:
+            raise ValueError("Data cannot be None")
+        if isinstance(data, dict):
+            raise TypeError("Data cannot be a dictionary")
+        if isinstance(data, list):
+            data = np.array(data)
+
+        input_signature = _signature(data)
+        calls = []
+        for function in self.functions:
+            func = function.func if not isinstance(function.func, list) else function
+            # Bind Transform.transform directly instead of going through __call__
+            calls.append(func.transform if isinstance(func, (Transform, TransformComposer)) else func)
+
+        plan, steps = [], []
+        result = data
+        # Buffers are only planned while every value so far is an ndarray,
+        # whose dtype and shape are then fixed by the input signature.
+        all_arrays = isinstance(data, np.ndarray)
+        for index, (function, call) in enumerate(zip(self.functions, calls)):
+            is_last = index == len(calls) - 1
+            result = call(result)
+            all_arrays = all_arrays and isinstance(result, np.ndarray)
+            buffer = None
+            if not is_last and all_arrays and not result.dtype.hasobject and _accepts_out(call):
+                buffer = np.empty_like(result)
+            plan.append(StageSpec(function.__name__, result, buffered=buffer is not None))
+            steps.append((call, buffer))
+
+        self.plan = plan
+        self._steps = steps
+        self._input_signature = input_signature
+        return result
+
+    def __call__(self, data: Optional[np.ndarray | pd.DataFrame]):
+        if self.hooks:
+            return super().__call__(data)
+        if isinstance(data, list):
+            data = np.array(data)
+        if self._steps is None or _signature(data) != self._input_signature:
+            return self._trace(data)
+
+        result = data
+        for call, buffer in self._steps:
+            # Stages after a row filter may see a different shape than traced
+            if buffer is not None and result.shape == buffer.shape:
+                result = call(result, out=buffer)
+            else:
+                result = call(result)
+        # The last stage may return a buffer (or a view of one, e.g. a column
+        # selection), which the next call would overwrite
+        if isinstance(result, np.ndarray) and any(
+                buffer is not None and np.shares_memory(result, buffer) for _, buffer in self._steps):
+            result = result.copy()
+        return result
+
+    def __repr__(self):
+        if self.plan is None:
+            return super().__repr__()
+        format_string = f"{self.__class__.__name__}("
+        for spec in self.plan:
+            format_string += f"\n    {spec}"
+        format_string += "\n)"
+        return format_string
+
+
 class Make_Pipeline:
     """
     Used For building Pipelines.
@@ -79,9 +315,15 @@ class Make_Pipeline:
         self.functions.append(function)
         return self
 
-    def build(self) -> Pipeline:
+    def build(self, compile: bool = False, sample: Optional[np.ndarray | pd.DataFrame] = None) -> Pipeline:
         """
         Build and return the pipeline with added functions
+
+        Args:
+            compile: Return a CompiledPipeline that runs a precompiled
+                execution plan for same-shaped inputs
+            sample: Sample input to compile the plan with. Without a sample
+                the plan is compiled on the first call.
         """
         # Flatten the list of functions if any were added as lists
         flattened_functions = []
@@ -92,19 +334,242 @@ class Make_Pipeline:
                 flattened_functions.append(func) 
                 
         # Create and return new pipeline with flattened functions
-        self.pipeline = Pipeline(*flattened_functions)
+        if compile:
+            self.pipeline = CompiledPipeline(*flattened_functions)
+            if sample is not None:
+                self.pipeline.compile(sample)
+        else:
+            self.pipeline = Pipeline(*flattened_functions)
         return self.pipeline
 
     def __repr__(self):
         return f"PipelineBuilder({self.functions})"
 
 
+# Buffers up to this size are always hashed in full by SpeedUp.
+_FULL_HASH_LIMIT = 1 << 20
+# Number and size of the evenly spaced blocks hashed for larger buffers.
+_SAMPLE_BLOCKS = 64
+_SAMPLE_BLOCK_BYTES = 4096
+
+
+def _hash_buffer(hasher, arr: np.ndarray, full_hash: bool) -> None:
+    """Feed an ndarray's bytes (or an evenly spaced sample of them) to hasher."""
+    hasher.update(f"{arr.dtype.str}|{arr.shape}".encode())
+    if arr.dtype.hasobject:
+        # Object arrays have no stable byte representation, hash their values.
+        _hash_value(hasher, pd.util.hash_array(arr.ravel()), full_hash)
+        return
+    buf = np.ascontiguousarray(arr).reshape(-1).view(np.uint8)
+    if full_hash or buf.nbytes <= _FULL_HASH_LIMIT:
+        hasher.update(memoryview(buf))
+        return
+    starts = np.linspace(0, buf.nbytes - _SAMPLE_BLOCK_BYTES, _SAMPLE_BLOCKS).astype(np.int64)
+    for start in starts:
+        hasher.update(memoryview(buf[start:start + _SAMPLE_BLOCK_BYTES]))
+
+
+def _hash_value(hasher, value: Any, full_hash: bool) -> None:
+    """Feed a content fingerprint of value to hasher."""
+    if isinstance(value, np.ndarray):
+        hasher.update(b"nd")
+        _hash_buffer(hasher, value, full_hash)
+    elif isinstance(value, pd.DataFrame):
+        hasher.update(b"df")
+        _hash_value(hasher, value.index, full_hash)
+        _hash_value(hasher, list(value.columns), full_hash)
+        for _, column in value.items():
+            _hash_value(hasher, column, full_hash)
+    elif isinstance(value, (pd.Series, pd.Index)):
+        hasher.update(f"{type(value).__name__}|{value.dtype}|{getattr(value, 'name', None)!r}".encode())
+        if isinstance(value, pd.RangeIndex):
+            hasher.update(f"{value.start}:{value.stop}:{value.step}".encode())
+            return
+        values = value.to_numpy()
+        if values.dtype.hasobject:
+            values = pd.util.hash_array(values)
+        _hash_buffer(hasher, values, full_hash)
+    elif isinstance(value, (list, tuple)):
+        hasher.update(f"{type(value).__name__}{len(value)}".encode())
+        for item in value:
+            _hash_value(hasher, item, full_hash)
+    elif isinstance(value, dict):
+        hasher.update(f"dict{len(value)}".encode())
+        for key in sorted(value, key=repr):
+            _hash_value(hasher, key, full_hash)
+            _hash_value(hasher, value[key], full_hash)
+    else:
+        # Raises for unpicklable values, which SpeedUp treats as uncacheable.
+        hasher.update(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def fingerprint(*args, full_hash: bool = False, **kwargs) -> str:
+    """
+    Compute a content fingerprint of the given arguments.
+
+    Buffers larger than 1 MiB are sampled in evenly spaced blocks unless
+    full_hash is set, so two large inputs that only differ outside the
+    sampled blocks share a fingerprint.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    _hash_value(hasher, args, full_hash)
+    _hash_value(hasher, kwargs, full_hash)
+    return hasher.hexdigest()
+
+
+def _nbytes(value: Any) -> int:
+    """Estimate the memory held by a cached result."""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        usage = value.memory_usage(index=True, deep=False)
+        return int(usage.sum()) if isinstance(usage, pd.Series) else int(usage)
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(_nbytes(item) for item in value)
+    return sys.getsizeof(value)
+
+
+def _fitted_state(func: Callable) -> list:
+    """
+    Attributes of the transforms inside func. fit() and partial_fit() update
+    them in place, so they are part of the cache key of a wrapped pipeline.
+    """
+    state = []
+    for stage in _iter_stages([func]):
+        if isinstance(stage, Transform):
+            # plain functions (e.g. a FilterRows condition) are identified by object, not pickled
+            state.append((type(stage).__name__,
+                          {name: id(value) if isinstance(value, types.FunctionType) else value
+                           for name, value in vars(stage).items() if name != 'hooks'}))
+    return state
+
+
 class SpeedUp:
     """
     ⚠️ Experimental
 
     Decorator to speed up function execution by caching results.
     Also a function wrapper for the pipeline.
+
+    Results are stored under a content fingerprint of the call arguments
+    (plus the fitted state of any transforms in the wrapped pipeline) and
+    evicted in least-recently-used order once max_bytes is exceeded.
+
+    Example:
+        >>> @SpeedUp(max_bytes=64 * 2**20)
+        ... def heavy(data):
+        ...     return data ** 2
+        >>> fast_pipeline = SpeedUp(Pipeline(FillNA(value=0), scaler))
+        >>> fast_pipeline.cache_info()
     """
 
-    pass
+    def __init__(
+        self,
+        func: Optional[Callable] = None,
+        max_bytes: int = 256 * 2**20,
+        max_entries: Optional[int] = None,
+        full_hash: bool = False,
+        copy: bool = True,
+    ):
+        """
+        Args:
+            func: Function or pipeline to wrap. Omit to use as a decorator factory.
+            max_bytes: Total size budget of the cached results
+            max_entries: Optional cap on the number of cached results
+            full_hash: Hash large buffers in full instead of sampling them
+            copy: Return copies of cached arrays/DataFrames, so callers mutating
+                a result cannot corrupt the cache. Only disable this for callers
+                that treat results as read-only.
+        """
+        if func is not None and not callable(func):
+            raise TypeError("Function must be callable")
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.func = func
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.full_hash = full_hash
+        self.copy = copy
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.current_bytes = 0
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        if func is not None:
+            self.__name__ = getattr(func, '__name__', func.__class__.__name__)
+            self.__doc__ = getattr(func, '__doc__', None)
+            self.__wrapped__ = func
+
+    def __call__(self, *args, **kwargs):
+        if self.func is None:
+            # Used as @SpeedUp(...): bind the decorated function.
+            if len(args) != 1 or kwargs or not callable(args[0]):
+                raise TypeError("SpeedUp(...) must be applied to a single callable")
+            return SpeedUp(args[0], max_bytes=self.max_bytes, max_entries=self.max_entries,
+                           full_hash=self.full_hash, copy=self.copy)
+
+        try:
+            key = fingerprint(_fitted_state(self.func), args, full_hash=self.full_hash, **kwargs)
+        except Exception:
+            # Arguments we cannot fingerprint are passed straight through.
+            with self._lock:
+                self.misses += 1
+            return self.func(*args, **kwargs)
+
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return self._output(entry[0])
+            self.misses += 1
+
+        result = self.func(*args, **kwargs)
+        self._store(key, result)
+        return self._output(result)
+
+    def _output(self, result):
+        if self.copy and isinstance(result, (np.ndarray, pd.DataFrame, pd.Series)):
+            return result.copy()
+        return result
+
+    def _store(self, key: str, result) -> None:
+        size = _nbytes(result)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._cache:
+                return
+            self._cache[key] = (result, size)
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes or (
+                self.max_entries is not None and len(self._cache) > self.max_entries
+            ):
+                _, (_, evicted_size) = self._cache.popitem(last=False)
+                self.current_bytes -= evicted_size
+                self.evictions += 1
+
+    def cache_info(self) -> dict:
+        """Return hit/miss/eviction counters and the current cache footprint."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'entries': len(self._cache),
+                'current_bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+            }
+
+    def cache_clear(self) -> None:
+        """Drop all cached results and reset the counters."""
+        with self._lock:
+            self._cache.clear()
+            self.current_bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def __repr__(self):
+        return f"SpeedUp({getattr(self, '__name__', None)}, entries={len(self._cache)}, bytes={self.current_bytes})"
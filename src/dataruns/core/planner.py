@@ -0,0 +1,99 @@
+from typing import Any, List, Optional, Tuple, Union
+
+from .expr import Predicate
+from .pipeline import Pipeline, _iter_stages
+from .transforms import FilterRows, SelectColumns, TransformComposer
+
+# This file contains the planner that links a data source to the pipeline
+# consuming it, so work the pipeline would throw away is never done by the source.
+
+
+def pushdown(pipeline: Union[Pipeline, TransformComposer], source: Any) -> Tuple[Optional[List[str]], Optional[Predicate]]:
+    """
+    Work out what the leading stages of pipeline let source do instead.
+
+    Leading SelectColumns and FilterRows(Predicate) stages are collected
+    until the first stage source cannot absorb. Only the first SelectColumns
+    is taken, and a filter reading columns that selection dropped ends the
+    scan. The stages themselves still run after the scan, so the pushed
+    columns include those the collected predicates read.
+
+    Returns:
+        (columns, predicate) to push into source, either may be None
+    """
+    columns, predicate = None, None
+    for stage in _iter_stages([pipeline]):
+        if (isinstance(stage, SelectColumns) and columns is None and hasattr(source, 'with_columns')
+                and all(isinstance(column, str) for column in stage.columns)):
+            columns = list(stage.columns)
+        elif isinstance(stage, FilterRows) and stage.predicate is not None and hasattr(source, 'with_predicate'):
+            if columns is not None and not stage.predicate.columns() <= set(columns):
+                break
+            predicate = stage.predicate if predicate is None else predicate & stage.predicate
+        else:
+            break
+    if columns is not None and predicate is not None:
+        columns += [column for column in sorted(predicate.columns(), key=str) if column not in columns]
+    return columns, predicate
+
+
+class SourcePlan:
+    """
+    A data source bound to the Pipeline or TransformComposer that consumes it.
+
+    If the pipeline starts with SelectColumns, the selection is pushed into
+    the source with its with_columns method: CSV sources only parse those
+    columns, SQLite sources only SELECT them and Excel sources only read
+    the cell range spanning them. Leading FilterRows stages with a Predicate
+    are pushed with with_predicate: SQLite sources get a parameterized
+    WHERE clause and CSV sources filter every chunk while parsing. The
+    stages themselves are kept, so the result is the same, only cheaper.
+
+    Example:
+        >>> plan = SourcePlan(CSVSource('wide.csv'), Pipeline(SelectColumns(['a', 'b']), FilterRows(col('a') > 0)))
+        >>> print(plan.explain())
+        >>> result = plan.run()
+    """
+
+    def __init__(self, source: Any, pipeline: Union[Pipeline, TransformComposer]):
+        self.source = source
+        self.pipeline = pipeline
+        self.columns, self.predicate = pushdown(pipeline, source)
+        scan = source
+        if self.columns is not None:
+            scan = scan.with_columns(self.columns)
+        if self.predicate is not None:
+            scan = scan.with_predicate(self.predicate)
+        self.scan = scan
+
+    @property
+    def pushed_down(self) -> bool:
+        """Whether a column selection or predicate was pushed into the source."""
+        return self.scan is not self.source
+
+    def run(self) -> Any:
+        """Extract the (projected) source and run the pipeline on it."""
+        data = self.scan.extract_data()
+        if isinstance(self.pipeline, TransformComposer) and not self.pipeline.fitted:
+            return self.pipeline.fit_transform(data)
+        return self.pipeline(data)
+
+    def explain(self) -> str:
+        """Describe the scan and what was pushed into it."""
+        lines = [f"Scan {self.source.__class__.__name__}"]
+        if self.columns is not None:
+            lines.append(f"  projection pushed down: {self.columns}")
+        else:
+            lines.append("  reads all columns")
+        if self.predicate is not None:
+            lines.append(f"  predicate pushed down: {self.predicate!r}")
+        lines.append(f"Run {self.pipeline!r}")
+        return "\n".join(lines)
+
+    def __repr__(self):
+        return f"SourcePlan({self.source.__class__.__name__}, pushed_down={self.pushed_down})"
+
+
+def plan(source: Any, pipeline: Union[Pipeline, TransformComposer]) -> SourcePlan:
+    """Bind source to pipeline, pushing leading column selections and filters into the source."""
+    return SourcePlan(source, pipeline)
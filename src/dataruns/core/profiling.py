@@ -0,0 +1,168 @@
+from typing import Any, Callable, Dict, List, Optional, Sequence
+import time
+import tracemalloc
+
+# This file contains the opt-in instrumentation used by Pipeline and TransformComposer.
+# Nothing in here runs unless hooks are attached with `instrument(...)`.
+
+
+class StageRecord:
+    """
+    Measurements for a single execution of a pipeline stage.
+    """
+    __slots__ = ('index', 'name', 'wall_time', 'cpu_time', 'input_shape', 'output_shape',
+                 'input_bytes', 'output_bytes', 'peak_bytes')
+
+    def __init__(self, index: int, name: str, wall_time: float, cpu_time: float,
+                 input_shape, output_shape, input_bytes: Optional[int],
+                 output_bytes: Optional[int], peak_bytes: Optional[int] = None):
+        self.index = index
+        self.name = name
+        self.wall_time = wall_time
+        self.cpu_time = cpu_time
+        self.input_shape = input_shape
+        self.output_shape = output_shape
+        self.input_bytes = input_bytes
+        self.output_bytes = output_bytes
+        self.peak_bytes = peak_bytes
+
+    def __repr__(self):
+        return (f"StageRecord({self.index}: {self.name}, wall={self.wall_time:.6f}s, "
+                f"cpu={self.cpu_time:.6f}s, {self.input_shape} -> {self.output_shape})")
+
+
+class StageHook:
+    """
+    Base class for stage hooks. Override the callbacks you need.
+
+    Set trace_memory to True on a hook to have peak allocations measured
+    with tracemalloc (this slows execution down noticeably).
+    """
+    trace_memory = False
+
+    def on_stage_start(self, index: int, name: str, data: Any) -> None:
+        """Called before a stage runs with the stage's input."""
+        pass
+
+    def on_stage_end(self, record: StageRecord) -> None:
+        """Called after a stage has run with its measurements."""
+        pass
+
+
+class Profiler(StageHook):
+    """
+    Stage hook collecting a StageRecord for every stage execution.
+
+    Example:
+        >>> profiler = Profiler(trace_memory=True)
+        >>> pipeline.instrument(profiler)
+        >>> pipeline(data)
+        >>> print(profiler.report())
+        >>> pipeline.instrument()  # detach again
+    """
+
+    def __init__(self, trace_memory: bool = False):
+        self.trace_memory = trace_memory
+        self.records: List[StageRecord] = []
+
+    def on_stage_end(self, record: StageRecord) -> None:
+        self.records.append(record)
+
+    def reset(self) -> None:
+        """Forget all collected records."""
+        self.records = []
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Aggregate the records per stage, in pipeline order."""
+        stages: Dict[tuple, Dict[str, Any]] = {}
+        for record in self.records:
+            entry = stages.setdefault((record.index, record.name), {
+                'stage': record.name, 'calls': 0, 'wall_time': 0.0, 'cpu_time': 0.0,
+                'input_bytes': 0, 'output_bytes': 0, 'peak_bytes': None,
+                'output_shape': None,
+            })
+            entry['calls'] += 1
+            entry['wall_time'] += record.wall_time
+            entry['cpu_time'] += record.cpu_time
+            entry['input_bytes'] += record.input_bytes or 0
+            entry['output_bytes'] += record.output_bytes or 0
+            entry['output_shape'] = record.output_shape
+            if record.peak_bytes is not None:
+                entry['peak_bytes'] = max(entry['peak_bytes'] or 0, record.peak_bytes)
+        return [stages[key] for key in sorted(stages)]
+
+    def report(self) -> str:
+        """Format the summary as a table, slowest stage first."""
+        rows = sorted(self.summary(), key=lambda entry: entry['wall_time'], reverse=True)
+        total = sum(entry['wall_time'] for entry in rows) or 1.0
+        lines = [f"{'stage':<24}{'calls':>7}{'wall [s]':>12}{'cpu [s]':>12}{'share':>8}"
+                 f"{'in [B]':>14}{'out [B]':>14}{'peak [B]':>14}"]
+        for entry in rows:
+            peak = '-' if entry['peak_bytes'] is None else entry['peak_bytes']
+            lines.append(
+                f"{entry['stage'][:23]:<24}{entry['calls']:>7}{entry['wall_time']:>12.6f}"
+                f"{entry['cpu_time']:>12.6f}{entry['wall_time'] / total:>8.1%}"
+                f"{entry['input_bytes']:>14}{entry['output_bytes']:>14}{peak:>14}"
+            )
+        return "\n".join(lines)
+
+    def __repr__(self):
+        return f"Profiler({len(self.records)} records, trace_memory={self.trace_memory})"
+
+
+def _describe(data: Any) -> tuple:
+    """Return (shape, nbytes) of stage input/output, or None for unknown types."""
+    shape = getattr(data, 'shape', None)
+    nbytes = getattr(data, 'nbytes', None)
+    if nbytes is None and hasattr(data, 'memory_usage'):
+        usage = data.memory_usage(deep=False)
+        nbytes = int(usage.sum()) if hasattr(usage, 'sum') else int(usage)
+    return shape, nbytes
+
+
+def stage_name(stage: Callable) -> str:
+    """Readable name of a pipeline stage."""
+    return getattr(stage, 'name', None) or getattr(stage, '__name__', None) or stage.__class__.__name__
+
+
+def run_instrumented(stages: Sequence[Callable], data: Any, hooks: Sequence[StageHook],
+                     call: Callable[[Callable, Any], Any] = None) -> Any:
+    """
+    Run data through stages, reporting every stage to hooks.
+
+    Args:
+        stages: Callables to run in order
+        data: Input of the first stage
+        hooks: StageHook instances to notify
+        call: How to apply a stage to data, defaults to stage(data)
+    """
+    trace_memory = any(getattr(hook, 'trace_memory', False) for hook in hooks)
+    started_tracing = trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    try:
+        for index, stage in enumerate(stages):
+            name = stage_name(stage)
+            for hook in hooks:
+                hook.on_stage_start(index, name, data)
+            input_shape, input_bytes = _describe(data)
+            if trace_memory:
+                tracemalloc.reset_peak()
+                baseline = tracemalloc.get_traced_memory()[0]
+            wall_start = time.perf_counter()
+            cpu_start = time.process_time()
+
+            data = call(stage, data) if call is not None else stage(data)
+
+            cpu_time = time.process_time() - cpu_start
+            wall_time = time.perf_counter() - wall_start
+            peak_bytes = tracemalloc.get_traced_memory()[1] - baseline if trace_memory else None
+            output_shape, output_bytes = _describe(data)
+            record = StageRecord(index, name, wall_time, cpu_time, input_shape, output_shape,
+                                 input_bytes, output_bytes, peak_bytes)
+            for hook in hooks:
+                hook.on_stage_end(record)
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+    return data
@@ -1,21 +1,248 @@
+import hashlib
+import os
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, Union, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Set, Union, Callable
 
 import numpy as np
 import pandas as pd
 
+from .expr import Predicate
+from .profiling import StageHook, run_instrumented
+
 
 # This file contains the core transform class and the pipeline builder class
 # This class is used to represent a transform in the pipeline.
 
+def _chunk_moments(data: Union[np.ndarray, pd.DataFrame], skipna: bool, with_m2: bool = True) -> tuple:
+    """
+    Compute per-column count, mean and sum of squared deviations (M2) of a chunk.
+    
+    NaN values are ignored when skipna is set, matching pandas reductions;
+    otherwise they propagate like the plain numpy reductions.
+    """
+    values = data.to_numpy(dtype=np.float64) if isinstance(data, pd.DataFrame) else np.asarray(data, dtype=np.float64)
+    if skipna:
+        valid = ~np.isnan(values)
+        count = valid.sum(axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(valid, values, 0.0).sum(axis=0) / count
+        m2 = np.where(valid, (values - mean) ** 2, 0.0).sum(axis=0) if with_m2 else None
+    else:
+        mean = values.mean(axis=0)
+        count = np.full(np.shape(mean), values.shape[0], dtype=np.int64)
+        m2 = ((values - mean) ** 2).sum(axis=0) if with_m2 else None
+    return count, mean, m2
+
+
+def _merge_moments(a: tuple, b: tuple) -> tuple:
+    """Combine two (count, mean, M2) states with Chan's parallel update."""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    count_a, mean_a, m2_a = a
+    count_b, mean_b, m2_b = b
+    count = count_a + count_b
+    with np.errstate(invalid='ignore', divide='ignore'):
+        delta = mean_b - mean_a
+        mean = mean_a + delta * (count_b / count)
+        m2 = None if m2_a is None or m2_b is None else m2_a + m2_b + delta ** 2 * (count_a * count_b / count)
+    # Columns that are empty on one side take the other side's state as is.
+    mean = np.where(count_a == 0, mean_b, np.where(count_b == 0, mean_a, mean))
+    if m2 is not None:
+        m2 = np.where(count_a == 0, m2_b, np.where(count_b == 0, m2_a, m2))
+    return count, mean, m2
+
+
+def _block_moments(transform: 'Transform', data: Union[np.ndarray, pd.DataFrame], skipna: bool,
+                   with_m2: bool = True) -> tuple:
+    """_chunk_moments computed on column blocks in transform's thread pool."""
+    values = data.to_numpy(dtype=np.float64) if isinstance(data, pd.DataFrame) else np.asarray(data, dtype=np.float64)
+    if values.ndim != 2:
+        return _chunk_moments(values, skipna, with_m2)
+    parts = transform._map_blocks(lambda block: _chunk_moments(values[:, block], skipna, with_m2), values.shape[1])
+    return tuple(None if parts[0][i] is None else np.concatenate([part[i] for part in parts]) for i in range(3))
+
+
+def _n_columns(values: np.ndarray) -> int:
+    return values.shape[1] if values.ndim == 2 else 1
+
+
+def _columns_block(values: np.ndarray, block: slice) -> np.ndarray:
+    """A block of columns of a 2D array; a 1D array is a single column."""
+    return values[:, block] if values.ndim == 2 else values
+
+
+def _param_block(param: Any, block: slice) -> np.ndarray:
+    """The part of a per-column parameter matching a column block; scalars apply to every block."""
+    param = np.asarray(param)
+    return param[block] if param.ndim == 1 else param
+
+
+def _check_layout(transform: 'Transform', columns: Optional[pd.Index]) -> Optional[pd.Index]:
+    """Check that new data (or a merged state) shares the layout of the data fitted so far."""
+    if transform._state is not None:
+        seen = transform._columns
+        if (seen is None) != (columns is None) or (columns is not None and not seen.equals(columns)):
+            raise ValueError(
+                f"{transform.name} was partially fitted on data with a different layout; "
+                "all chunks must share the same container type and columns"
+            )
+    return columns
+
+
+def _columns_of(data: Union[np.ndarray, pd.DataFrame]) -> Optional[pd.Index]:
+    return data.columns if isinstance(data, pd.DataFrame) else None
+
+
+def _as_output(values: np.ndarray, columns: Optional[pd.Index]):
+    """Wrap per-column statistics as a Series when fitted on DataFrames."""
+    if columns is not None:
+        return pd.Series(values, index=columns)
+    return values
+
+
+def _sorted_columns(values: np.ndarray, mask: Optional[np.ndarray] = None) -> tuple:
+    """
+    Sort every column (NaNs last) and count its non-missing values.
+    
+    The sorted columns are returned as the rows of a C-contiguous array, so
+    each one is sorted and scanned without strided memory access.
+    """
+    values = np.asarray(values)
+    if mask is None:
+        mask = np.isnan(values)
+    ordered = np.ascontiguousarray(values.T)
+    ordered.sort(axis=1)
+    return ordered, values.shape[0] - np.count_nonzero(mask, axis=0)
+
+
+def _column_medians(values: np.ndarray, mask: Optional[np.ndarray] = None) -> np.ndarray:
+    """Column-wise nanmedian of a 2D array from a single sort."""
+    ordered, counts = _sorted_columns(values, mask)
+    if ordered.shape[1] == 0:
+        return np.full(ordered.shape[0], np.nan)
+    cols = np.arange(ordered.shape[0])
+    low = ordered[cols, np.maximum(counts - 1, 0) // 2]
+    high = ordered[cols, np.minimum(counts // 2, ordered.shape[1] - 1)]
+    return np.where(counts > 0, (low + high) / 2, np.nan)
+
+
+def _column_modes(values: np.ndarray, mask: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Column-wise mode of a 2D array, ignoring NaN; ties go to the smallest
+    value and all-missing columns get 0.
+    
+    Each column is sorted once and split into runs of equal values; the
+    mode is the first of its longest runs.
+    """
+    ordered, counts = _sorted_columns(values, mask)
+    n_cols, n_rows = ordered.shape
+    if n_rows == 0 or n_cols == 0:
+        return np.zeros(n_cols, dtype=ordered.dtype)
+    flat = ordered.ravel()
+    change = np.empty(flat.shape, dtype=bool)
+    change[0] = True
+    np.not_equal(flat[1:], flat[:-1], out=change[1:])
+    change[::n_rows] = True
+    starts = np.flatnonzero(change)
+    lengths = np.diff(starts, append=flat.size)
+    lengths[np.isnan(flat[starts])] = 0
+    run_col = starts // n_rows
+    longest = np.maximum.reduceat(lengths, np.searchsorted(run_col, np.arange(n_cols)))
+    best = np.flatnonzero(lengths == longest[run_col])
+    best = best[np.r_[True, run_col[best][1:] != run_col[best][:-1]]]
+    return np.where(counts > 0, flat[starts[best]], 0)
+
+class MissingMask:
+    """
+    np.isnan of the array passed between consecutive NA-handling stages.
+    
+    TransformComposer and Pipeline create one per call and hand it to the
+    stages that accept mask= (DropNA, FillNA, FusedAffine). A stage reads
+    the mask of its input with of() and records the mask of its output with
+    update(), so a DropNA -> FillNA -> DropNA chain calls np.isnan once. The
+    mask belongs to one array object and is cleared after every stage that
+    does not maintain it, so it never outlives a change it was not told about.
+    """
+    
+    def __init__(self):
+        self.array = None
+        self.values = None
+        # number of times np.isnan actually ran
+        self.computed = 0
+    
+    def of(self, array: np.ndarray) -> np.ndarray:
+        """Mask of array, computed unless it was recorded for this very array."""
+        if self.array is not array:
+            self.update(array, np.isnan(array))
+            self.computed += 1
+        return self.values
+    
+    def known(self, array: np.ndarray) -> bool:
+        """Whether the mask of array is recorded."""
+        return self.array is array
+    
+    def update(self, array: np.ndarray, values: np.ndarray) -> None:
+        """Record values as the mask of array."""
+        self.array = array
+        self.values = values
+    
+    def clear(self) -> None:
+        self.array = None
+        self.values = None
+
+
+def _run_transforms(stages: List[Any], data: Any, call: Callable[[Any, Any], Any],
+                    mask: Optional[MissingMask] = None) -> Any:
+    """
+    Run stages in order with call(stage, data), sharing one MissingMask
+    between the consecutive stages that accept mask=.
+    """
+    if mask is None and sum(getattr(stage, '_accepts_mask', False) for stage in stages) > 1:
+        mask = MissingMask()
+    result = data
+    for stage in stages:
+        if mask is not None and getattr(stage, '_accepts_mask', False):
+            result = stage.transform(result, mask=mask)
+        else:
+            result = call(stage, result)
+            if mask is not None:
+                mask.clear()
+    return result
+
+
 class Transform(ABC):
     """
     Abstract base class for all transforms in the dataruns library.
     All transforms must implement the transform method.
+    
+    Buffer ownership for the numpy paths of the built-in transforms:
+    - by default (copy=True) transform() never modifies its input and
+      returns a newly allocated array;
+    - with copy=False the caller hands over ownership of the input, and a
+      writeable input of the result dtype is overwritten and returned;
+    - transform(data, out=...) writes the result into out and returns it,
+      regardless of copy. out must have the input's shape and the result dtype.
+    DataFrame inputs are never modified in place.
+    
+    Transforms that work column by column (the scalers, FillNA and
+    OneHotEncoder) accept n_jobs: columns are split into that many
+    contiguous blocks, fitted and transformed in a thread pool (numpy
+    releases the GIL in its kernels) and put back together in column order,
+    so results do not depend on thread scheduling. n_jobs=None or -1 uses
+    every core.
     """
+    # (passes over the data, full-size temporaries) of transform(), if known
+    _kernel_cost = None
+    # whether transform() accepts and maintains mask= (a MissingMask)
+    _accepts_mask = False
     
-    def __init__(self, name: Optional[str] = None):
+    def __init__(self, name: Optional[str] = None, copy: bool = True, n_jobs: Optional[int] = 1):
         self.name = name or self.__class__.__name__
+        self.copy = copy
+        self.n_jobs = n_jobs
         self.fitted = False
         self.metadata = {}
     
@@ -45,6 +272,78 @@ class Transform(ABC):
         self.fitted = True
         return self
     
+    def needs_fit(self) -> bool:
+        """
+        Whether transform() depends on state learned by fit().
+        
+        Transforms that need fitting cannot be applied chunk by chunk
+        until they have been fitted on the full data.
+        """
+        return False
+    
+    def affine_params(self) -> Optional[tuple]:
+        """
+        Return (scale, offset) if transform(x) equals x * scale + offset per
+        column, otherwise None. Used by fuse_affine to collapse chains of
+        affine transforms into a single kernel.
+        """
+        return None
+    
+    def row_local(self) -> bool:
+        """
+        Whether each output row depends only on the matching input row (or
+        the transform only drops rows), so the transform commutes with row
+        filters that do not read the columns it changes.
+        """
+        return False
+    
+    def column_local(self) -> bool:
+        """
+        Whether each DataFrame output column depends only on the input column
+        with the same label, so the transform can run on any subset of columns.
+        """
+        return False
+    
+    def modified_columns(self) -> Optional[Set[Any]]:
+        """
+        Labels of the DataFrame columns transform() changes, adds or removes,
+        or None if unknown (or every column). Used by the lazy planner to
+        decide which filters may run before the transform.
+        """
+        return None
+    
+    def _column_blocks(self, n_columns: int) -> List[slice]:
+        """Split n_columns into contiguous blocks, one per worker thread."""
+        n_jobs = self.n_jobs
+        if n_jobs is None or n_jobs < 0:
+            n_jobs = os.cpu_count() or 1
+        bounds = np.linspace(0, n_columns, max(1, min(n_jobs, n_columns)) + 1).astype(int)
+        return [slice(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])]
+    
+    def _map_blocks(self, func: Callable[[slice], Any], n_columns: int) -> List[Any]:
+        """Return [func(block) for each column block], run in threads when n_jobs > 1."""
+        blocks = self._column_blocks(n_columns)
+        if len(blocks) == 1:
+            return [func(blocks[0])]
+        with ThreadPoolExecutor(max_workers=len(blocks)) as pool:
+            return list(pool.map(func, blocks))
+    
+    def _output_array(self, data: np.ndarray, out: Optional[np.ndarray] = None,
+                      dtype: Optional[np.dtype] = None) -> np.ndarray:
+        """
+        Return the array a numpy kernel should write its result into,
+        following the ownership rules described on the class.
+        """
+        dtype = np.dtype(dtype) if dtype is not None else np.result_type(data.dtype, np.float64)
+        if out is not None:
+            if out.shape != data.shape or out.dtype != dtype:
+                raise ValueError(f"{self.name}: out must have shape {data.shape} and dtype {dtype}, "
+                                 f"got {out.shape} and {out.dtype}")
+            return out
+        if not self.copy and data.dtype == dtype and data.flags.writeable:
+            return data
+        return np.empty(data.shape, dtype=dtype)
+    
     def fit_transform(self, data: Union[np.ndarray, pd.DataFrame]) -> Union[np.ndarray, pd.DataFrame]:
         """
         Fit the transform and then transform the data.
@@ -69,45 +368,119 @@ class StandardScaler(Transform):
     """
     Standardize features by removing the mean and scaling to unit variance.
     """
+    # (passes over the data, full-size temporaries) of transform() on arrays:
+    # copy, subtract, divide
+    _kernel_cost = (3, 3)
     
-    def __init__(self, with_mean: bool = True, with_std: bool = True):
-        super().__init__()
+    def __init__(self, with_mean: bool = True, with_std: bool = True, copy: bool = True,
+                 n_jobs: Optional[int] = 1):
+        super().__init__(copy=copy, n_jobs=n_jobs)
         self.with_mean = with_mean
         self.with_std = with_std
         self.mean_ = None
         self.std_ = None
+        self.n_samples_seen_ = None
+        self._state = None
+        self._columns = None
     
     def fit(self, data: Union[np.ndarray, pd.DataFrame]) -> 'StandardScaler':
         """Compute the mean and std to be used for later scaling."""
-        if isinstance(data, pd.DataFrame):
-            if self.with_mean:
-                self.mean_ = data.mean()
-            if self.with_std:
-                self.std_ = data.std()
-        else:
-            if self.with_mean:
-                self.mean_ = np.mean(data, axis=0)
-            if self.with_std:
-                self.std_ = np.std(data, axis=0)
+        self._state = None
+        return self.partial_fit(data)
+    
+    def partial_fit(self, data: Union[np.ndarray, pd.DataFrame]) -> 'StandardScaler':
+        """
+        Update the mean and std with a chunk of data.
         
-        self.fitted = True
+        Running moments are combined with Chan's parallel update, so fitting
+        chunk by chunk gives the same statistics as one fit on all the data.
+        """
+        columns = _check_layout(self, _columns_of(data))
+        chunk = _block_moments(self, data, skipna=columns is not None)
+        self._state = _merge_moments(self._state, chunk)
+        self._columns = columns
+        self._update_stats()
         return self
     
-    def transform(self, data: Union[np.ndarray, pd.DataFrame]) -> Union[np.ndarray, pd.DataFrame]:
+    def merge(self, other: 'StandardScaler') -> 'StandardScaler':
+        """Merge the state of a scaler fitted on another partition into this one."""
+        if other._state is None:
+            return self
+        _check_layout(self, other._columns)
+        self._state = _merge_moments(self._state, other._state)
+        self._columns = other._columns
+        self._update_stats()
+        return self
+    
+    def _update_stats(self):
+        count, mean, m2 = self._state
+        # pandas reports the sample std (ddof=1), numpy the population std (ddof=0)
+        ddof = 1 if self._columns is not None else 0
+        self.n_samples_seen_ = count
+        if self.with_mean:
+            self.mean_ = _as_output(mean, self._columns)
+        if self.with_std:
+            with np.errstate(invalid='ignore', divide='ignore'):
+                std = np.sqrt(m2 / (count - ddof))
+            self.std_ = _as_output(std, self._columns)
+        self.fitted = True
+    
+    def needs_fit(self) -> bool:
+        return True
+    
+    def row_local(self) -> bool:
+        return self.fitted
+    
+    def column_local(self) -> bool:
+        # DataFrames are aligned on the fitted columns by label; note that
+        # every other column comes out as NaN, so modified_columns() is None.
+        # Statistics fitted on arrays are positional.
+        return self.fitted and self._columns is not None
+    
+    def affine_params(self) -> Optional[tuple]:
+        if not self.fitted:
+            return None
+        scale, offset = 1.0, 0.0
+        if self.with_std and self.std_ is not None:
+            std_safe = self.std_.replace(0, 1) if isinstance(self.std_, pd.Series) else np.where(self.std_ == 0, 1, self.std_)
+            scale = 1.0 / std_safe
+        if self.with_mean and self.mean_ is not None:
+            offset = -self.mean_ * scale
+        return scale, offset
+    
+    def transform(self, data: Union[np.ndarray, pd.DataFrame],
+                  out: Optional[np.ndarray] = None) -> Union[np.ndarray, pd.DataFrame]:
         """Perform standardization by centering and scaling."""
         if not self.fitted:
             raise ValueError("StandardScaler must be fitted before transform")
         
-        result = data.copy() if isinstance(data, pd.DataFrame) else data.copy()
-        
-        if self.with_mean and self.mean_ is not None:
-            result = result - self.mean_
-        
-        if self.with_std and self.std_ is not None:
+        center = self.with_mean and self.mean_ is not None
+        scale = self.with_std and self.std_ is not None
+        if scale:
             # Avoid division by zero
             std_safe = self.std_.replace(0, 1) if isinstance(self.std_, pd.Series) else np.where(self.std_ == 0, 1, self.std_)
-            result = result / std_safe
         
+        if isinstance(data, pd.DataFrame):
+            result = data
+            if center:
+                result = result - self.mean_
+            if scale:
+                result = result / std_safe
+            return data.copy() if result is data else result
+        
+        data = np.asarray(data)
+        result = self._output_array(data, out)
+        
+        def kernel(block):
+            values, target = _columns_block(data, block), _columns_block(result, block)
+            if center:
+                np.subtract(values, _param_block(self.mean_, block), out=target)
+            elif target is not values:
+                np.copyto(target, values)
+            if scale:
+                np.divide(target, _param_block(std_safe, block), out=target)
+        
+        self._map_blocks(kernel, _n_columns(data))
         return result
 
 
@@ -115,22 +488,64 @@ class MinMaxScaler(Transform):
     """
     Scale features to a given range, typically [0, 1].
     """
+    # subtract, multiply, add
+    _kernel_cost = (3, 3)
     
-    def __init__(self, feature_range: tuple = (0, 1)):
-        super().__init__()
+    def __init__(self, feature_range: tuple = (0, 1), copy: bool = True, n_jobs: Optional[int] = 1):
+        super().__init__(copy=copy, n_jobs=n_jobs)
         self.feature_range = feature_range
         self.min_ = None
         self.max_ = None
         self.scale_ = None
+        self._state = None
+        self._columns = None
     
     def fit(self, data: Union[np.ndarray, pd.DataFrame]) -> 'MinMaxScaler':
         """Compute the minimum and maximum to be used for later scaling."""
-        if isinstance(data, pd.DataFrame):
-            self.min_ = data.min()
-            self.max_ = data.max()
+        self._state = None
+        return self.partial_fit(data)
+    
+    def partial_fit(self, data: Union[np.ndarray, pd.DataFrame]) -> 'MinMaxScaler':
+        """Update the running minimum and maximum with a chunk of data."""
+        columns = _check_layout(self, _columns_of(data))
+        if columns is not None:
+            values = data.to_numpy(dtype=np.float64)
+            # pandas skips NaN, so an all-NaN chunk column stays NaN
+            reduce_min, reduce_max = np.fmin.reduce, np.fmax.reduce
         else:
-            self.min_ = np.min(data, axis=0)
-            self.max_ = np.max(data, axis=0)
+            values = np.asarray(data)
+            reduce_min, reduce_max = np.min, np.max
+        
+        def extremes(block):
+            values_block = _columns_block(values, block)
+            with np.errstate(invalid='ignore'):
+                return reduce_min(values_block, axis=0), reduce_max(values_block, axis=0)
+        
+        parts = self._map_blocks(extremes, _n_columns(values))
+        if len(parts) == 1:
+            chunk = parts[0]
+        else:
+            chunk = (np.concatenate([part[0] for part in parts]), np.concatenate([part[1] for part in parts]))
+        self._merge_state(chunk, columns)
+        return self
+    
+    def merge(self, other: 'MinMaxScaler') -> 'MinMaxScaler':
+        """Merge the state of a scaler fitted on another partition into this one."""
+        if other._state is None:
+            return self
+        _check_layout(self, other._columns)
+        self._merge_state(other._state, other._columns)
+        return self
+    
+    def _merge_state(self, chunk: tuple, columns: Optional[pd.Index]):
+        if self._state is None:
+            self._state = chunk
+        else:
+            combine_min, combine_max = (np.fmin, np.fmax) if columns is not None else (np.minimum, np.maximum)
+            self._state = (combine_min(self._state[0], chunk[0]), combine_max(self._state[1], chunk[1]))
+        self._columns = columns
+        self.min_ = _as_output(self._state[0], columns)
+        self.max_ = _as_output(self._state[1], columns)
         
         # Compute scale
         data_range = self.max_ - self.min_
@@ -142,14 +557,41 @@ class MinMaxScaler(Transform):
         
         self.scale_ = (self.feature_range[1] - self.feature_range[0]) / data_range
         self.fitted = True
-        return self
     
-    def transform(self, data: Union[np.ndarray, pd.DataFrame]) -> Union[np.ndarray, pd.DataFrame]:
+    def needs_fit(self) -> bool:
+        return True
+    
+    def row_local(self) -> bool:
+        return self.fitted
+    
+    def column_local(self) -> bool:
+        # only label-aligned statistics, see StandardScaler.column_local
+        return self.fitted and self._columns is not None
+    
+    def affine_params(self) -> Optional[tuple]:
+        if not self.fitted:
+            return None
+        return self.scale_, self.feature_range[0] - self.min_ * self.scale_
+    
+    def transform(self, data: Union[np.ndarray, pd.DataFrame],
+                  out: Optional[np.ndarray] = None) -> Union[np.ndarray, pd.DataFrame]:
         """Scale features to the specified range."""
         if not self.fitted:
             raise ValueError("MinMaxScaler must be fitted before transform")
         
-        result = (data - self.min_) * self.scale_ + self.feature_range[0]
+        if isinstance(data, pd.DataFrame):
+            return (data - self.min_) * self.scale_ + self.feature_range[0]
+        
+        data = np.asarray(data)
+        result = self._output_array(data, out)
+        
+        def kernel(block):
+            target = _columns_block(result, block)
+            np.subtract(_columns_block(data, block), _param_block(self.min_, block), out=target)
+            np.multiply(target, _param_block(self.scale_, block), out=target)
+            np.add(target, self.feature_range[0], out=target)
+        
+        self._map_blocks(kernel, _n_columns(data))
         return result
 
 
@@ -157,6 +599,7 @@ class DropNA(Transform):
     """
     Remove rows or columns with missing values.
     """
+    _accepts_mask = True
     
     def __init__(self, axis: int = 0, how: str = 'any', thresh: Optional[int] = None):
         super().__init__()
@@ -164,7 +607,15 @@ class DropNA(Transform):
         self.how = how  # 'any' or 'all'
         self.thresh = thresh
     
-    def transform(self, data: Union[np.ndarray, pd.DataFrame]) -> Union[np.ndarray, pd.DataFrame]:
+    def row_local(self) -> bool:
+        return self.axis == 0
+    
+    def modified_columns(self) -> Optional[Set[Any]]:
+        # dropping rows changes no values
+        return set() if self.axis == 0 else None
+    
+    def transform(self, data: Union[np.ndarray, pd.DataFrame],
+                  mask: Optional[MissingMask] = None) -> Union[np.ndarray, pd.DataFrame]:
         """Remove missing values."""
         if isinstance(data, pd.DataFrame):
             if self.thresh is not None:
@@ -173,73 +624,130 @@ class DropNA(Transform):
                 return data.dropna(axis=self.axis, how=self.how)
         else:
             # For numpy arrays, remove rows/columns with NaN
+            nan = mask.of(data) if mask is not None else np.isnan(data)
             if self.axis == 0:  # Remove rows
                 if self.thresh is not None:
                     # Keep rows with at least 'thresh' non-NaN values
-                    mask = np.sum(~np.isnan(data), axis=1) >= self.thresh
+                    keep = data.shape[1] - np.count_nonzero(nan, axis=1) >= self.thresh
                 elif self.how == 'any':
-                    mask = ~np.isnan(data).any(axis=1)
+                    keep = ~nan.any(axis=1)
                 else:  # 'all'
-                    mask = ~np.isnan(data).all(axis=1)
-                return data[mask]
+                    keep = ~nan.all(axis=1)
+                result = data[keep]
+                if mask is not None:
+                    mask.update(result, nan[keep])
             else:  # Remove columns
                 if self.thresh is not None:
                     # Keep columns with at least 'thresh' non-NaN values
-                    mask = np.sum(~np.isnan(data), axis=0) >= self.thresh
+                    keep = data.shape[0] - np.count_nonzero(nan, axis=0) >= self.thresh
                 elif self.how == 'any':
-                    mask = ~np.isnan(data).any(axis=0)
+                    keep = ~nan.any(axis=0)
                 else:  # 'all'
-                    mask = ~np.isnan(data).all(axis=0)
-                return data[:, mask]
+                    keep = ~nan.all(axis=0)
+                result = data[:, keep]
+                if mask is not None:
+                    mask.update(result, nan[:, keep])
+            return result
 
 
 class FillNA(Transform):
     """
     Fill missing values with a specified value or strategy.
     """
+    # copy, NaN mask, fill
+    _kernel_cost = (3, 2)
+    _accepts_mask = True
     
-    def __init__(self, value: Optional[Any] = None, method: Optional[str] = None):
-        super().__init__()
+    def __init__(self, value: Optional[Any] = None, method: Optional[str] = None, copy: bool = True,
+                 n_jobs: Optional[int] = 1):
+        super().__init__(copy=copy, n_jobs=n_jobs)
         self.value = value
         self.method = method  # 'mean', 'median', 'mode'
         self.fill_values_ = None
+        self._state = None
+        self._columns = None
     
     def fit(self, data: Union[np.ndarray, pd.DataFrame]) -> 'FillNA':
         """Compute fill values based on the method."""
         if self.value is not None:
             self.fill_values_ = self.value
         elif self.method == 'mean':
-            if isinstance(data, pd.DataFrame):
-                self.fill_values_ = data.mean()
-            else:
-                self.fill_values_ = np.nanmean(data, axis=0)
+            self._state = None
+            return self.partial_fit(data)
         elif self.method == 'median':
             if isinstance(data, pd.DataFrame):
-                self.fill_values_ = data.median()
+                self.fill_values_ = self._per_frame_block(lambda frame: frame.median(), data)
             else:
-                self.fill_values_ = np.nanmedian(data, axis=0)
+                self.fill_values_ = self._per_column(_column_medians, data)
         elif self.method == 'mode':
             if isinstance(data, pd.DataFrame):
-                self.fill_values_ = data.mode().iloc[0]
+                self.fill_values_ = self._per_frame_block(lambda frame: frame.mode().iloc[0], data)
             else:
-                
-                def mode_1d(arr):
-                    """Calculate mode for 1D array, ignoring NaN values."""
-                    arr_clean = arr[~np.isnan(arr)]
-                    if len(arr_clean) == 0:
-                        return 0
-                    values, counts = np.unique(arr_clean, return_counts=True)
-                    return values[np.argmax(counts)]
-                
-                if data.ndim == 1:
-                    self.fill_values_ = mode_1d(data)# Pure numpy mode calculation without scipy
-                else:
-                    self.fill_values_ = np.array([mode_1d(data[:, i]) for i in range(data.shape[1])])
+                self.fill_values_ = self._per_column(_column_modes, data)
         
         self.fitted = True
         return self
     
-    def transform(self, data: Union[np.ndarray, pd.DataFrame]) -> Union[np.ndarray, pd.DataFrame]:
+    def partial_fit(self, data: Union[np.ndarray, pd.DataFrame]) -> 'FillNA':
+        """
+        Update the fill values with a chunk of data.
+        
+        Only constant values and method='mean' can be fitted incrementally;
+        medians and modes need the full data.
+        """
+        if self.value is not None:
+            return self.fit(data)
+        if self.method != 'mean':
+            raise ValueError(f"FillNA.partial_fit does not support method={self.method!r}")
+        columns = _check_layout(self, _columns_of(data))
+        chunk = _block_moments(self, data, skipna=True, with_m2=False)
+        self._state = _merge_moments(self._state, chunk)
+        self._columns = columns
+        self.fill_values_ = _as_output(self._state[1], columns)
+        self.fitted = True
+        return self
+    
+    def merge(self, other: 'FillNA') -> 'FillNA':
+        """Merge the running means of a FillNA fitted on another partition into this one."""
+        if other._state is None:
+            return self
+        _check_layout(self, other._columns)
+        self._state = _merge_moments(self._state, other._state)
+        self._columns = other._columns
+        self.fill_values_ = _as_output(self._state[1], self._columns)
+        self.fitted = True
+        return self
+    
+    def _per_column(self, kernel: Callable[[np.ndarray, np.ndarray], np.ndarray], data: np.ndarray):
+        data = np.asarray(data)
+        mask = np.isnan(data)
+        if data.ndim == 1:
+            return kernel(data[:, None], mask[:, None])[0]
+        parts = self._map_blocks(lambda block: kernel(data[:, block], mask[:, block]), data.shape[1])
+        return np.concatenate(parts)
+    
+    def _per_frame_block(self, statistic: Callable[[pd.DataFrame], pd.Series], data: pd.DataFrame) -> pd.Series:
+        parts = self._map_blocks(lambda block: statistic(data.iloc[:, block]), data.shape[1])
+        return parts[0] if len(parts) == 1 else pd.concat(parts)
+    
+    def needs_fit(self) -> bool:
+        return self.value is None and self.method in ('mean', 'median', 'mode')
+    
+    def row_local(self) -> bool:
+        # forward/backward fill read neighbouring rows
+        return self.method not in ('forward', 'backward') and (self.fitted or not self.needs_fit())
+    
+    def column_local(self) -> bool:
+        # fill values fitted on arrays are positional
+        return self.row_local() and not isinstance(self.fill_values_, np.ndarray)
+    
+    def modified_columns(self) -> Optional[Set[Any]]:
+        if self.row_local() and isinstance(self.fill_values_, pd.Series):
+            return set(self.fill_values_.index)
+        return None
+    
+    def transform(self, data: Union[np.ndarray, pd.DataFrame], out: Optional[np.ndarray] = None,
+                  mask: Optional[MissingMask] = None) -> Union[np.ndarray, pd.DataFrame]:
         """Fill missing values."""
         if isinstance(data, pd.DataFrame):
             if self.method in ['forward', 'backward']:
@@ -248,14 +756,32 @@ class FillNA(Transform):
                 return data.fillna(self.fill_values_)
         else:
             # For numpy arrays
-            result = data.copy()
+            data = np.asarray(data)
+            if self.fill_values_ is None:
+                nan = mask.values if mask is not None and mask.known(data) else None
+            else:
+                nan = mask.of(data) if mask is not None else np.isnan(data)
+            result = self._output_array(data, out, dtype=data.dtype)
+            if result is not data:
+                np.copyto(result, data)
             if self.fill_values_ is not None:
-                mask = np.isnan(result)
-                if np.isscalar(self.fill_values_):
-                    result[mask] = self.fill_values_
+                fill = np.asarray(self.fill_values_, dtype=result.dtype)
+                
+                def kernel(block):
+                    target = _columns_block(result, block)
+                    fill_block = np.broadcast_to(_param_block(fill, block), target.shape)
+                    np.copyto(target, fill_block, where=_columns_block(nan, block))
+                
+                self._map_blocks(kernel, _n_columns(result))
+                if mask is not None:
+                    # only entries filled with NaN (e.g. all-missing columns) are still missing
+                    missing = np.isnan(fill)
+                    nan = nan & missing if missing.any() else np.broadcast_to(False, result.shape)
+            if mask is not None:
+                if nan is None:
+                    mask.clear()
                 else:
-                    for i, fill_val in enumerate(self.fill_values_):
-                        result[mask[:, i], i] = fill_val
+                    mask.update(result, nan)
             return result
 
 
@@ -298,11 +824,21 @@ class RenameColumns(Transform):
 class FilterRows(Transform):
     """
     Filter rows based on a condition.
+    
+    The condition is either a callable returning a boolean mask or a
+    declarative Predicate such as ``(col('price') > 10) & col('qty').notna()``.
+    Predicates are evaluated vectorized and can be pushed into sources by
+    the planner.
     """
     
-    def __init__(self, condition: Callable[[Union[np.ndarray, pd.DataFrame]], np.ndarray]):
+    def __init__(self, condition: Union[Predicate, Callable[[Union[np.ndarray, pd.DataFrame]], np.ndarray]]):
         super().__init__()
         self.condition = condition
+
+    @property
+    def predicate(self) -> Optional[Predicate]:
+        """The condition if it is a declarative Predicate, else None."""
+        return self.condition if isinstance(self.condition, Predicate) else None
     
     def transform(self, data: Union[np.ndarray, pd.DataFrame]) -> Union[np.ndarray, pd.DataFrame]:
         """Filter rows based on the condition."""
@@ -313,54 +849,365 @@ class FilterRows(Transform):
             return data[mask]
 
 
+def _sparse_index_type() -> Optional[type]:
+    """
+    The integer sparse index type of SparseArray, taken from the public
+    sp_index attribute and checked once, or None if this pandas version
+    does not build arrays from it the same way.
+    """
+    try:
+        index_type = type(pd.arrays.SparseArray(np.zeros(1, dtype=np.uint8), fill_value=0, kind='integer').sp_index)
+        probe = pd.arrays.SparseArray(np.ones(1, dtype=np.uint8), fill_value=0,
+                                      sparse_index=index_type(3, np.array([1], dtype=np.int32)))
+        return index_type if probe.to_numpy().tolist() == [0, 1, 0] else None
+    except Exception:
+        return None
+
+
+_SPARSE_INDEX = _sparse_index_type()
+
+
 class OneHotEncoder(Transform):
     """
     Encode categorical variables as one-hot vectors.
+    
+    Values are mapped to integer codes against the categories learned by
+    fit(), and all indicator columns are built in a single pass, so every
+    batch gets the same output columns. Missing values encode as all zeros.
+    
+    Args:
+        columns: Columns to encode, defaults to the object, string and category columns
+        drop_first: Drop the indicator of each column's first category
+        handle_unknown: 'ignore' encodes unseen categories as all zeros, 'error' raises ValueError
+        dtype: Indicator dtype, bool or a compact integer type such as np.uint8
+        sparse: Return the indicators as pandas sparse columns
     """
     
-    def __init__(self, columns: Optional[List[str]] = None, drop_first: bool = False):
-        super().__init__()
+    def __init__(self, columns: Optional[List[str]] = None, drop_first: bool = False,
+                 handle_unknown: str = 'ignore', dtype: Any = bool, sparse: bool = False,
+                 n_jobs: Optional[int] = 1):
+        super().__init__(n_jobs=n_jobs)
+        if handle_unknown not in ('ignore', 'error'):
+            raise ValueError("handle_unknown must be 'ignore' or 'error'")
         self.columns = columns
         self.drop_first = drop_first
+        self.handle_unknown = handle_unknown
+        self.dtype = np.dtype(dtype)
+        self.sparse = sparse
         self.categories_ = None
     
     def fit(self, data: Union[np.ndarray, pd.DataFrame]) -> 'OneHotEncoder':
         """Learn the categories for one-hot encoding."""
         if isinstance(data, pd.DataFrame):
-            cols = self.columns or data.select_dtypes(include=['object', 'category']).columns.tolist()
-            self.categories_ = {col: data[col].unique() for col in cols}
+            cols = self.columns or data.select_dtypes(include=['object', 'string', 'category']).columns.tolist()
+            parts = self._map_blocks(lambda block: [self._categories(data[col]) for col in cols[block]], len(cols))
+            self.categories_ = dict(zip(cols, [categories for part in parts for categories in part]))
         else:
             raise ValueError("OneHotEncoder requires DataFrame input")
         
         self.fitted = True
         return self
     
+    @staticmethod
+    def _categories(values: pd.Series) -> pd.Index:
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            # declared categories are part of the schema, even unused ones
+            return values.cat.categories
+        categories = pd.Index(values.dropna().unique())
+        try:
+            return categories.sort_values()
+        except TypeError:
+            # mixed types keep their order of appearance
+            return categories
+    
+    def needs_fit(self) -> bool:
+        return True
+    
+    def row_local(self) -> bool:
+        return self.fitted
+    
+    def modified_columns(self) -> Optional[Set[Any]]:
+        if not self.fitted:
+            return None
+        return set(self.categories_) | set(self.feature_names_out())
+    
+    def feature_names_out(self) -> List[str]:
+        """Names of the indicator columns transform() appends, in order."""
+        start = 1 if self.drop_first else 0
+        return [f"{col}_{category}" for col, categories in self.categories_.items()
+                for category in categories[start:]]
+    
+    def _codes(self, data: pd.DataFrame) -> List[np.ndarray]:
+        def encode(col, categories):
+            values = data[col]
+            col_codes = categories.get_indexer(values)
+            if self.handle_unknown == 'error':
+                unknown = (col_codes == -1) & values.notna().to_numpy()
+                if unknown.any():
+                    raise ValueError(f"Found unknown categories in column {col!r}: "
+                                     f"{list(pd.unique(values[unknown]))}")
+            return col_codes
+        
+        items = list(self.categories_.items())
+        parts = self._map_blocks(lambda block: [encode(*item) for item in items[block]], len(items))
+        return [col_codes for part in parts for col_codes in part]
+    
+    def _dense(self, codes: List[np.ndarray], n_rows: int, start: int) -> np.ndarray:
+        widths = [len(categories) - start for categories in self.categories_.values()]
+        offsets = np.concatenate([[0], np.cumsum(widths)[:-1]]).astype(np.intp)
+        indicators = np.zeros((n_rows, sum(widths)), dtype=self.dtype)
+        
+        def fill(block):
+            # each block of encoded columns owns a disjoint range of indicator columns
+            rows, cols = [], []
+            for col_codes, offset in zip(codes[block], offsets[block]):
+                hit = np.flatnonzero(col_codes >= start)
+                rows.append(hit)
+                cols.append(col_codes[hit].astype(np.intp) + (offset - start))
+            if rows:
+                indicators[np.concatenate(rows), np.concatenate(cols)] = 1
+        
+        self._map_blocks(fill, len(codes))
+        return indicators
+    
+    def _sparse(self, codes: List[np.ndarray], n_rows: int, start: int) -> List[pd.arrays.SparseArray]:
+        fill = self.dtype.type(0).item()
+        all_categories = list(self.categories_.values())
+        
+        def build(block):
+            arrays = []
+            # without a sparse index type, one dense indicator per thread is filled and reset per category
+            indicator = np.zeros(n_rows, dtype=self.dtype) if _SPARSE_INDEX is None else None
+            for col_codes, categories in zip(codes[block], all_categories[block]):
+                # rows grouped by code, each group in ascending row order
+                order = np.argsort(col_codes, kind='stable').astype(np.int32)
+                bounds = np.searchsorted(col_codes[order], np.arange(start, len(categories) + 1))
+                for lo, hi in zip(bounds[:-1], bounds[1:]):
+                    rows = order[lo:hi]
+                    if indicator is None:
+                        # built from the row positions alone, in O(nonzeros)
+                        arrays.append(pd.arrays.SparseArray(np.ones(hi - lo, dtype=self.dtype), fill_value=fill,
+                                                            sparse_index=_SPARSE_INDEX(n_rows, rows)))
+                    else:
+                        indicator[rows] = 1
+                        arrays.append(pd.arrays.SparseArray(indicator, fill_value=fill))
+                        indicator[rows] = 0
+            return arrays
+        
+        return [array for part in self._map_blocks(build, len(codes)) for array in part]
+    
     def transform(self, data: Union[np.ndarray, pd.DataFrame]) -> Union[np.ndarray, pd.DataFrame]:
         """Perform one-hot encoding."""
         if not self.fitted:
             raise ValueError("OneHotEncoder must be fitted before transform")
         
         if isinstance(data, pd.DataFrame):
-            result = data.copy()
-            for col, categories in self.categories_.items():
-                # Create dummy variables
-                dummies = pd.get_dummies(result[col], prefix=col, drop_first=self.drop_first)
-                # Drop original column and add dummies
-                result = result.drop(columns=[col])
-                result = pd.concat([result, dummies], axis=1)
-            return result
+            codes = self._codes(data)
+            start = 1 if self.drop_first else 0
+            names = self.feature_names_out()
+            if self.sparse:
+                arrays = self._sparse(codes, len(data), start)
+                indicators = pd.DataFrame(dict(zip(range(len(names)), arrays)), index=data.index)
+                indicators.columns = names
+            else:
+                indicators = pd.DataFrame(self._dense(codes, len(data), start), index=data.index, columns=names)
+            kept = data.drop(columns=list(self.categories_))
+            return pd.concat([kept, indicators], axis=1)
         else:
             raise ValueError("OneHotEncoder requires DataFrame input")
 
 
+class HashingEncoder(Transform):
+    """
+    Encode categorical variables with the hashing trick.
+    
+    Every value is hashed into one of n_features output columns, so memory
+    and output width stay fixed however many distinct values there are.
+    Nothing is learned by fit(), so the encoder can run on chunks and in
+    worker processes as is. The hash (pandas' SipHash, keyed by the column
+    name) is stable across runs and processes. Values are hashed by their
+    text, with integral numbers written as integers, so 1, 1.0 and '1' land
+    in the same bucket whether a chunk holds ints, floats (an int column
+    with missing values) or objects. Missing values encode as zeros.
+    
+    Args:
+        n_features: Number of output columns
+        columns: Columns to encode, defaults to the object, string and category columns
+        alternate_sign: Add +1 or -1 depending on the hash, so collisions tend to cancel out
+        prefix: Prefix of the output column names
+    """
+    
+    def __init__(self, n_features: int = 32, columns: Optional[List[str]] = None,
+                 alternate_sign: bool = False, prefix: str = 'hash'):
+        super().__init__()
+        if n_features < 1:
+            raise ValueError("n_features must be at least 1")
+        self.n_features = n_features
+        self.columns = columns
+        self.alternate_sign = alternate_sign
+        self.prefix = prefix
+    
+    def row_local(self) -> bool:
+        return True
+    
+    def modified_columns(self) -> Optional[Set[Any]]:
+        if self.columns is None:
+            return None
+        return set(self.columns) | set(self.feature_names_out())
+    
+    def feature_names_out(self) -> List[str]:
+        """Names of the columns transform() appends, in order."""
+        return [f"{self.prefix}_{i}" for i in range(self.n_features)]
+    
+    @staticmethod
+    def _hash_key(column: Any) -> str:
+        # pandas requires a 16 character key
+        return hashlib.blake2b(repr(column).encode(), digest_size=8).hexdigest()
+    
+    @staticmethod
+    def _integral_text(values: np.ndarray) -> np.ndarray:
+        """Text of a float array, with integral values written as integers."""
+        text = values.astype(str).astype(object)
+        integral = np.flatnonzero((values == np.trunc(values)) & (np.abs(values) < 2.0 ** 63))
+        text[integral] = values[integral].astype(np.int64).astype(str)
+        return text
+    
+    @classmethod
+    def _canonical(cls, values: np.ndarray) -> np.ndarray:
+        """Object array of the canonical text of non-missing values."""
+        if values.dtype.kind in 'iub':
+            return values.astype(str).astype(object)
+        if values.dtype.kind == 'f':
+            return cls._integral_text(values)
+        kind = pd.api.types.infer_dtype(values, skipna=False)
+        if kind == 'string':
+            return values
+        if kind == 'integer':
+            return values.astype(str).astype(object)
+        if kind in ('floating', 'mixed-integer-float'):
+            return cls._integral_text(values.astype(np.float64))
+        text = np.empty(len(values), dtype=object)
+        for i, value in enumerate(values):
+            if isinstance(value, (float, np.floating)):
+                text[i] = cls._integral_text(np.array([value], dtype=np.float64))[0]
+            elif isinstance(value, (bool, np.bool_, int, np.integer)):
+                text[i] = str(value)
+            else:
+                text[i] = value
+        return text
+    
+    def transform(self, data: Union[np.ndarray, pd.DataFrame]) -> Union[np.ndarray, pd.DataFrame]:
+        """Hash the categorical columns into n_features columns."""
+        if not isinstance(data, pd.DataFrame):
+            raise ValueError("HashingEncoder requires DataFrame input")
+        
+        cols = self.columns or data.select_dtypes(include=['object', 'string', 'category']).columns.tolist()
+        n_rows = len(data)
+        cells, weights = [], []
+        for col in cols:
+            values = data[col].to_numpy()
+            rows = np.flatnonzero(~np.asarray(pd.isna(values), dtype=bool))
+            hashes = pd.util.hash_array(self._canonical(values[rows]), hash_key=self._hash_key(col))
+            cells.append(rows * self.n_features + (hashes % np.uint64(self.n_features)).astype(np.intp))
+            if self.alternate_sign:
+                # the top bit is independent of the low bits picking the bucket
+                weights.append(np.where(hashes >> np.uint64(63), -1.0, 1.0))
+        
+        # one bincount accumulates every column, collisions included
+        if cells:
+            counts = np.bincount(np.concatenate(cells), weights=np.concatenate(weights) if weights else None,
+                                 minlength=n_rows * self.n_features)
+        else:
+            counts = np.zeros(n_rows * self.n_features, dtype=np.float64 if self.alternate_sign else np.int64)
+        encoded = pd.DataFrame(counts.reshape(n_rows, self.n_features), index=data.index,
+                               columns=self.feature_names_out())
+        return pd.concat([data.drop(columns=cols), encoded], axis=1)
+
+
+class FusedAffine(Transform):
+    """
+    A chain of fitted per-column affine transforms (and at most one FillNA)
+    collapsed into a single scale-and-offset kernel.
+    
+    Built by fuse_affine(); the original transforms are kept and used as a
+    fallback for inputs whose layout differs from the one they were fitted on.
+    """
+    # multiply, add (plus NaN mask and fill when a FillNA was fused)
+    _kernel_cost = (2, 1)
+    _accepts_mask = True
+    
+    def __init__(self, transforms: List[Transform], scale, offset, fill=None,
+                 columns: Optional[pd.Index] = None, copy: bool = True):
+        super().__init__(name=f"FusedAffine[{', '.join(t.name for t in transforms)}]", copy=copy)
+        self.transforms = list(transforms)
+        self.scale_ = scale
+        self.offset_ = offset
+        self.fill_ = fill
+        self.columns = columns
+        self.fitted = True
+    
+    def row_local(self) -> bool:
+        return True
+    
+    def column_local(self) -> bool:
+        # other layouts go through the original transforms
+        return all(transform.column_local() for transform in self.transforms)
+    
+    def _apply(self, values: np.ndarray, out: np.ndarray, mask: Optional[MissingMask] = None) -> np.ndarray:
+        nan = None
+        if self.fill_ is not None:
+            nan = mask.of(values) if mask is not None else np.isnan(values)
+        elif mask is not None and mask.known(values):
+            nan = mask.values
+        np.multiply(values, self.scale_, out=out)
+        np.add(out, self.offset_, out=out)
+        if self.fill_ is not None:
+            np.copyto(out, np.broadcast_to(self.fill_, out.shape), where=nan)
+        if mask is not None:
+            # a finite, nonzero scale and a finite offset map NaN to NaN and everything else to non-NaN
+            preserves = (np.all(np.isfinite(self.scale_)) and np.all(np.asarray(self.scale_) != 0)
+                         and np.all(np.isfinite(self.offset_)))
+            if nan is None or not preserves:
+                mask.clear()
+            else:
+                if self.fill_ is not None:
+                    missing = np.isnan(self.fill_)
+                    nan = nan & missing if np.any(missing) else np.broadcast_to(False, out.shape)
+                mask.update(out, nan)
+        return out
+    
+    def _fallback(self, data):
+        for transform in self.transforms:
+            data = transform.transform(data)
+        return data
+    
+    def transform(self, data: Union[np.ndarray, pd.DataFrame], out: Optional[np.ndarray] = None,
+                  mask: Optional[MissingMask] = None) -> Union[np.ndarray, pd.DataFrame]:
+        """Apply the fused scale and offset in a single pass."""
+        if isinstance(data, pd.DataFrame):
+            if self.columns is None or not data.columns.equals(self.columns):
+                return self._fallback(data)
+            values = data.to_numpy(dtype=np.float64, copy=True)
+            return pd.DataFrame(self._apply(values, values), index=data.index, columns=data.columns)
+        
+        if self.columns is not None:
+            if mask is not None:
+                mask.clear()
+            return self._fallback(data)
+        data = np.asarray(data)
+        return self._apply(data, self._output_array(data, out), mask)
+
+
 class TransformComposer:
     """
     Compose multiple transforms into a single pipeline-like object.
     """
+    _accepts_mask = True
     
     def __init__(self, *transforms: Transform):
         self.transforms = list(transforms)
         self.fitted = False
+        self.hooks = ()
     
     def add_transform(self, transform: Transform) -> 'TransformComposer':
         """Add a transform to the composer."""
@@ -378,12 +1225,44 @@ class TransformComposer:
         self.fitted = True
         return self
     
-    def transform(self, data: Union[np.ndarray, pd.DataFrame]) -> Union[np.ndarray, pd.DataFrame]:
-        """Apply all transforms in sequence."""
-        result = data
+    def partial_fit(self, data: Union[np.ndarray, pd.DataFrame]) -> 'TransformComposer':
+        """
+        Update all transforms in sequence with a chunk (or delta) of data.
+        
+        Transforms with a partial_fit method update their statistics from the
+        chunk alone; stateless or already fitted transforms are left as they
+        are. Each transform sees the chunk as transformed by the ones before it.
+        """
+        current_data = data
         for transform in self.transforms:
-            result = transform.transform(result)
-        return result
+            if hasattr(transform, 'partial_fit'):
+                transform.partial_fit(current_data)
+            elif transform.needs_fit() and not transform.fitted:
+                raise ValueError(f"{transform.name} cannot be fitted incrementally")
+            current_data = transform.transform(current_data)
+        
+        self.fitted = True
+        return self
+    
+    def transform(self, data: Union[np.ndarray, pd.DataFrame],
+                  mask: Optional[MissingMask] = None) -> Union[np.ndarray, pd.DataFrame]:
+        """
+        Apply all transforms in sequence.
+        
+        Consecutive NA-handling stages share one missing-value mask, pass
+        mask= to share it with stages outside the composer as well.
+        """
+        if self.hooks:
+            if mask is not None:
+                mask.clear()
+            return run_instrumented(self.transforms, data, self.hooks,
+                                    call=lambda transform, value: transform.transform(value))
+        return _run_transforms(self.transforms, data, lambda transform, value: transform.transform(value), mask)
+    
+    def instrument(self, *hooks: StageHook) -> 'TransformComposer':
+        """Attach stage hooks (e.g. a Profiler) to transform(); call without arguments to detach."""
+        self.hooks = tuple(hooks)
+        return self
     
     def fit_transform(self, data: Union[np.ndarray, pd.DataFrame]) -> Union[np.ndarray, pd.DataFrame]:
         """Fit all transforms and then transform the data."""
@@ -1,8 +1,5 @@
 from typing import Optional, Callable
 
-import numpy as np
-import pandas as pd
-
 
 # This class is used to wrap functions and provide a consistent interface.
 class Function:
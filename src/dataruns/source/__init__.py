@@ -19,25 +19,39 @@ Example Usage:
     >>> data = excel_source.extract_data()
     
     >>> # Load SQLite data
-    >>> db_source = SQLiteSource(db_path='database.db', table_name='my_table')
+    >>> db_source = SQLiteSource('database.db', table_name='my_table')
     >>> data = db_source.extract_data()
 """
 
 import logging
 import os
 
-# Configure logging for the source module
-def _setup_logging():
-    """Setup logging configuration for the source module."""
+# The source module only logs through its own logger. Nothing is configured
+# at import time; call setup_logging() to opt into the file logging setup.
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+def setup_logging(log_dir: str = 'logs'):
+    """
+    Setup logging configuration for the source module.
+    
+    Logs go to ``<log_dir>/dataruns_source.log``, falling back to console
+    logging if the directory or file cannot be created.
+    
+    Args:
+        log_dir (str): Directory to write the log file to
+        
+    Returns:
+        logging.Logger: The source module logger
+    """
     # Create logs directory if it doesn't exist
-    log_dir = 'logs'
     if not os.path.exists(log_dir):
         try:
             os.makedirs(log_dir)
         except OSError:
             # If we can't create logs directory, use a simpler logging setup
             logging.basicConfig(level=logging.INFO)
-            logger = logging.getLogger(__name__)
             logger.info("Dataruns source module initialized (console logging)")
             return logger
     
@@ -50,21 +64,20 @@ def _setup_logging():
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             filemode='a'
         )
-        logger = logging.getLogger(__name__)
         logger.info("Dataruns source module initialized successfully 📎")
         return logger
     except (OSError, PermissionError):
         # Fallback to console logging if file logging fails
         logging.basicConfig(level=logging.INFO)
-        logger = logging.getLogger(__name__)
         logger.info("Dataruns source module initialized (console logging fallback)")
         return logger
 
-# Setup logger
-logger = _setup_logging()
-
 # Import source classes
-from .datasource import CSVSource, XLSsource, SQLiteSource
+from .datasource import CSVSource, XLSsource, SQLiteSource, load_workbooks
+from .cache import ColumnarCache, resolve_cache
+from .concurrency import extract_many, extract_many_async, iter_completed_async
+from .http_cache import HTTPCache
+from .watermark import WatermarkStore
 
 # Try to import the base class if it exists
 try:
@@ -78,7 +91,10 @@ except ImportError:
 __all__ = [
     'CSVSource',
     'XLSsource', 
-    'SQLiteSource'
+    'SQLiteSource',
+    'HTTPCache',
+    'ColumnarCache',
+    'WatermarkStore'
 ]
 
 # Add base class if available
@@ -86,13 +102,15 @@ if _base_class_available:
     __all__.append('DataSource')
 
 # Module level convenience functions 🙂
-def load_data(file_path, source_type=None, **kwargs):
+def load_data(file_path, source_type=None, cache=None, **kwargs):
     """
     Automatically detect and load data from various sources.
     
     Args:
         file_path (str): Path to the data file
         source_type (str, optional): Force specific source type ('csv', 'excel', 'sqlite')
+        cache (bool or ColumnarCache, optional): Reuse a columnar on-disk copy of
+            the data while the file is unchanged. True uses the default cache directory.
         **kwargs: Additional arguments passed to the source class
         
     Returns:
@@ -105,6 +123,7 @@ def load_data(file_path, source_type=None, **kwargs):
         >>> data = load_data('data.csv')
         >>> data = load_data('data.xlsx')
         >>> data = load_data('database.db', table_name='users')
+        >>> data = load_data('data.csv', cache=True)  # memory-mapped on the next run
     """
     if source_type:
         source_type = source_type.lower()
@@ -126,13 +145,16 @@ def load_data(file_path, source_type=None, **kwargs):
     elif source_type == 'excel':
         source = XLSsource(file_path=file_path, **kwargs)
     elif source_type == 'sqlite':
-        if 'table_name' not in kwargs:
-            raise ValueError("table_name is required for SQLite sources")
-        source = SQLiteSource(db_path=file_path, **kwargs)
+        if 'table_name' not in kwargs and 'query' not in kwargs:
+            raise ValueError("table_name or query is required for SQLite sources")
+        source = SQLiteSource(connection_string=file_path, **kwargs)
     else:
         raise ValueError(f"Unsupported source type: {source_type}")
     
     logger.info(f"Loading data from {file_path} using {source_type} source")
+    cache = resolve_cache(cache)
+    if cache is not None:
+        return cache.extract(source)
     return source.extract_data()
 
 def list_supported_formats():
@@ -174,11 +196,11 @@ def get_source_info():
         'SQLiteSource': {
             'description': 'Extract data from SQLite databases',
             'supported_formats': ['.db', '.sqlite', '.sqlite3'],
-            'required_params': ['db_path', 'table_name']
+            'required_params': ['connection_string', 'table_name or query']
         }
     }
     return info
 
 # Add convenience functions to exports
-__all__.extend(['load_data', 'list_supported_formats', 'get_source_info', 'logger'])
+__all__.extend(['load_data', 'load_workbooks', 'extract_many', 'extract_many_async', 'iter_completed_async', 'list_supported_formats', 'get_source_info', 'logger', 'setup_logging'])
 
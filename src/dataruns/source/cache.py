@@ -0,0 +1,326 @@
+from contextlib import closing
+from typing import Any, Dict, Optional, Tuple, Union
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+
+import numpy as np
+import pandas as pd
+
+from .datasource import Datasource, SQLiteSource, _read_only_uri
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'dataruns', 'columnar')
+SCHEMA_VERSION = 2
+
+
+def _file_digest(path: str) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _source_path(source: Datasource) -> str:
+    """Local file backing source. URL sources are resolved through their download cache."""
+    if getattr(source, 'url', None) is not None:
+        return source._resolve_path()
+    path = getattr(source, 'file_path', None) or getattr(source, 'connection_string', None)
+    if path is None or not os.path.exists(path):
+        raise ValueError(f"{source.__class__.__name__} is not backed by a local file and cannot be cached")
+    return path
+
+
+def _file_record(path: str) -> Optional[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return None
+    stat = os.stat(path)
+    return {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'digest': _file_digest(path)}
+
+
+def _sqlite_record(source: Datasource, path: str) -> Optional[Dict[str, Any]]:
+    """
+    State of a SQLite database that the main file's stat does not cover.
+
+    In WAL mode committed transactions live in the ``-wal`` file until a
+    checkpoint copies them back, so the main file alone can look unchanged.
+    """
+    if not isinstance(source, SQLiteSource):
+        return None
+    with closing(sqlite3.connect(_read_only_uri(path), uri=True)) as conn:
+        schema_version = conn.execute("PRAGMA schema_version").fetchone()[0]
+    return {'schema_version': schema_version, 'wal': _file_record(path + '-wal')}
+
+
+def _encode(series: pd.Series) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    """
+    Split a column into plain numpy arrays plus the metadata needed to rebuild it.
+
+    Raises TypeError for columns that cannot be stored losslessly.
+    """
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        categories_meta, categories = _encode(pd.Series(dtype.categories))
+        arrays = {'codes': series.cat.codes.to_numpy()}
+        arrays.update({f'categories.{key}': value for key, value in categories.items()})
+        return {'kind': 'category', 'ordered': bool(dtype.ordered), 'categories': categories_meta}, arrays
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        return {'kind': 'datetimetz', 'tz': str(dtype.tz), 'unit': dtype.unit}, {'values': series.array.asi8}
+    if isinstance(dtype, np.dtype) and dtype.kind in 'biufcmM':
+        return {'kind': 'numpy'}, {'values': series.to_numpy()}
+    mask = series.isna().to_numpy()
+    present = series[~mask]
+    if all(isinstance(value, str) for value in present):
+        # strings are stored as fixed-width unicode, missing values as ''
+        values = series.where(~mask, '').to_numpy(dtype=str)
+        arrays = {'values': values}
+        if mask.any():
+            arrays['mask'] = mask
+        return {'kind': 'string', 'dtype': str(dtype)}, arrays
+    raise TypeError(f"column of dtype {dtype} cannot be cached")
+
+
+def _decode(meta: Dict[str, Any], arrays: Dict[str, np.ndarray]) -> pd.Series:
+    kind = meta['kind']
+    if kind == 'numpy':
+        return pd.Series(arrays['values'], copy=False)
+    if kind == 'datetimetz':
+        values = np.asarray(arrays['values']).view(f"datetime64[{meta['unit']}]")
+        return pd.Series(values, copy=False).dt.tz_localize('UTC').dt.tz_convert(meta['tz'])
+    if kind == 'string':
+        series = pd.Series(arrays['values']).astype(meta['dtype'])
+        if 'mask' in arrays:
+            series[np.asarray(arrays['mask'])] = None
+        return series
+    if kind == 'category':
+        categories = _decode(meta['categories'], {key[len('categories.'):]: value for key, value in arrays.items()
+                                                  if key.startswith('categories.')})
+        return pd.Series(pd.Categorical.from_codes(arrays['codes'], categories, ordered=meta['ordered']))
+    raise ValueError(f"Unknown column kind in cache: {kind}")
+
+
+class ColumnarCache:
+    """
+    On-disk columnar cache of extracted data.
+
+    Each entry stores one ``.npy`` file per column plus a ``schema.json``.
+    Entries are keyed by the source's class and options and validated
+    against the backing file's path, mtime and size; when only the mtime
+    or size changed, a content hash decides whether the entry is still
+    valid. SQLite entries are also validated against the ``-wal`` file
+    and the schema version, since WAL commits leave the main file as is. Numeric columns are reloaded memory-mapped, so a warm start
+    only touches the pages that are actually used.
+
+    Args:
+        cache_dir: Directory holding the entries (defaults to ~/.cache/dataruns/columnar)
+        mmap_mode: Mode passed to np.load. The default 'c' maps the files
+            copy-on-write, so reloaded frames can be modified in memory
+            without touching the cache; 'r' maps them read-only.
+
+    Example:
+        >>> cache = ColumnarCache()
+        >>> data = cache.extract(CSVSource(file_path='data.csv'))  # parses and stores
+        >>> data = cache.extract(CSVSource(file_path='data.csv'))  # memory-mapped reload
+        >>> cache.cache_info()['hit_rate']
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, mmap_mode: Optional[str] = 'c'):
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.mmap_mode = mmap_mode
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self._lock = threading.Lock()
+
+    def key(self, source: Datasource) -> str:
+        """Cache key of a source: its class plus every public option."""
+        options = sorted((name, repr(value)) for name, value in vars(source).items()
+                         if not name.startswith('_') and name != 'pending_watermark')
+        identity = repr((source.__class__.__module__, source.__class__.__qualname__, options))
+        return hashlib.sha256(identity.encode()).hexdigest()
+
+    def _entry_dir(self, source: Datasource) -> str:
+        return os.path.join(self.cache_dir, self.key(source))
+
+    def _validate(self, entry_dir: str, schema: Dict[str, Any], source: Datasource, path: str) -> bool:
+        origin = schema['source']
+        if origin['path'] != os.path.abspath(path):
+            return False
+        files = [(origin, path)]
+        sqlite = origin.get('sqlite')
+        if sqlite is not None:
+            current = _sqlite_record(source, path)
+            if current['schema_version'] != sqlite['schema_version']:
+                return False
+            if (sqlite['wal'] is None) != (current['wal'] is None):
+                return False
+            if sqlite['wal'] is not None:
+                files.append((sqlite['wal'], path + '-wal'))
+        touched = False
+        for record, file_path in files:
+            stat = os.stat(file_path)
+            if record['mtime_ns'] == stat.st_mtime_ns and record['size'] == stat.st_size:
+                continue
+            if record['size'] != stat.st_size or record['digest'] != _file_digest(file_path):
+                return False
+            # touched but unchanged: remember the new stat so the hash is not recomputed
+            record['mtime_ns'] = stat.st_mtime_ns
+            touched = True
+        if touched:
+            self._write_schema(entry_dir, schema)
+        return True
+
+    def _write_schema(self, directory: str, schema: Dict[str, Any]) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.schema-')
+        with os.fdopen(fd, 'w') as file:
+            json.dump(schema, file, indent=2)
+        os.replace(tmp_path, os.path.join(directory, 'schema.json'))
+
+    def _load_arrays(self, entry_dir: str, files: Dict[str, str]) -> Dict[str, np.ndarray]:
+        # np.asarray drops the memmap subclass but keeps the mapping as the base
+        return {key: np.asarray(np.load(os.path.join(entry_dir, name), mmap_mode=self.mmap_mode, allow_pickle=False))
+                for key, name in files.items()}
+
+    def load(self, source: Datasource) -> Optional[Union[pd.DataFrame, Dict[str, np.ndarray]]]:
+        """Return the cached data of source, or None if there is no valid entry."""
+        path = _source_path(source)
+        entry_dir = self._entry_dir(source)
+        try:
+            with open(os.path.join(entry_dir, 'schema.json'), 'r') as file:
+                schema = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            schema = None
+        if schema is None or schema.get('version') != SCHEMA_VERSION or not self._validate(entry_dir, schema, source, path):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        columns = {}
+        for index, column in enumerate(schema['columns']):
+            columns[index] = _decode(column['meta'], self._load_arrays(entry_dir, column['files']))
+        if schema['layout'] == 'arrays':
+            data = {column['name']: columns[index].to_numpy() for index, column in enumerate(schema['columns'])}
+        else:
+            data = pd.DataFrame({index: series for index, series in columns.items()}, copy=False)
+            data.columns = pd.Index([column['name'] for column in schema['columns']])
+            index = schema['index']
+            if index['kind'] == 'range':
+                data.index = pd.RangeIndex(index['start'], index['stop'], index['step'], name=index['name'])
+            else:
+                data.index = pd.Index(_decode(index['meta'], self._load_arrays(entry_dir, index['files'])),
+                                      name=index['name'])
+        with self._lock:
+            self.hits += 1
+            self.bytes_saved += schema['source']['size']
+        return data
+
+    def store(self, source: Datasource, data: Union[pd.DataFrame, Dict[str, np.ndarray]]) -> bool:
+        """
+        Write data as the cache entry of source.
+
+        Returns False (and leaves the cache untouched) if a column cannot be
+        stored losslessly, e.g. object columns of mixed types.
+        """
+        path = _source_path(source)
+        layout = 'arrays' if isinstance(data, dict) else 'frame'
+        names = list(data.keys()) if layout == 'arrays' else list(data.columns)
+        if len(set(names)) != len(names) or not all(isinstance(name, (str, int)) for name in names):
+            logger.info("Not caching data with duplicate or non str/int column names")
+            return False
+        try:
+            encoded = [_encode(pd.Series(data[name]) if layout == 'arrays' else data[name]) for name in names]
+            index = None
+            if layout == 'frame':
+                if isinstance(data.index, pd.RangeIndex):
+                    index = {'kind': 'range', 'start': data.index.start, 'stop': data.index.stop,
+                             'step': data.index.step, 'name': data.index.name}
+                else:
+                    index = {'kind': 'values', 'name': data.index.name,
+                             'encoded': _encode(data.index.to_series(index=range(len(data))))}
+        except TypeError as error:
+            logger.info(f"Not caching data: {error}")
+            return False
+
+        schema = {
+            'version': SCHEMA_VERSION,
+            'layout': layout,
+            'source': dict(_file_record(path), path=os.path.abspath(path), sqlite=_sqlite_record(source, path)),
+            'columns': [],
+        }
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(dir=self.cache_dir, prefix='.entry-')
+        try:
+            def save(prefix: str, arrays: Dict[str, np.ndarray]) -> Dict[str, str]:
+                files = {}
+                for key, values in arrays.items():
+                    files[key] = f'{prefix}.{key}.npy'
+                    np.save(os.path.join(tmp_dir, files[key]), np.ascontiguousarray(values), allow_pickle=False)
+                return files
+
+            for position, (name, (meta, arrays)) in enumerate(zip(names, encoded)):
+                schema['columns'].append({'name': name, 'meta': meta, 'files': save(str(position), arrays)})
+            if index is not None:
+                if index['kind'] == 'values':
+                    meta, arrays = index.pop('encoded')
+                    index.update(meta=meta, files=save('index', arrays))
+                schema['index'] = index
+            self._write_schema(tmp_dir, schema)
+            self._replace_entry(tmp_dir, self._entry_dir(source))
+        except BaseException:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+        return True
+
+    def _replace_entry(self, tmp_dir: str, entry_dir: str) -> None:
+        stale = None
+        if os.path.exists(entry_dir):
+            stale = tempfile.mkdtemp(dir=self.cache_dir, prefix='.stale-')
+            os.replace(entry_dir, os.path.join(stale, 'entry'))
+        os.replace(tmp_dir, entry_dir)
+        if stale is not None:
+            # mapped files stay readable after unlinking, so readers of the old entry are unaffected
+            shutil.rmtree(stale, ignore_errors=True)
+
+    def extract(self, source: Datasource) -> Union[pd.DataFrame, Dict[str, np.ndarray]]:
+        """Return the cached data of source, extracting and storing it on a miss."""
+        data = self.load(source)
+        if data is None:
+            data = source.extract_data()
+            self.store(source, data)
+        return data
+
+    def invalidate(self, source: Datasource) -> None:
+        """Drop the entry of source."""
+        shutil.rmtree(self._entry_dir(source), ignore_errors=True)
+
+    def cache_info(self) -> dict:
+        """Return hit/miss counters and the source bytes not re-parsed thanks to the cache."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'bytes_saved': self.bytes_saved,
+            }
+
+    def __repr__(self):
+        return f"ColumnarCache({self.cache_dir!r})"
+
+
+def resolve_cache(cache: Union[bool, 'ColumnarCache', None]) -> Optional['ColumnarCache']:
+    """Map the cache= argument of the load helpers to a ColumnarCache or None."""
+    if cache is True:
+        return ColumnarCache()
+    if cache is None or cache is False:
+        return None
+    if isinstance(cache, ColumnarCache):
+        return cache
+    raise TypeError("cache must be a bool or a ColumnarCache")
@@ -0,0 +1,146 @@
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, AsyncIterator, Iterable, Iterator, List, Tuple, Union
+import asyncio
+import os
+
+from .datasource import Datasource
+
+# This file contains helpers that extract many sources concurrently. Every
+# extract_data call is blocking, so the event loop only schedules them onto
+# executors and bounds how many run at once.
+
+
+def _extract(source: Datasource) -> Any:
+    """Run one extraction. Module level so process pools can pickle it."""
+    return source.extract_data()
+
+
+def _is_network(source: Datasource) -> bool:
+    return getattr(source, 'url', None) is not None
+
+
+@contextmanager
+def _pools(executor: Union[str, Executor], max_concurrency: int) -> Iterator[Tuple[Executor, Executor]]:
+    """
+    Yield (file_pool, network_pool).
+
+    Downloads are I/O bound, so network sources always run on threads even
+    when file parses are sent to a process pool.
+    """
+    owned = []
+    if isinstance(executor, Executor):
+        file_pool = executor
+    elif executor == 'thread':
+        file_pool = ThreadPoolExecutor(max_workers=max_concurrency)
+        owned.append(file_pool)
+    elif executor == 'process':
+        file_pool = ProcessPoolExecutor(max_workers=min(max_concurrency, os.cpu_count() or 1))
+        owned.append(file_pool)
+    else:
+        raise ValueError("executor must be 'thread', 'process' or a concurrent.futures.Executor")
+    if isinstance(file_pool, ThreadPoolExecutor):
+        network_pool = file_pool
+    else:
+        network_pool = ThreadPoolExecutor(max_workers=max_concurrency)
+        owned.append(network_pool)
+    try:
+        yield file_pool, network_pool
+    finally:
+        for pool in owned:
+            # after a failure, queued extractions are dropped instead of awaited
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def iter_completed_async(
+    sources: Iterable[Datasource],
+    max_concurrency: int = 8,
+    executor: Union[str, Executor] = 'thread'
+) -> AsyncIterator[Tuple[int, Any]]:
+    """
+    Extract sources concurrently and yield (index, data) as each one completes.
+
+    Args:
+        sources: Datasource instances to extract
+        max_concurrency: Maximum number of extractions running at once
+        executor: 'thread', 'process' (sources must be picklable) or an
+            Executor to run file parses on. Network sources always use threads.
+
+    Example:
+        >>> async for index, frame in iter_completed_async(sources, max_concurrency=4):
+        ...     handle(sources[index], frame)
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    sources = list(sources)
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    with _pools(executor, max_concurrency) as (file_pool, network_pool):
+        async def run(index: int, source: Datasource) -> Tuple[int, Any]:
+            async with semaphore:
+                pool = network_pool if _is_network(source) else file_pool
+                return index, await loop.run_in_executor(pool, _extract, source)
+
+        tasks = [asyncio.ensure_future(run(index, source)) for index, source in enumerate(sources)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+async def extract_many_async(
+    sources: Iterable[Datasource],
+    max_concurrency: int = 8,
+    executor: Union[str, Executor] = 'thread'
+) -> List[Any]:
+    """
+    Extract sources concurrently and return their data in input order.
+
+    Total time approaches that of the slowest source rather than the sum
+    of all of them. The first failing source raises and cancels the rest.
+
+    Example:
+        >>> frames = await extract_many_async([CSVSource(url=u) for u in urls])
+    """
+    sources = list(sources)
+    results: List[Any] = [None] * len(sources)
+    async for index, data in iter_completed_async(sources, max_concurrency, executor):
+        results[index] = data
+    return results
+
+
+def extract_many(
+    sources: Iterable[Datasource],
+    max_concurrency: int = 8,
+    executor: Union[str, Executor] = 'thread',
+    ordered: bool = True
+) -> Union[List[Any], List[Tuple[int, Any]]]:
+    """
+    Blocking wrapper around extract_many_async.
+
+    Args:
+        sources: Datasource instances to extract
+        max_concurrency: Maximum number of extractions running at once
+        executor: 'thread', 'process' or an Executor for file parses
+        ordered: If True return the data in input order, otherwise return
+            (index, data) pairs in completion order
+
+    Example:
+        >>> frames = extract_many([CSVSource('a.csv'), SQLiteSource('app.db', table_name='users')])
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        raise RuntimeError("extract_many cannot run inside an event loop, await extract_many_async instead")
+
+    if ordered:
+        return asyncio.run(extract_many_async(sources, max_concurrency, executor))
+
+    async def collect() -> List[Tuple[int, Any]]:
+        return [item async for item in iter_completed_async(sources, max_concurrency, executor)]
+    return asyncio.run(collect())
@@ -1,12 +1,23 @@
 from abc import ABC, abstractmethod
-from typing import Dict
-import csv, sqlite3
-import requests
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import closing, contextmanager
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple, Union
+import io
+import math
+import mmap
+import sqlite3
 import os
+from urllib.parse import quote
+import copy
 
-from openpyxl import load_workbook
+import numpy as np
 import pandas as pd
-from requests.models import Response
+
+from .http_cache import HTTPCache
+from .watermark import WatermarkStore
+
+if TYPE_CHECKING:
+    from ..core.expr import Predicate
 
 
 class Datasource(ABC):
@@ -17,67 +28,696 @@ class Datasource(ABC):
         raise NotImplementedError("Subclasses must implement this method")
 
 
+def _newline_aligned_ranges(file_path: str, n_ranges: int, skip_header: bool = True) -> List[Tuple[int, int]]:
+    """
+    Split the body of a CSV file (everything after the header line, or the
+    whole file if skip_header is False) into at most n_ranges byte ranges
+    that each start and end on a line boundary.
+    """
+    with open(file_path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            header_end = (mm.find(b'\n') + 1 or size) if skip_header else 0
+            step = (size - header_end) / max(n_ranges, 1)
+            boundaries = [header_end]
+            for i in range(1, n_ranges):
+                newline = mm.find(b'\n', max(header_end + int(i * step), boundaries[-1]))
+                boundaries.append(size if newline == -1 else newline + 1)
+            boundaries.append(size)
+    return [(start, end) for start, end in zip(boundaries, boundaries[1:]) if end > start]
+
+
+# read_csv options that refer to positions in the whole file and cannot be applied per byte range
+_WHOLE_FILE_OPTIONS = ('skiprows', 'skipfooter', 'nrows', 'chunksize', 'iterator')
+
+
+def _inferred_dtypes(frame: pd.DataFrame) -> Dict[str, Any]:
+    """Dtypes of frame that can be passed to read_csv to parse further ranges the same way."""
+    return {name: dtype for name, dtype in frame.dtypes.items()
+            if not isinstance(dtype, (pd.CategoricalDtype, pd.DatetimeTZDtype))
+            and getattr(dtype, 'kind', None) not in ('M', 'm')}
+
+
+def _parse_csv_range(file_path: str, start: int, end: int, names: List[str], options: Dict[str, Any],
+                     finish: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None) -> pd.DataFrame:
+    """Parse one byte range of a CSV file. Runs inside worker processes."""
+    with open(file_path, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            buffer = mm[start:end]
+    frame = pd.read_csv(io.BytesIO(buffer), header=None, names=names, **options)
+    return frame if finish is None else finish(frame)
+
+
 class CSVSource(Datasource):
     """CSV file data source"""
-    def __init__(self, file_path: str=None, url: str=None):
+    def __init__(
+        self,
+        file_path: str=None,
+        url: str=None,
+        dtype: Optional[Union[str, Dict[str, Any]]]=None,
+        usecols: Optional[List[Union[str, int]]]=None,
+        cache_dir: Optional[str]=None,
+        **read_options
+    ):
+        """
+        Args:
+            file_path: Path to a local CSV file
+            url: URL of a CSV file to download. Downloads are streamed to
+                disk and cached; unchanged files are not downloaded again.
+            dtype: dtype (or mapping of column to dtype) to parse columns as.
+                Columns without an entry have their dtype inferred.
+            usecols: Subset of columns to parse
+            cache_dir: Directory of the download cache for url sources
+                (defaults to ~/.cache/dataruns/http)
+            **read_options: Extra keyword arguments for pandas.read_csv
+        """
         self.file_path = file_path
         self.url = url
+        self.dtype = dtype
+        self.usecols = usecols
+        self.cache_dir = cache_dir
+        self.read_options = read_options
+        self.predicate = None
         
-    def _download_csv(self, url: str):
-        response = requests.get(url)
-
-        if response.status_code == 200:
-            local_file_path = os.path.join(os.getcwd(), 'downloaded_data.csv')
-            with open(local_file_path, 'wb') as file:
-                file.write(response.content)
-                print("Downloaded CSV file Successfully📎")
-                return local_file_path
-        else:
-            raise Exception(f"Failed to download file. Status code: {response.status_code}")
+    def _download_csv(self, url: str) -> str:
+        """Download url into the HTTP cache (or revalidate the cached copy) and return its local path."""
+        return HTTPCache(self.cache_dir).fetch(url)
 
-    def extract_data(self) -> pd.DataFrame:
+    def _resolve_path(self) -> str:
         if self.url is not None:
-            file_path = self._download_csv(self.url)
+            return self._download_csv(self.url)
         elif self.file_path is not None:
-            file_path = self.file_path
+            return self.file_path
         else:
             raise ValueError("Either file_path or url must be provided")
-        data = []
-        with open(file_path, 'r') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                data.append(row)
-        data = pd.DataFrame(data)
-        return data
+
+    @contextmanager
+    def _open(self) -> Iterator[Union[str, BinaryIO]]:
+        """
+        Yield something pandas.read_csv can parse: the local path, or for
+        url sources a stream that is parsed while it downloads into the cache.
+        """
+        if self.url is not None:
+            with HTTPCache(self.cache_dir).open(self.url) as stream:
+                yield stream
+        else:
+            yield self._resolve_path()
+
+    def with_columns(self, columns: List[str]) -> 'CSVSource':
+        """
+        Return a copy of this source that only parses columns.
+        
+        Columns come back in file order. Used by the planner to push a
+        leading SelectColumns into the parser.
+        """
+        columns = list(columns)
+        if self.usecols is not None and not set(columns) <= set(self.usecols):
+            raise ValueError(f"Columns {columns} are not a subset of usecols {self.usecols}")
+        projected = copy.copy(self)
+        projected.usecols = columns
+        return projected
+
+    def with_predicate(self, predicate: 'Predicate') -> 'CSVSource':
+        """
+        Return a copy of this source that only keeps rows matching predicate.
+        
+        The file is then parsed in chunks and every chunk is filtered before
+        the chunks are combined, so rejected rows are never accumulated.
+        """
+        filtered = copy.copy(self)
+        filtered.predicate = predicate if self.predicate is None else self.predicate & predicate
+        return filtered
+
+    def _extra_columns(self) -> List[str]:
+        """Columns parsed only to evaluate the predicate."""
+        if self.predicate is None or self.usecols is None or not all(isinstance(c, str) for c in self.usecols):
+            return []
+        return sorted(set(self.predicate.columns()) - set(self.usecols))
+
+    def _read_csv_options(self) -> Dict[str, Any]:
+        usecols = self.usecols
+        extra = self._extra_columns()
+        if extra:
+            usecols = list(usecols) + extra
+        options = {'dtype': self.dtype, 'usecols': usecols}
+        options.update(self.read_options)
+        return options
+
+    def _filter(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        if self.predicate is None:
+            return chunk
+        chunk = chunk[self.predicate.evaluate(chunk)]
+        extra = self._extra_columns()
+        return chunk.drop(columns=extra) if extra else chunk
+
+    def extract_data(self) -> pd.DataFrame:
+        """Parse the whole file into a DataFrame with typed columns."""
+        if self.predicate is not None:
+            chunks = list(self.iter_chunks())
+            return pd.concat(chunks) if chunks else pd.DataFrame(columns=self.usecols)
+        with self._open() as source:
+            return pd.read_csv(source, **self._read_csv_options())
+
+    def iter_chunks(self, chunksize: int = 100_000) -> Iterator[pd.DataFrame]:
+        """
+        Parse the file in chunks of chunksize rows.
+        
+        Each chunk is a typed DataFrame, so the chunks can be fed straight
+        into Pipeline.stream with bounded memory.
+        """
+        with self._open() as source:
+            with pd.read_csv(source, chunksize=chunksize, **self._read_csv_options()) as reader:
+                for chunk in reader:
+                    yield self._filter(chunk)
+
+    def iter_partitions(self, n_workers: Optional[int] = None, n_partitions: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """
+        Parse the file in parallel and yield the partitions in file order.
+        
+        The file is memory-mapped and split into newline-aligned byte ranges
+        which are parsed in a process pool. Files with quoted fields that
+        contain newlines cannot be split this way; use extract_data for those.
+        
+        Dtypes are inferred from the first partition and passed to the
+        others, so a column whose values change type further down the file
+        (e.g. an integer column that gains missing values) raises ValueError
+        unless its dtype is given. Read options that count rows of the whole
+        file (skiprows, nrows, skipfooter) are not supported.
+        
+        Args:
+            n_workers: Number of worker processes (defaults to the CPU count)
+            n_partitions: Number of byte ranges (defaults to n_workers)
+        """
+        unsupported = [name for name in _WHOLE_FILE_OPTIONS if name in self.read_options]
+        header = self.read_options.get('header', 'infer')
+        if header not in ('infer', 0, None):
+            unsupported.append('header')
+        if unsupported:
+            raise ValueError(f"iter_partitions does not support the read options {unsupported}; "
+                             "use extract_data or iter_chunks instead")
+        file_path = self._resolve_path()
+        n_workers = n_workers or os.cpu_count() or 1
+        options = self._read_csv_options()
+        names = options.pop('names', None)
+        options.pop('header', None)
+        has_header = header == 0 or (header == 'infer' and names is None)
+        ranges = _newline_aligned_ranges(file_path, n_partitions or n_workers, skip_header=has_header)
+        if not ranges:
+            yield self._filter(pd.read_csv(file_path, **self._read_csv_options()))
+            return
+        if names is None:
+            names = list(pd.read_csv(file_path, nrows=0, **{k: v for k, v in options.items()
+                                                            if k not in ('dtype', 'usecols')}).columns)
+        else:
+            names = list(names)
+        finish = self._filter if self.predicate is not None else None
+
+        # dtypes are inferred once, from the first range, so every partition comes back with the same dtypes
+        (start, end), ranges = ranges[0], ranges[1:]
+        first = _parse_csv_range(file_path, start, end, names, options)
+        if not isinstance(options['dtype'], (str, np.dtype, type)):
+            options['dtype'] = {**_inferred_dtypes(first), **(options['dtype'] or {})}
+        yield first if finish is None else finish(first)
+
+        def parsed(result: Callable[[], pd.DataFrame], start: int) -> pd.DataFrame:
+            try:
+                return result()
+            except (ValueError, TypeError) as error:
+                raise ValueError(f"The CSV range starting at byte {start} does not parse with the dtypes inferred "
+                                 f"from the first partition ({error}); pass dtype= for the affected columns") from error
+
+        if n_workers == 1:
+            for start, end in ranges:
+                yield parsed(lambda: _parse_csv_range(file_path, start, end, names, options, finish), start)
+            return
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = [executor.submit(_parse_csv_range, file_path, start, end, names, options, finish)
+                       for start, end in ranges]
+            for (start, _), future in zip(ranges, futures):
+                yield parsed(future.result, start)
+
+    def extract_parallel(self, n_workers: Optional[int] = None) -> pd.DataFrame:
+        """Parse the file with iter_partitions and concatenate the partitions."""
+        return pd.concat(list(self.iter_partitions(n_workers=n_workers)), ignore_index=True)
+
+def _quote_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _read_only_uri(connection_string: str) -> str:
+    """SQLite URI opening the database read-only, which never blocks WAL writers."""
+    if connection_string.startswith('file:'):
+        separator = '&' if '?' in connection_string else '?'
+        return f"{connection_string}{separator}mode=ro"
+    return f"file:{quote(os.path.abspath(connection_string))}?mode=ro"
+
+
+def _read_shard(uri: str, sql: str, params: tuple, as_arrays: bool, chunksize: int):
+    """Read one key range on its own read-only connection. Runs in worker threads/processes."""
+    with closing(sqlite3.connect(uri, uri=True)) as conn:
+        cursor = conn.cursor()
+        cursor.arraysize = chunksize
+        cursor.execute(sql, params)
+        names = [column[0] for column in cursor.description]
+        frame = pd.DataFrame.from_records(cursor.fetchall(), columns=names, coerce_float=True)
+    if as_arrays:
+        return {name: frame[name].to_numpy() for name in names}
+    return frame
+
 
 class SQLiteSource(Datasource):
     """sqlite file data source"""
-    def __init__(self, connection_string: str, query: str):
+    def __init__(self, connection_string: str, query: str=None, table_name: str=None,
+                 as_arrays: bool=False, chunksize: int=10_000):
+        """
+        Args:
+            connection_string: Path (or URI) of the SQLite database
+            query: SQL query to extract
+            table_name: Table to extract, if no query is given
+            as_arrays: Return a dict of column name to numpy array instead of a DataFrame
+            chunksize: Rows per cursor fetch (also the default chunk size of iter_chunks)
+        """
+        if query is None and table_name is None:
+            raise ValueError("Either query or table_name must be provided")
         self.connection_string = connection_string
-        self.query = query
+        self.table_name = table_name
+        self.query = query if query is not None else f"SELECT * FROM {_quote_identifier(table_name)}"
+        self.as_arrays = as_arrays
+        self.chunksize = chunksize
+        self.columns = None
+        self.predicate = None
+        self.pending_watermark = None
+
+    def with_columns(self, columns: List[str]) -> 'SQLiteSource':
+        """
+        Return a copy of this source whose statements only SELECT columns.
+        
+        SQLite flattens the projection into the query, so unused columns
+        are never decoded.
+        """
+        projected = copy.copy(self)
+        projected.columns = list(columns)
+        projected.pending_watermark = None
+        return projected
+
+    def with_predicate(self, predicate: 'Predicate') -> 'SQLiteSource':
+        """
+        Return a copy of this source that only reads rows matching predicate.
+        
+        The predicate is translated into a parameterized WHERE clause, so
+        rejected rows never leave SQLite.
+        """
+        filtered = copy.copy(self)
+        filtered.predicate = predicate if self.predicate is None else self.predicate & predicate
+        filtered.pending_watermark = None
+        return filtered
+
+    def _select_list(self) -> str:
+        if self.columns is None:
+            return '*'
+        return ', '.join(_quote_identifier(column) for column in self.columns)
+
+    def _where(self) -> Tuple[List[str], tuple]:
+        """WHERE conditions and their parameters of the pushed-down predicate."""
+        if self.predicate is None:
+            return [], ()
+        clause, params = self.predicate.to_sql()
+        return [clause], tuple(params)
+
+    def _statement(self) -> Tuple[str, tuple]:
+        if self.columns is None and self.predicate is None:
+            return self.query, ()
+        conditions, params = self._where()
+        sql = f"SELECT {self._select_list()} FROM ({self.query})"
+        if conditions:
+            sql += f" WHERE {' AND '.join(conditions)}"
+        return sql, params
+
+    def _columnar(self, rows: List[tuple], names: List[str]) -> Union[pd.DataFrame, Dict[str, np.ndarray]]:
+        frame = pd.DataFrame.from_records(rows, columns=names, coerce_float=True)
+        if self.as_arrays:
+            return {name: frame[name].to_numpy() for name in names}
+        return frame
+
+    def _execute(self, conn: sqlite3.Connection, chunksize: int) -> sqlite3.Cursor:
+        cursor = conn.cursor()
+        # fetchmany() defaults to arraysize rows per call
+        cursor.arraysize = chunksize
+        return cursor.execute(*self._statement())
+
+    def extract_data(self) -> Union[pd.DataFrame, Dict[str, np.ndarray]]:
+        """Run the query and return the result as columns, not per-row records."""
+        with closing(sqlite3.connect(self.connection_string)) as conn:
+            cursor = self._execute(conn, self.chunksize)
+            names = [column[0] for column in cursor.description]
+            return self._columnar(cursor.fetchall(), names)
+
+    def iter_chunks(self, chunksize: Optional[int] = None) -> Iterator[Union[pd.DataFrame, Dict[str, np.ndarray]]]:
+        """
+        Stream the query result in columnar chunks of at most chunksize rows.
+        
+        Rows are pulled from the cursor with fetchmany, so only one chunk is
+        held in memory at a time.
+        """
+        chunksize = chunksize or self.chunksize
+        with closing(sqlite3.connect(self.connection_string)) as conn:
+            cursor = self._execute(conn, chunksize)
+            names = [column[0] for column in cursor.description]
+            while True:
+                rows = cursor.fetchmany(chunksize)
+                if not rows:
+                    break
+                yield self._columnar(rows, names)
+
+    def watermark_key(self, watermark_column: str, key_column: Optional[str] = None) -> str:
+        """Key this source's watermark is stored under in a WatermarkStore."""
+        key = f"sqlite:{os.path.abspath(self.connection_string)}:{self.query}:{watermark_column}"
+        if key_column is not None:
+            # the stored watermark also lists the keys already seen at its value
+            key += f":{key_column}"
+        if self.predicate is not None:
+            # filtered extractions advance their own watermark
+            key += f":{self.predicate!r}"
+        return key
+
+    def extract_incremental(self, watermark_column: str, store: 'WatermarkStore', commit: bool = True,
+                            key_column: Optional[str] = None) -> Union[pd.DataFrame, Dict[str, np.ndarray]]:
+        """
+        Extract only the rows added since the previous run.
+        
+        Rows whose watermark_column is greater than the watermark persisted
+        in store are returned, ordered by that column. The first run returns
+        all rows.
+        
+        Without key_column, watermark_column must be strictly increasing in
+        commit order (e.g. an INTEGER PRIMARY KEY): a row committed after a
+        run with the same value as the watermark is never extracted. For
+        columns with ties, such as an updated_at timestamp, pass key_column:
+        rows equal to the watermark are then extracted again and the ones
+        whose key was already returned at that value are dropped.
+        
+        An updated_at column returns updated rows again, so statistics fed
+        with partial_fit count them once per update; fit incremental
+        statistics on deltas of an append-only column instead.
+        
+        Args:
+            watermark_column: Column used as the high-watermark
+            store: WatermarkStore persisting the watermark between runs
+            commit: Persist the new watermark right away. With commit=False,
+                call commit_watermark(store) once the delta has been processed,
+                so a failed run is retried from the same watermark.
+            key_column: Unique column identifying rows that share a
+                watermark value
+        
+        Example:
+            >>> delta = source.extract_incremental('id', store, commit=False)
+            >>> preprocessing.partial_fit(delta)
+            >>> source.commit_watermark(store)
+        """
+        for name in (watermark_column, key_column):
+            if self.columns is not None and name is not None and name not in self.columns:
+                raise ValueError(f"Column {name!r} is not among the selected columns")
+        column = _quote_identifier(watermark_column)
+        store_key = self.watermark_key(watermark_column, key_column)
+        stored = store.get(store_key)
+        last, seen = (stored['value'], stored['keys']) if key_column is not None and stored is not None else (stored, [])
+        conditions, params = self._where()
+        if last is not None:
+            conditions.append(f"{column} {'>=' if key_column is not None else '>'} ?")
+            params += (last,)
+        sql = f"SELECT {self._select_list()} FROM ({self.query})"
+        if conditions:
+            sql += f" WHERE {' AND '.join(conditions)}"
+        sql += f" ORDER BY {column}"
+
+        with closing(sqlite3.connect(self.connection_string)) as conn:
+            cursor = conn.cursor()
+            cursor.arraysize = self.chunksize
+            cursor.execute(sql, params)
+            names = [description[0] for description in cursor.description]
+            delta = self._columnar(cursor.fetchall(), names)
+
+        values = np.asarray(delta[watermark_column])
+        if key_column is None:
+            self.pending_watermark = (store_key, values[-1] if len(values) else last)
+        else:
+            keys = np.asarray(delta[key_column])
+            if seen:
+                fresh = ~((values == last) & np.isin(keys, seen))
+                delta = {name: array[fresh] for name, array in delta.items()} if self.as_arrays \
+                    else delta[fresh].reset_index(drop=True)
+                values, keys = values[fresh], keys[fresh]
+            if len(values):
+                value = values[-1]
+                at_value = keys[values == value].tolist()
+                self.pending_watermark = (store_key, {'value': value.item() if hasattr(value, 'item') else value,
+                                                      'keys': at_value + seen if value == last else at_value})
+            else:
+                self.pending_watermark = (store_key, stored)
+        if commit:
+            self.commit_watermark(store)
+        return delta
+
+    def commit_watermark(self, store: 'WatermarkStore') -> None:
+        """Persist the watermark of the last extract_incremental call."""
+        pending = self.pending_watermark
+        if pending is None:
+            raise ValueError("No incremental extraction to commit")
+        store_key, value = pending
+        if value is not None:
+            store.set(store_key, value)
+        self.pending_watermark = None
+
+    def _shard_queries(self, n_shards: int, key: str) -> List[Tuple[str, tuple]]:
+        """
+        Split the extraction into SQL statements over contiguous numeric key
+        ranges, preceded by one for the rows whose key is NULL.
+        """
+        reads_table = self.table_name is not None and self.query == f"SELECT * FROM {_quote_identifier(self.table_name)}"
+        relation = _quote_identifier(self.table_name) if reads_table else f"({self.query})"
+        if key.lower() == 'rowid':
+            if not reads_table:
+                raise ValueError("Sharding by rowid needs table_name; pass key= an integer column of the query")
+            column = 'rowid'
+        else:
+            column = _quote_identifier(key)
+
+        with closing(sqlite3.connect(_read_only_uri(self.connection_string), uri=True)) as conn:
+            low, high = conn.execute(f"SELECT MIN({column}), MAX({column}) FROM {relation}").fetchone()
+            has_nulls = column != 'rowid' and conn.execute(
+                f"SELECT EXISTS (SELECT 1 FROM {relation} WHERE {column} IS NULL)").fetchone()[0]
+        # SQLite sorts text and blobs after all numbers, so a numeric maximum means a numeric key
+        if isinstance(low, (str, bytes)) or isinstance(high, (str, bytes)):
+            raise ValueError(f"Sharding key {key!r} holds text or blob values; pass key= a numeric column")
+
+        conditions, params = self._where()
+        select = f"SELECT {self._select_list()} FROM {relation} WHERE "
+        queries = []
+        if has_nulls:
+            # ORDER BY puts NULLs first, so this shard keeps the shards in key order
+            queries.append((select + ' AND '.join(conditions + [f"{column} IS NULL"]), params))
+        if low is None:
+            return queries
+
+        # REAL keys are covered by the integer ranges around them
+        low, high = math.floor(low), math.floor(high)
+        sql = select + ' AND '.join(conditions + [f"{column} >= ?", f"{column} < ?"]) + f" ORDER BY {column}"
+        n_shards = max(1, min(n_shards, high - low + 1))
+        bounds = [low + (high + 1 - low) * i // n_shards for i in range(n_shards + 1)]
+        queries += [(sql, params + (start, stop)) for start, stop in zip(bounds, bounds[1:])]
+        return queries
+
+    def iter_shards(self, n_shards: Optional[int] = None, key: str = 'rowid', n_workers: Optional[int] = None,
+                    ordered: bool = True, executor: str = 'process') -> Iterator[Union[pd.DataFrame, Dict[str, np.ndarray]]]:
+        """
+        Read the table or query in integer key ranges on concurrent read-only connections.
+        
+        Args:
+            n_shards: Number of key ranges (defaults to n_workers)
+            key: 'rowid' (needs table_name) or a numeric column of the query.
+                Rows with a NULL key are read as one extra shard.
+            n_workers: Number of concurrent readers (defaults to the CPU count)
+            ordered: Yield shards in key order; otherwise as soon as they finish
+            executor: 'process' (parallel row decoding) or 'thread'
+        
+        Shards are sorted by key, so with ordered=True the concatenated shards
+        are ordered by key as well.
+        """
+        n_workers = n_workers or os.cpu_count() or 1
+        queries = self._shard_queries(n_shards or n_workers, key)
+        uri = _read_only_uri(self.connection_string)
+        pool = ProcessPoolExecutor if executor == 'process' else ThreadPoolExecutor
+        with pool(max_workers=n_workers) as workers:
+            futures = [workers.submit(_read_shard, uri, sql, params, self.as_arrays, self.chunksize)
+                       for sql, params in queries]
+            for future in (futures if ordered else as_completed(futures)):
+                yield future.result()
+
+    def extract_sharded(self, n_shards: Optional[int] = None, key: str = 'rowid', n_workers: Optional[int] = None,
+                        executor: str = 'process') -> Union[pd.DataFrame, Dict[str, np.ndarray]]:
+        """Read all shards with iter_shards and combine them in key order."""
+        shards = list(self.iter_shards(n_shards=n_shards, key=key, n_workers=n_workers, executor=executor))
+        if not shards:
+            return self.extract_data()
+        if self.as_arrays:
+            return {name: np.concatenate([shard[name] for shard in shards]) for name in shards[0]}
+        return pd.concat(shards, ignore_index=True)
+
+def _is_header(first_row: tuple, second_row: Optional[tuple]) -> bool:
+    """A first row of non-empty strings over a row that is not all strings is a header."""
+    if not first_row or not all(isinstance(value, str) and value.strip() for value in first_row):
+        return False
+    return second_row is None or not all(isinstance(value, str) for value in second_row if value is not None)
+
+
+def _read_sheet(file_path: str, sheet_name: Optional[str], header: Union[bool, str], batch_size: int) -> pd.DataFrame:
+    """Read a whole worksheet. Runs inside worker processes."""
+    source = XLSsource(file_path=file_path, sheet_name=sheet_name, header=header, batch_size=batch_size)
+    return source.extract_data()
 
-    def extract_data(self) -> pd.DataFrame:
-        with sqlite3.connect(self.connection_string) as conn:
-            data = pd.read_sql_query(self.query, conn)
-        return data.to_dict('records')
 
 class XLSsource(Datasource):
     """Excel worksheet datasource"""
-    def __init__(self, file_path: str=None, sheet_name: str=None, *args):
+    def __init__(self, file_path: str=None, sheet_name: str=None, *args,
+                 header: Union[bool, str]='infer', batch_size: int=10_000):
+        """
+        Args:
+            file_path: Path to the .xlsx workbook
+            sheet_name: Worksheet to read (defaults to the active sheet)
+            header: True if the first row holds column names, False if it
+                holds data, 'infer' to detect it
+            batch_size: Rows per batch yielded by iter_batches
+        """
         self.file_path = file_path
         self.sheet_name = sheet_name
+        self.header = header
+        self.batch_size = batch_size
+        self.columns = None
+
+    def with_columns(self, columns: List[Union[str, int]]) -> 'XLSsource':
+        """
+        Return a copy of this source that only reads the cell range spanning columns.
+        
+        Columns come back in sheet order. Rows are kept exactly as in a full
+        read (see iter_batches), so the row count does not depend on the
+        projection.
+        """
+        projected = copy.copy(self)
+        projected.columns = list(columns)
+        return projected
+    def _open(self):
+        from openpyxl import load_workbook
 
-    def extract_data(self) -> pd.DataFrame:
         if not os.path.exists(self.file_path):
             raise FileNotFoundError(f"File {self.file_path} does not exist")
-        workbook = load_workbook(self.file_path)
-        sheet = workbook[self.sheet_name]
-        data = []
-        for row in sheet.iter_rows(values_only=True):
-            data.append(row)
-        workbook.close()
-        data = pd.DataFrame(data)
+        # read_only streams rows from the XML instead of building the full object model
+        return load_workbook(self.file_path, read_only=True, data_only=True)
+
+    def sheet_names(self) -> List[str]:
+        """Names of the worksheets in the workbook."""
+        workbook = self._open()
+        try:
+            return list(workbook.sheetnames)
+        finally:
+            workbook.close()
+
+    def iter_batches(self, batch_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """
+        Stream the worksheet as DataFrame batches of at most batch_size rows.
+        
+        The workbook is opened in read-only mode, so memory is bounded by the
+        batch size rather than the sheet size. Column dtypes are inferred per
+        batch. Empty rows above the first row (the header, if any) are
+        skipped; every row below it, up to the last row of the sheet, is
+        kept, with empty rows coming back as missing values. Whether a row
+        is kept therefore never depends on cells outside the columns read.
+        """
+        batch_size = batch_size or self.batch_size
+        workbook = self._open()
+        try:
+            sheet = workbook[self.sheet_name] if self.sheet_name is not None else workbook.active
+            # only the leading rows are read in full, to find the first row and detect the header
+            leading = ((index, row) for index, row in enumerate(sheet.iter_rows(values_only=True), start=1)
+                       if any(value is not None for value in row))
+            first_index, first_row = next(leading, (None, None))
+            if first_row is None:
+                return
+            second_row = next(leading, (None, None))[1]
+            del leading
+
+            is_header = _is_header(first_row, second_row) if self.header == 'infer' else bool(self.header)
+            columns = [str(value) for value in first_row] if is_header else list(range(len(first_row)))
+            selected = None
+            low, high = 0, len(columns) - 1
+            if self.columns is not None:
+                missing = [column for column in self.columns if column not in columns]
+                if missing:
+                    raise ValueError(f"Columns {missing} not found in sheet")
+                positions = sorted(columns.index(column) for column in self.columns)
+                low, high = positions[0], positions[-1]
+                selected = [columns[position] for position in positions]
+                columns = columns[low:high + 1]
+            # data rows are read only within the cell range of the needed columns
+            rows = sheet.iter_rows(min_row=first_index + 1 if is_header else first_index,
+                                   min_col=low + 1, max_col=high + 1, values_only=True)
 
+            def to_frame(batch):
+                frame = pd.DataFrame.from_records(batch, columns=columns, coerce_float=True)
+                return frame if selected is None or selected == columns else frame[selected]
 
+            batch = []
+            for row in rows:
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    yield to_frame(batch)
+                    batch = []
+            if batch:
+                yield to_frame(batch)
+        finally:
+            workbook.close()
+
+    def extract_data(self) -> pd.DataFrame:
+        batches = list(self.iter_batches())
+        if not batches:
+            return pd.DataFrame()
+        return pd.concat(batches, ignore_index=True)
+
+    def extract_sheets(self, sheet_names: Optional[List[str]] = None,
+                       n_workers: Optional[int] = None) -> Dict[str, pd.DataFrame]:
+        """
+        Load several worksheets concurrently in a process pool.
+        
+        Args:
+            sheet_names: Worksheets to load (defaults to all of them)
+            n_workers: Number of worker processes (defaults to the CPU count)
+        
+        Returns:
+            Mapping of sheet name to DataFrame, in the requested order
+        """
+        sheet_names = sheet_names or self.sheet_names()
+        with ProcessPoolExecutor(max_workers=n_workers or os.cpu_count() or 1) as executor:
+            futures = [executor.submit(_read_sheet, self.file_path, name, self.header, self.batch_size)
+                       for name in sheet_names]
+            return {name: future.result() for name, future in zip(sheet_names, futures)}
 
 
+def load_workbooks(file_paths: List[str], sheet_name: Optional[str] = None, n_workers: Optional[int] = None,
+                   header: Union[bool, str] = 'infer', batch_size: int = 10_000) -> List[pd.DataFrame]:
+    """
+    Load one worksheet from each of several workbooks concurrently in a process pool.
+    
+    Args:
+        file_paths: Workbooks to load
+        sheet_name: Worksheet to read from each workbook (defaults to the active sheet)
+        n_workers: Number of worker processes (defaults to the CPU count)
+        header: As for XLSsource
+        batch_size: As for XLSsource
+    
+    Returns:
+        List of DataFrames in the order of file_paths
+    """
+    with ProcessPoolExecutor(max_workers=n_workers or os.cpu_count() or 1) as executor:
+        futures = [executor.submit(_read_sheet, path, sheet_name, header, batch_size) for path in file_paths]
+        return [future.result() for future in futures]
@@ -0,0 +1,182 @@
+from contextlib import contextmanager
+from typing import Any, BinaryIO, Dict, Iterator, Optional
+import hashlib
+import io
+import json
+import logging
+import os
+import tempfile
+import threading
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'dataruns', 'http')
+CHUNK_SIZE = 1 << 20
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """
+    Return the shared requests.Session, creating it on first use.
+
+    Reusing one session keeps TCP/TLS connections pooled across downloads.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _session = session
+        return _session
+
+
+class _TeeReader(io.RawIOBase):
+    """Binary stream over an HTTP response body that copies everything it reads to sink."""
+
+    def __init__(self, response, sink: BinaryIO):
+        self._raw = response.raw
+        self._sink = sink
+        self._leftover = b''
+        self.complete = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._leftover or self._raw.read(len(buffer), decode_content=True)
+        if not data:
+            self.complete = True
+            return 0
+        size = min(len(data), len(buffer))
+        buffer[:size] = data[:size]
+        self._leftover = data[size:]
+        self._sink.write(data[:size])
+        return size
+
+
+class HTTPCache:
+    """
+    On-disk cache of downloaded files keyed by URL.
+
+    Bodies are streamed to disk in chunks through a pooled requests.Session
+    and written to unique temporary files that atomically replace the cached
+    copy, so concurrent downloads never see partial files. Cached copies are
+    revalidated with If-None-Match/If-Modified-Since; a 304 response reuses
+    the cached file without transferring the body again.
+
+    Example:
+        >>> cache = HTTPCache()
+        >>> path = cache.fetch('https://example.com/data.csv')
+        >>> with cache.open('https://example.com/data.csv') as stream:
+        ...     frame = pd.read_csv(stream)  # parses while downloading
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, timeout: float = 60.0):
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.timeout = timeout
+
+    def path_for(self, url: str) -> str:
+        """Path of the cached copy of url."""
+        digest = hashlib.sha256(url.encode()).hexdigest()
+        return os.path.join(self.cache_dir, digest)
+
+    def _load_meta(self, url: str) -> Optional[Dict[str, Any]]:
+        path = self.path_for(url)
+        try:
+            with open(path + '.json', 'r') as file:
+                meta = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        return meta if os.path.exists(path) and meta.get('url') == url else None
+
+    def _request(self, url: str, meta: Optional[Dict[str, Any]]):
+        headers = {}
+        if meta is not None:
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+        response = get_session().get(url, headers=headers, stream=True, timeout=self.timeout)
+        if response.status_code not in (200, 304) or (response.status_code == 304 and meta is None):
+            response.close()
+            raise Exception(f"Failed to download file. Status code: {response.status_code}")
+        return response
+
+    def _finalize(self, url: str, response, tmp_path: str) -> str:
+        """Move a completed download into place and record its validators."""
+        path = self.path_for(url)
+        os.replace(tmp_path, path)
+        meta = {
+            'url': url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'size': os.path.getsize(path),
+        }
+        fd, meta_tmp = tempfile.mkstemp(dir=self.cache_dir, prefix='.meta-')
+        with os.fdopen(fd, 'w') as file:
+            json.dump(meta, file)
+        os.replace(meta_tmp, path + '.json')
+        logger.info(f"Downloaded {url} ({meta['size']} bytes)")
+        return path
+
+    @contextmanager
+    def open(self, url: str) -> Iterator[BinaryIO]:
+        """
+        Open url as a binary stream, downloading it only if the cache is stale.
+
+        A fresh download is parsed while it is being written to the cache,
+        so the body is only transferred once and never held fully in memory.
+        If the stream is not read to the end, the partial download is dropped.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        meta = self._load_meta(url)
+        response = self._request(url, meta)
+        if response.status_code == 304:
+            response.close()
+            logger.info(f"Using cached copy of {url}")
+            with open(self.path_for(url), 'rb') as file:
+                yield file
+            return
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix='.download-')
+        try:
+            with response, os.fdopen(fd, 'wb') as sink:
+                tee = _TeeReader(response, sink)
+                yield io.BufferedReader(tee, buffer_size=CHUNK_SIZE)
+            if tee.complete:
+                self._finalize(url, response, tmp_path)
+                tmp_path = None
+        finally:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    def fetch(self, url: str) -> str:
+        """Download url into the cache (unless the cached copy is still valid) and return its path."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        meta = self._load_meta(url)
+        response = self._request(url, meta)
+        if response.status_code == 304:
+            response.close()
+            logger.info(f"Using cached copy of {url}")
+            return self.path_for(url)
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix='.download-')
+        try:
+            with response, os.fdopen(fd, 'wb') as sink:
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    sink.write(chunk)
+            return self._finalize(url, response, tmp_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def __repr__(self):
+        return f"HTTPCache({self.cache_dir!r})"
@@ -0,0 +1,66 @@
+from typing import Any, Dict, Optional
+import json
+import os
+import tempfile
+import threading
+
+
+class WatermarkStore:
+    """
+    JSON file persisting the high-watermark of incremental extractions.
+
+    Each source is stored under its own key, so one file can track many
+    sources. Writes go to a temporary file that atomically replaces the
+    store, so a crash never leaves a half-written file behind.
+
+    Example:
+        >>> store = WatermarkStore('state/watermarks.json')
+        >>> delta = SQLiteSource('app.db', table_name='events').extract_incremental('id', store)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, 'r') as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+
+    def _write(self, state: Dict[str, Any]) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.watermarks-', suffix='.json')
+        try:
+            with os.fdopen(fd, 'w') as file:
+                json.dump(state, file, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the watermark stored for key."""
+        with self._lock:
+            return self._load().get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        """Persist value as the watermark for key."""
+        if hasattr(value, 'item'):
+            # numpy scalars are not JSON serializable
+            value = value.item()
+        with self._lock:
+            state = self._load()
+            state[key] = value
+            self._write(state)
+
+    def reset(self, key: Optional[str] = None) -> None:
+        """Forget the watermark of key, or of every source if key is None."""
+        with self._lock:
+            state = {} if key is None else {k: v for k, v in self._load().items() if k != key}
+            self._write(state)
+
+    def __repr__(self):
+        return f"WatermarkStore({self.path!r})"
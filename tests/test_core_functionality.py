@@ -109,6 +109,61 @@ def test_make_pipeline():
         traceback.print_exc()
         return False
 
+def test_compiled_pipeline():
+    """Test Make_Pipeline.build(compile=True)."""
+    print("Testing compiled pipeline...")
+    
+    from dataruns.core.pipeline import Make_Pipeline
+    from dataruns.core.transforms import StandardScaler, DropNA
+    
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(64, 3))
+    scaler = StandardScaler().fit(data)
+    
+    builder = Make_Pipeline().add(np.abs).add(np.sqrt, scaler)
+    plain = builder.build()
+    compiled = builder.build(compile=True, sample=data)
+    
+    # Intermediate ufunc stages write into preallocated buffers
+    assert [spec.buffered for spec in compiled.plan] == [True, True, False]
+    assert compiled.plan[-1].shape == (64, 3)
+    for _ in range(3):
+        assert np.allclose(compiled(data), plain(data))
+    # Results of earlier calls are not overwritten by later ones
+    first = compiled(data)
+    compiled(data * 2)
+    assert np.allclose(first, plain(data))
+    
+    # A different input shape retraces the plan
+    assert np.allclose(compiled(data[:10]), plain(data[:10]))
+    assert compiled.plan[0].shape == (10, 3)
+    
+    # Row filters ahead of buffered stages change shapes between calls
+    filtered = Make_Pipeline().add(DropNA(), np.abs, np.sqrt).build(compile=True, sample=data)
+    holes = data.copy()
+    holes[::4, 0] = np.nan
+    assert np.allclose(filtered(holes), np.sqrt(np.abs(holes[~np.isnan(holes).any(axis=1)])))
+    
+    # A last stage returning a view of a buffer still hands out independent results
+    from dataruns.core.transforms import SelectColumns
+    viewing = Make_Pipeline().add(np.abs, SelectColumns([0, 1])).build(compile=True, sample=data)
+    positive = np.abs(data) + 1
+    first = viewing(positive)
+    viewing(np.full_like(data, 5.0))
+    assert np.allclose(first, positive[:, :2])
+    sliced = Make_Pipeline().add(np.abs, lambda x: x[:, :2]).build(compile=True, sample=data)
+    first = sliced(data)
+    sliced(data * 5)
+    assert np.allclose(first, np.abs(data[:, :2]))
+    
+    # List inputs match the traced ndarray signature instead of retracing
+    rows = data.tolist()
+    compiled(rows)
+    steps = compiled._steps
+    assert np.allclose(compiled(rows), plain(data)) and compiled._steps is steps
+    print("Compiled pipeline test passed ✓")
+    return True
+
 def test_csv_source():
     """Test CSV source functionality if available."""
     print("Testing CSV source...")
@@ -155,6 +210,7 @@ def main():
         test_pipeline_basic,
         test_pipeline_chaining,
         test_make_pipeline,
+        test_compiled_pipeline,
         test_csv_source
     ]
     
@@ -0,0 +1,117 @@
+"""
+Tests for LazyPipeline and its logical plan optimizer.
+"""
+
+import sys
+import os
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import numpy as np
+import pandas as pd
+
+
+def _sales(n=600):
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame({
+        'price': rng.normal(10, 3, n),
+        'qty': rng.integers(0, 10, n).astype(float),
+        'region': rng.choice(['EU', 'US', 'APAC'], n),
+        'note': ['some free text'] * n,
+    })
+    frame.loc[::7, 'price'] = np.nan
+    return frame
+
+
+def test_lazy_optimizer_rules():
+    """Filters move ahead of safe stages, projections move down and renames/projections are simplified."""
+    from dataruns.core import (LazyPipeline, FillNA, StandardScaler, MinMaxScaler, DropNA, RenameColumns,
+                               SelectColumns, FilterRows, col)
+    from dataruns.core.lazy import Scan, Filter, Project, Rename, Apply
+    from dataruns.source import CSVSource
+
+    frame = _sales()
+    fill = FillNA(method='mean').fit(frame[['price', 'qty']])
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'sales.csv')
+        frame.to_csv(path, index=False)
+        stages = [
+            fill,
+            RenameColumns({'qty': 'quantity', 'region': 'region'}),
+            FilterRows(col('region') == 'EU'),
+            SelectColumns(['price', 'quantity', 'region']),
+            SelectColumns(['price', 'quantity']),
+        ]
+        lazy = LazyPipeline(CSVSource(file_path=path), *stages)
+        plan = lazy.optimized_plan()
+        kinds = [type(node) for node in plan]
+        assert kinds == [Scan, Project, Apply, Rename, Project]
+        scan = plan[0]
+        assert scan.predicate is not None and set(scan.columns) == {'price', 'qty'}
+        assert plan[3].mapping == {'qty': 'quantity'}
+
+        eager = frame.copy()
+        for stage in stages:
+            eager = stage(eager)
+        pd.testing.assert_frame_equal(lazy.collect(), eager)
+
+        # a fitted scaler rewrites every column, an unfitted one learns from its rows: both are barriers
+        for barrier in (StandardScaler().fit(frame[['price']]), StandardScaler()):
+            blocked = LazyPipeline(CSVSource(file_path=path), barrier, FilterRows(col('region') == 'EU'))
+            assert [type(node) for node in blocked.optimized_plan()] == [Scan, Apply, Filter]
+
+        # statistics fitted on arrays are positional: no projection may run before them
+        numeric = frame[['price', 'qty']]
+        for scaler in (StandardScaler().fit(numeric.to_numpy()), MinMaxScaler().fit(numeric.to_numpy()),
+                       StandardScaler().fit(numeric)):
+            stages = [SelectColumns(['price', 'qty']), scaler, SelectColumns(['qty'])]
+            lazy = LazyPipeline(CSVSource(file_path=path), *stages)
+            eager = frame.copy()
+            for stage in stages:
+                eager = stage(eager)
+            pd.testing.assert_frame_equal(lazy.collect(), eager)
+        positional = LazyPipeline(CSVSource(file_path=path), SelectColumns(['price', 'qty']),
+                                  StandardScaler().fit(numeric.to_numpy()), SelectColumns(['qty']))
+        assert [type(node) for node in positional.optimized_plan()] == [Scan, Project, Apply, Project]
+
+        # filters commute with DropNA and are merged with each other
+        merged = LazyPipeline(CSVSource(file_path=path), DropNA(), FilterRows(col('qty') > 3),
+                              FilterRows(col('price') < 12)).optimized_plan()
+        assert [type(node) for node in merged] == [Scan, Apply]
+        assert merged[0].predicate.columns() == {'qty', 'price'}
+    print("Lazy optimizer rules test passed ✓")
+
+
+def test_lazy_explain_and_sqlite():
+    """explain() reports estimated sizes; filters and projections reach SQLite."""
+    import sqlite3
+    from dataruns.core import Pipeline, SelectColumns, FilterRows, col
+    from dataruns.source import SQLiteSource
+
+    frame = _sales()
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'sales.db')
+        with sqlite3.connect(db_path) as conn:
+            frame.to_sql('sales', conn, index=False)
+
+        pipeline = Pipeline(FilterRows(col('qty') >= 5), SelectColumns(['region', 'price']))
+        lazy = pipeline.lazy(SQLiteSource(db_path, table_name='sales'))
+        scan = lazy.optimized_plan()[0]
+        assert scan.columns == ['region', 'price'] and scan.predicate is not None
+
+        result = lazy.collect()
+        expected = pipeline(frame).reset_index(drop=True)
+        pd.testing.assert_frame_equal(result, expected)
+
+        # the scan row estimate applies the default filter selectivity
+        report = lazy.explain().splitlines()
+        assert len(report) == 3 and report[1].startswith('Scan SQLiteSource')
+        assert f"~{len(frame) * 0.33:,.0f}" in report[1]
+        unoptimized = lazy.explain(optimized=False).splitlines()
+        assert len(unoptimized) == 4 and f"~{len(frame):,}" in unoptimized[1]
+    print("Lazy explain test passed ✓")
+
+
+if __name__ == "__main__":
+    test_lazy_optimizer_rules()
+    test_lazy_explain_and_sqlite()
@@ -0,0 +1,65 @@
+"""
+Tests for pipeline instrumentation hooks.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import numpy as np
+import pandas as pd
+
+
+def test_pipeline_profiler_records_stages():
+    """A Profiler attached to a Pipeline records every stage."""
+    from dataruns.core import Pipeline, Profiler, FillNA, StandardScaler
+
+    data = np.random.default_rng(0).normal(size=(1000, 5))
+    scaler = StandardScaler().fit(data)
+    profiler = Profiler(trace_memory=True)
+    pipeline = Pipeline(FillNA(value=0.0), scaler).instrument(profiler)
+
+    result = pipeline(data)
+    pipeline(data)
+    assert np.allclose(result, scaler.transform(data))
+    assert [record.name for record in profiler.records] == ['FillNA', 'StandardScaler'] * 2
+    first = profiler.records[0]
+    assert first.input_shape == (1000, 5) and first.output_bytes == data.nbytes
+    assert first.peak_bytes >= data.nbytes
+    summary = profiler.summary()
+    assert [entry['calls'] for entry in summary] == [2, 2]
+    assert 'StandardScaler' in profiler.report()
+
+    pipeline.instrument()
+    pipeline(data)
+    assert len(profiler.records) == 4
+    print("Pipeline profiler test passed ✓")
+
+
+def test_composer_custom_hooks():
+    """Custom hooks on a TransformComposer see stage start and end events in order."""
+    from dataruns.core import TransformComposer, StageHook, DropNA, MinMaxScaler
+
+    events = []
+
+    class Recorder(StageHook):
+        def on_stage_start(self, index, name, data):
+            events.append(('start', name, len(data)))
+
+        def on_stage_end(self, record):
+            events.append(('end', record.name, record.output_shape))
+
+    frame = pd.DataFrame({'a': [1.0, np.nan, 3.0], 'b': [4.0, 5.0, 6.0]})
+    composer = TransformComposer(DropNA(), MinMaxScaler())
+    composer.fit(frame)
+    composer.instrument(Recorder()).transform(frame)
+    assert events == [
+        ('start', 'DropNA', 3), ('end', 'DropNA', (2, 2)),
+        ('start', 'MinMaxScaler', 2), ('end', 'MinMaxScaler', (2, 2)),
+    ]
+    print("Composer hooks test passed ✓")
+
+
+if __name__ == "__main__":
+    test_pipeline_profiler_records_stages()
+    test_composer_custom_hooks()
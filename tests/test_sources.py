@@ -0,0 +1,523 @@
+"""
+Tests for the data sources.
+"""
+
+import sys
+import os
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import numpy as np
+import pandas as pd
+
+
+def _write_csv(frame, directory, name='data.csv'):
+    path = os.path.join(directory, name)
+    frame.to_csv(path, index=False)
+    return path
+
+
+def test_csv_source_typed_columns():
+    """CSVSource parses numeric columns into numeric dtypes."""
+    from dataruns.source.datasource import CSVSource
+    from dataruns.core.transforms import StandardScaler
+
+    frame = pd.DataFrame({'price': [1.5, 2.5, 3.5], 'qty': [1, 2, 3], 'name': ['a', 'b', 'c']})
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write_csv(frame, tmp)
+        data = CSVSource(file_path=path).extract_data()
+        assert data['price'].dtype == np.float64
+        assert data['qty'].dtype == np.int64
+
+        numeric = CSVSource(file_path=path, usecols=['price', 'qty'], dtype={'qty': 'float32'}).extract_data()
+        assert list(numeric.columns) == ['price', 'qty']
+        assert numeric['qty'].dtype == np.float32
+        StandardScaler().fit_transform(numeric)
+    print("CSV typed columns test passed ✓")
+
+
+def test_csv_source_iter_chunks():
+    """iter_chunks yields typed chunks that add up to the full file."""
+    from dataruns.source.datasource import CSVSource
+
+    frame = pd.DataFrame({'a': np.arange(25), 'b': np.arange(25) * 0.5})
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write_csv(frame, tmp)
+        chunks = list(CSVSource(file_path=path).iter_chunks(chunksize=10))
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), frame)
+    print("CSV chunked reader test passed ✓")
+
+
+def test_csv_source_parallel_partitions():
+    """Parallel byte-range parsing matches the single-process reader."""
+    from dataruns.source.datasource import CSVSource
+
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame({'a': np.arange(1000), 'b': rng.normal(size=1000), 'c': ['x', 'y'] * 500})
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write_csv(frame, tmp)
+        source = CSVSource(file_path=path)
+        pd.testing.assert_frame_equal(source.extract_parallel(n_workers=2), source.extract_data())
+        partitions = list(source.iter_partitions(n_workers=1, n_partitions=7))
+        assert len(partitions) == 7
+        pd.testing.assert_frame_equal(pd.concat(partitions, ignore_index=True), frame)
+
+        # header and names are translated, row-counting options are rejected
+        expected = pd.read_csv(path, header=None, names=['x', 'y', 'z'])
+        parsed = CSVSource(file_path=path, header=None, names=['x', 'y', 'z']).extract_parallel(n_workers=2)
+        pd.testing.assert_frame_equal(parsed, expected)
+        renamed = CSVSource(file_path=path, header=0, names=['x', 'y', 'z']).extract_parallel(n_workers=1)
+        pd.testing.assert_frame_equal(renamed, frame.set_axis(['x', 'y', 'z'], axis=1))
+        for options in ({'skiprows': 2}, {'nrows': 10}, {'header': 1}):
+            try:
+                list(CSVSource(file_path=path, **options).iter_partitions(n_workers=1))
+                raise AssertionError(f"{options} should be rejected")
+            except ValueError:
+                pass
+
+        # dtypes come from the first partition, even where a later one has nothing to infer from
+        sparse = pd.DataFrame({'a': np.arange(100), 'c': ['x'] * 50 + [None] * 50})
+        path = _write_csv(sparse, tmp)
+        partitions = list(CSVSource(file_path=path).iter_partitions(n_workers=1, n_partitions=4))
+        assert partitions[-1]['c'].isna().all()
+        assert partitions[-1]['c'].dtype == partitions[0]['c'].dtype != np.float64
+        path = _write_csv(pd.DataFrame({'a': pd.array([1] * 50 + [None] * 50, dtype='Int64')}), tmp)
+        gaps = pd.DataFrame({'a': [1.0] * 50 + [np.nan] * 50})
+        try:
+            list(CSVSource(file_path=path).iter_partitions(n_workers=1, n_partitions=4))
+            raise AssertionError("an int column gaining missing values should raise")
+        except ValueError as error:
+            assert 'dtype=' in str(error)
+        partitions = list(CSVSource(file_path=path, dtype={'a': 'float64'}).iter_partitions(n_workers=1, n_partitions=4))
+        pd.testing.assert_frame_equal(pd.concat(partitions, ignore_index=True), gaps)
+    print("CSV parallel reader test passed ✓")
+
+
+def test_csv_source_cached_download():
+    """URL sources stream into the cache and are revalidated instead of re-downloaded."""
+    import functools
+    import threading
+    from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+    from dataruns.source import CSVSource, HTTPCache
+
+    frame = pd.DataFrame({'id': np.arange(500), 'value': np.arange(500) * 0.5})
+    statuses = []
+
+    class Handler(SimpleHTTPRequestHandler):
+        def log_request(self, code='-', size='-'):
+            statuses.append(int(code))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        serve_dir = os.path.join(tmp, 'serve')
+        os.makedirs(serve_dir)
+        _write_csv(frame, serve_dir)
+        server = ThreadingHTTPServer(('127.0.0.1', 0), functools.partial(Handler, directory=serve_dir))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/data.csv"
+            cache_dir = os.path.join(tmp, 'cache')
+            source = CSVSource(url=url, cache_dir=cache_dir)
+
+            pd.testing.assert_frame_equal(source.extract_data(), frame)
+            cached = HTTPCache(cache_dir).path_for(url)
+            assert os.path.exists(cached) and os.path.exists(cached + '.json')
+            assert not [name for name in os.listdir(cache_dir) if name.startswith('.')]
+
+            pd.testing.assert_frame_equal(source.extract_data(), frame)
+            assert source._download_csv(url) == cached
+            assert statuses == [200, 304, 304]
+        finally:
+            server.shutdown()
+            server.server_close()
+    print("CSV cached download test passed ✓")
+
+
+def _make_sqlite(directory, n_rows=100):
+    import sqlite3
+    
+    path = os.path.join(directory, 'data.db')
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, price REAL, name TEXT)")
+        conn.executemany("INSERT INTO items VALUES (?, ?, ?)",
+                         [(i, i * 1.5, f"item{i}") for i in range(1, n_rows + 1)])
+    return path
+
+
+def test_sqlite_source_columnar():
+    """SQLiteSource returns a typed DataFrame or a dict of numpy arrays."""
+    from dataruns.source.datasource import SQLiteSource
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _make_sqlite(tmp)
+        frame = SQLiteSource(path, "SELECT * FROM items").extract_data()
+        assert isinstance(frame, pd.DataFrame) and frame.shape == (100, 3)
+        assert frame['price'].dtype == np.float64 and frame['id'].dtype == np.int64
+
+        arrays = SQLiteSource(path, "SELECT id, price FROM items", as_arrays=True).extract_data()
+        assert set(arrays) == {'id', 'price'}
+        assert np.array_equal(arrays['id'], np.arange(1, 101))
+    print("SQLite columnar test passed ✓")
+
+
+def test_sqlite_source_iter_chunks():
+    """iter_chunks streams the result with fetchmany in bounded chunks."""
+    from dataruns.source.datasource import SQLiteSource
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _make_sqlite(tmp)
+        source = SQLiteSource(path, "SELECT * FROM items ORDER BY id")
+        chunks = list(source.iter_chunks(chunksize=30))
+        assert [len(chunk) for chunk in chunks] == [30, 30, 30, 10]
+        pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), source.extract_data())
+    print("SQLite chunked reader test passed ✓")
+
+
+def test_sqlite_source_sharded():
+    """Sharded reads return the same rows, in key order, as a single query."""
+    from dataruns.source.datasource import SQLiteSource
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _make_sqlite(tmp, n_rows=257)
+        source = SQLiteSource(path, table_name='items')
+        expected = source.extract_data()
+        for executor in ('thread', 'process'):
+            sharded = source.extract_sharded(n_shards=5, n_workers=2, executor=executor)
+            pd.testing.assert_frame_equal(sharded, expected)
+
+        query = SQLiteSource(path, query="SELECT id, price FROM items WHERE id > 57")
+        shards = list(query.iter_shards(n_shards=4, key='id', n_workers=2, ordered=False, executor='thread'))
+        assert len(shards) == 4
+        combined = pd.concat(shards).sort_values('id', ignore_index=True)
+        pd.testing.assert_frame_equal(combined, query.extract_data())
+
+        # NULL keys get their own shard, REAL keys fall into the integer ranges, text keys are rejected
+        import sqlite3
+        with sqlite3.connect(path) as conn:
+            conn.execute("CREATE TABLE events (k, v INTEGER)")
+            conn.executemany("INSERT INTO events VALUES (?, ?)",
+                             [(None, 0), (1.5, 1), (3, 2), (None, 3), (7.25, 4), (10, 5), (10.5, 6)])
+        events = SQLiteSource(path, query="SELECT k, v FROM events")
+        shards = list(events.iter_shards(n_shards=3, key='k', n_workers=1, executor='thread'))
+        assert len(shards) == 4 and shards[0]['k'].isna().all()
+        assert [list(shard['v']) for shard in shards] == [[0, 3], [1, 2], [], [4, 5, 6]]
+        with sqlite3.connect(path) as conn:
+            conn.execute("INSERT INTO events VALUES ('x', 7)")
+        try:
+            events.extract_sharded(key='k', n_workers=1, executor='thread')
+            raise AssertionError("text keys should be rejected")
+        except ValueError:
+            pass
+    print("SQLite sharded reader test passed ✓")
+
+
+def test_sqlite_incremental_extraction():
+    """Only new rows are extracted, and fitted statistics follow the deltas."""
+    import sqlite3
+    from dataruns.source import SQLiteSource, WatermarkStore
+    from dataruns.core.transforms import StandardScaler, TransformComposer
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _make_sqlite(tmp, n_rows=50)
+        store = WatermarkStore(os.path.join(tmp, 'state', 'watermarks.json'))
+        source = SQLiteSource(path, query="SELECT id, price FROM items")
+        preprocessing = TransformComposer(StandardScaler())
+
+        first = source.extract_incremental('id', store)
+        assert len(first) == 50
+        preprocessing.partial_fit(first)
+
+        with sqlite3.connect(path) as conn:
+            conn.executemany("INSERT INTO items VALUES (?, ?, ?)", [(i, i * 0.25, 'new') for i in range(51, 61)])
+        delta = source.extract_incremental('id', store, commit=False)
+        assert list(delta['id']) == list(range(51, 61))
+        # Not committed yet, so the same delta is extracted again
+        assert len(source.extract_incremental('id', store, commit=False)) == 10
+        source.commit_watermark(store)
+        assert store.get(source.watermark_key('id')) == 60
+        assert len(source.extract_incremental('id', store)) == 0
+
+        preprocessing.partial_fit(delta)
+        full = StandardScaler().fit(source.extract_data())
+        pd.testing.assert_series_equal(preprocessing.transforms[0].mean_, full.mean_)
+        pd.testing.assert_series_equal(preprocessing.transforms[0].std_, full.std_)
+
+        # a row committed later with the watermark's value is only caught with key_column
+        with sqlite3.connect(path) as conn:
+            conn.execute("CREATE TABLE events (id INTEGER PRIMARY KEY, updated_at TEXT)")
+            conn.executemany("INSERT INTO events VALUES (?, ?)", [(1, '2024-01-01'), (2, '2024-01-02'), (3, '2024-01-02')])
+        events = SQLiteSource(path, table_name='events')
+        assert len(events.extract_incremental('updated_at', store)) == 3
+        assert list(events.extract_incremental('updated_at', store, key_column='id')['id']) == [1, 2, 3]
+        assert store.get(events.watermark_key('updated_at', 'id')) == {'value': '2024-01-02', 'keys': [2, 3]}
+        with sqlite3.connect(path) as conn:
+            conn.execute("INSERT INTO events VALUES (4, '2024-01-02')")
+        assert len(events.extract_incremental('updated_at', store)) == 0
+        assert list(events.extract_incremental('updated_at', store, key_column='id')['id']) == [4]
+        assert len(events.extract_incremental('updated_at', store, key_column='id')) == 0
+        with sqlite3.connect(path) as conn:
+            conn.execute("INSERT INTO events VALUES (5, '2024-01-03')")
+        assert list(events.extract_incremental('updated_at', store, key_column='id')['id']) == [5]
+        assert store.get(events.watermark_key('updated_at', 'id')) == {'value': '2024-01-03', 'keys': [5]}
+    print("SQLite incremental extraction test passed ✓")
+
+
+def test_extract_many_concurrent():
+    """extract_many overlaps blocking extractions and keeps results in input order."""
+    import asyncio
+    import time
+    from dataruns.source import CSVSource, SQLiteSource, extract_many, extract_many_async
+    from dataruns.source.datasource import Datasource
+
+    class SlowSource(Datasource):
+        def __init__(self, value, delay):
+            self.value, self.delay = value, delay
+
+        def extract_data(self):
+            time.sleep(self.delay)
+            return self.value
+
+    with tempfile.TemporaryDirectory() as tmp:
+        frame = pd.DataFrame({'a': [1, 2, 3]})
+        csv_path = _write_csv(frame, tmp)
+        db_path = _make_sqlite(tmp, n_rows=10)
+        sources = [CSVSource(file_path=csv_path), SQLiteSource(db_path, table_name='items')]
+        csv_data, sql_data = extract_many(sources, max_concurrency=2, executor='process')
+        pd.testing.assert_frame_equal(csv_data, frame)
+        assert len(sql_data) == 10
+
+    slow = [SlowSource(index, delay) for index, delay in enumerate([0.3, 0.1, 0.2, 0.1])]
+    start = time.perf_counter()
+    assert extract_many(slow, max_concurrency=4) == [0, 1, 2, 3]
+    assert time.perf_counter() - start < 0.6
+
+    completed = extract_many(slow, max_concurrency=4, ordered=False)
+    assert sorted(completed) == [(0, 0), (1, 1), (2, 2), (3, 3)]
+    assert completed[-1] == (0, 0)
+    assert asyncio.run(extract_many_async(slow, max_concurrency=2)) == [0, 1, 2, 3]
+    print("Concurrent extraction test passed ✓")
+
+
+def test_columnar_cache():
+    """Extracted data is cached as memory-mapped columns and invalidated when the file changes."""
+    from dataruns.source import CSVSource, SQLiteSource, ColumnarCache, load_data
+
+    frame = pd.DataFrame({
+        'id': np.arange(200),
+        'price': np.linspace(0.0, 1.0, 200),
+        'name': ['item'] * 199 + [None],
+    })
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write_csv(frame, tmp)
+        cache = ColumnarCache(os.path.join(tmp, 'cache'))
+        source = CSVSource(file_path=path, parse_dates=False)
+
+        cold = cache.extract(source)
+        warm = cache.extract(CSVSource(file_path=path, parse_dates=False))
+        pd.testing.assert_frame_equal(warm, cold)
+        base = warm['price'].to_numpy()
+        while base.base is not None and not isinstance(base, np.memmap):
+            base = base.base
+        assert isinstance(base, np.memmap)
+        warm.loc[0, 'price'] = -1.0  # copy-on-write mapping, the cache is untouched
+        assert cache.extract(source).loc[0, 'price'] == 0.0
+
+        # touching the file keeps the entry valid, changing it does not
+        os.utime(path, ns=(0, 0))
+        assert cache.load(source) is not None
+        info = cache.cache_info()
+        assert (info['hits'], info['misses']) == (3, 1)
+        assert info['bytes_saved'] == 3 * os.path.getsize(path)
+        _write_csv(frame.head(10), tmp)
+        assert len(cache.extract(source)) == 10
+        assert cache.cache_info()['misses'] == 2
+
+        pd.testing.assert_frame_equal(load_data(path, cache=cache, parse_dates=False), frame.head(10))
+        assert cache.cache_info()['hits'] == 4
+
+        db_path = _make_sqlite(tmp, n_rows=50)
+        sql_source = SQLiteSource(db_path, table_name='items', as_arrays=True)
+        first = cache.extract(sql_source)
+        second = cache.extract(sql_source)
+        assert list(second) == list(first)
+        for name in first:
+            assert np.array_equal(second[name], first[name])
+
+        # WAL commits leave the main database file untouched until a checkpoint
+        import sqlite3
+        from contextlib import closing
+        with closing(sqlite3.connect(db_path)) as writer:
+            writer.execute("PRAGMA journal_mode=WAL")
+            writer.execute("PRAGMA wal_autocheckpoint=0")
+            assert len(cache.extract(sql_source)['id']) == 50
+            db_stat = os.stat(db_path)
+            writer.execute("INSERT INTO items VALUES (51, 76.5, 'item51')")
+            writer.commit()
+            assert os.stat(db_path).st_mtime_ns == db_stat.st_mtime_ns
+            assert len(cache.extract(sql_source)['id']) == 51
+            hits = cache.cache_info()['hits']
+            assert len(cache.extract(sql_source)['id']) == 51
+            assert cache.cache_info()['hits'] == hits + 1
+            writer.execute("ALTER TABLE items ADD COLUMN qty INTEGER")
+            writer.commit()
+            assert 'qty' in cache.extract(sql_source)
+    print("Columnar cache test passed ✓")
+
+
+def _make_workbook(directory, name='data.xlsx', sheets=('first', 'second'), n_rows=25):
+    from openpyxl import Workbook
+
+    path = os.path.join(directory, name)
+    workbook = Workbook()
+    workbook.remove(workbook.active)
+    for index, sheet_name in enumerate(sheets):
+        sheet = workbook.create_sheet(sheet_name)
+        sheet.append(['id', 'value', 'label'])
+        for i in range(n_rows):
+            sheet.append([i, i * 0.5 + index, f"row{i}"])
+    workbook.save(path)
+    return path
+
+
+def test_xls_source_streaming():
+    """XLSsource streams typed batches and detects the header row."""
+    from dataruns.source.datasource import XLSsource
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _make_workbook(tmp)
+        source = XLSsource(file_path=path, sheet_name='second', batch_size=10)
+        batches = list(source.iter_batches())
+        assert [len(batch) for batch in batches] == [10, 10, 5]
+        data = source.extract_data()
+        assert list(data.columns) == ['id', 'value', 'label']
+        assert data['id'].dtype == np.int64 and data['value'].dtype == np.float64
+        assert data['value'].iloc[0] == 1.0
+
+        raw = XLSsource(file_path=path, sheet_name='first', header=False).extract_data()
+        assert raw.shape == (26, 3) and raw.iloc[0, 0] == 'id'
+
+        # empty rows below the header are kept as missing values, with or without a projection
+        from unittest import mock
+        from openpyxl import load_workbook
+        from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+        workbook = load_workbook(path)
+        workbook['second'].append([None, None, 'sparse'])
+        workbook['second'].append([])
+        workbook['second'].append([25, 13.5, 'row25'])
+        workbook.save(path)
+        full = XLSsource(file_path=path, sheet_name='second', batch_size=10).extract_data()
+        projected = XLSsource(file_path=path, sheet_name='second', batch_size=10).with_columns(['value', 'id'])
+        with mock.patch.object(ReadOnlyWorksheet, 'iter_rows', autospec=True,
+                               side_effect=ReadOnlyWorksheet.iter_rows) as iter_rows:
+            batches = list(projected.iter_batches())
+        # only the header lookup reads full rows, data rows are read within columns A:B
+        assert [call.kwargs.get('max_col') for call in iter_rows.call_args_list] == [None, 2]
+        assert [len(batch) for batch in batches] == [10, 10, 8]
+        data = pd.concat(batches, ignore_index=True)
+        assert len(data) == len(full) == 28 and list(data.columns) == ['id', 'value']
+        assert data.iloc[25:27].isna().all().all() and full.iloc[26].isna().all()
+        pd.testing.assert_frame_equal(data, full[['id', 'value']])
+    print("XLS streaming test passed ✓")
+
+
+def test_xls_parallel_sheets_and_workbooks():
+    """Several sheets and workbooks load concurrently, in the requested order."""
+    from dataruns.source.datasource import XLSsource, load_workbooks
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _make_workbook(tmp)
+        sheets = XLSsource(file_path=path).extract_sheets(n_workers=2)
+        assert list(sheets) == ['first', 'second']
+        pd.testing.assert_frame_equal(sheets['second'], XLSsource(file_path=path, sheet_name='second').extract_data())
+
+        other = _make_workbook(tmp, name='other.xlsx', sheets=('only',), n_rows=7)
+        frames = load_workbooks([other, path], n_workers=2)
+        assert [len(frame) for frame in frames] == [7, 25]
+    print("XLS parallel load test passed ✓")
+
+
+def test_projection_pushdown():
+    """A leading SelectColumns is pushed into CSV, SQLite and Excel sources."""
+    from dataruns.core import Pipeline, SelectColumns, FillNA, TransformComposer, MinMaxScaler, plan
+    from dataruns.source import CSVSource, SQLiteSource, XLSsource
+
+    frame = pd.DataFrame({'a': [1.0, np.nan, 3.0], 'b': ['x', 'y', 'z'], 'c': [4.0, 5.0, 6.0]})
+    pipeline = Pipeline(SelectColumns(['c', 'a']), FillNA(value=0.0))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write_csv(frame, tmp)
+        csv_plan = plan(CSVSource(file_path=path), pipeline)
+        assert csv_plan.pushed_down and csv_plan.scan.usecols == ['c', 'a']
+        assert list(csv_plan.scan.extract_data().columns) == ['a', 'c']
+        pd.testing.assert_frame_equal(csv_plan.run(), pipeline(CSVSource(file_path=path).extract_data()))
+        assert 'pushed down' in csv_plan.explain()
+
+        db_path = _make_sqlite(tmp, n_rows=20)
+        sql_plan = plan(SQLiteSource(db_path, table_name='items'), Pipeline(SelectColumns(['price', 'id'])))
+        assert list(sql_plan.scan.extract_data().columns) == ['price', 'id']
+        assert list(sql_plan.run().columns) == ['price', 'id']
+        shards = pd.concat(sql_plan.scan.iter_shards(n_shards=2, n_workers=1, executor='thread'))
+        assert list(shards.columns) == ['price', 'id'] and len(shards) == 20
+
+        xls_path = _make_workbook(tmp, sheets=('first',), n_rows=12)
+        full = XLSsource(file_path=xls_path).extract_data()
+        composer = TransformComposer(SelectColumns(['value', 'id']), MinMaxScaler())
+        xls_plan = plan(XLSsource(file_path=xls_path), composer)
+        assert list(xls_plan.scan.extract_data().columns) == ['id', 'value']
+        pd.testing.assert_frame_equal(xls_plan.run(), MinMaxScaler().fit_transform(full[['value', 'id']]))
+
+        assert not plan(CSVSource(file_path=path), Pipeline(FillNA(value=0.0))).pushed_down
+    print("Projection pushdown test passed ✓")
+
+
+def test_predicate_pushdown():
+    """Leading FilterRows predicates become WHERE clauses and per-chunk CSV filters."""
+    from dataruns.core import Pipeline, SelectColumns, FilterRows, col, plan
+    from dataruns.source import CSVSource, SQLiteSource
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = _make_sqlite(tmp, n_rows=100)
+        pipeline = Pipeline(SelectColumns(['id', 'price']), FilterRows((col('price') >= 20) & (col('id') < 60)))
+        sql_plan = plan(SQLiteSource(db_path, table_name='items'), pipeline)
+        assert sql_plan.predicate is not None and 'WHERE' in sql_plan.scan._statement()[0]
+        expected = pipeline(SQLiteSource(db_path, table_name='items').extract_data())
+        result = sql_plan.run()
+        pd.testing.assert_frame_equal(result.reset_index(drop=True), expected.reset_index(drop=True))
+        shards = pd.concat(sql_plan.scan.iter_shards(n_shards=3, n_workers=1, executor='thread'))
+        assert list(shards['id']) == list(expected['id'])
+
+        frame = SQLiteSource(db_path, table_name='items').extract_data()
+        path = _write_csv(frame, tmp)
+        # a filter ahead of the projection keeps its column in the scan
+        csv_pipeline = Pipeline(FilterRows(col('price') < 10), SelectColumns(['name']))
+        csv_plan = plan(CSVSource(file_path=path), csv_pipeline)
+        assert csv_plan.columns == ['name', 'price'] and csv_plan.predicate is not None
+        pd.testing.assert_frame_equal(csv_plan.run(), csv_pipeline(CSVSource(file_path=path).extract_data()))
+        # a filter on a column the projection dropped is not pushed down
+        dropped = plan(CSVSource(file_path=path), Pipeline(SelectColumns(['id', 'name']), FilterRows(col('price') < 10)))
+        assert dropped.columns == ['id', 'name'] and dropped.predicate is None
+
+        # sources evaluate predicates on columns they do not return
+        scan = CSVSource(file_path=path).with_columns(['name']).with_predicate(col('price') < 10)
+        chunks = list(scan.iter_chunks(chunksize=7))
+        assert all(list(chunk.columns) == ['name'] for chunk in chunks)
+        assert sum(len(chunk) for chunk in chunks) == int((frame['price'] < 10).sum())
+        filtered = CSVSource(file_path=path).with_predicate(col('price') < 10)
+        pd.testing.assert_frame_equal(filtered.extract_data(), frame[frame['price'] < 10])
+    print("Predicate pushdown test passed ✓")
+
+
+if __name__ == "__main__":
+    test_csv_source_typed_columns()
+    test_csv_source_iter_chunks()
+    test_csv_source_parallel_partitions()
+    test_csv_source_cached_download()
+    test_sqlite_source_columnar()
+    test_sqlite_source_iter_chunks()
+    test_sqlite_source_sharded()
+    test_sqlite_incremental_extraction()
+    test_extract_many_concurrent()
+    test_columnar_cache()
+    test_xls_source_streaming()
+    test_xls_parallel_sheets_and_workbooks()
+    test_projection_pushdown()
+    test_predicate_pushdown()
@@ -0,0 +1,107 @@
+"""
+Tests for the SpeedUp result cache.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import numpy as np
+import pandas as pd
+
+
+def test_speedup_decorator_hits_and_misses():
+    """Identical inputs are served from the cache."""
+    from dataruns.core.pipeline import SpeedUp
+
+    calls = []
+
+    @SpeedUp(max_bytes=1 << 20)
+    def square(data):
+        calls.append(1)
+        return data ** 2
+
+    data = np.arange(100, dtype=np.float64)
+    first = square(data)
+    second = square(data.copy())
+    assert np.array_equal(first, second)
+    assert len(calls) == 1
+    square(data + 1)
+    info = square.cache_info()
+    assert info['hits'] == 1 and info['misses'] == 2, info
+    print("SpeedUp decorator test passed ✓")
+
+
+def test_speedup_pipeline_wrapper_with_dataframe():
+    """SpeedUp wraps a Pipeline and fingerprints DataFrames by content."""
+    from dataruns.core.pipeline import Pipeline, SpeedUp
+    from dataruns.core.transforms import StandardScaler
+
+    df = pd.DataFrame({'a': [1.0, 2.0, 3.0], 'b': ['x', 'y', 'z']})
+    scaler = StandardScaler().fit(df[['a']])
+    cached = SpeedUp(Pipeline(lambda d: d[['a']], scaler))
+
+    pd.testing.assert_frame_equal(cached(df), cached(df.copy()))
+    changed = df.copy()
+    changed.loc[2, 'b'] = 'w'
+    cached(changed)
+    assert cached.hits == 1 and cached.misses == 2
+    print("SpeedUp pipeline wrapper test passed ✓")
+
+
+def test_speedup_results_and_fitted_state():
+    """Mutating a result leaves the cache intact and refitting a transform invalidates it."""
+    from dataruns.core.pipeline import Pipeline, SpeedUp
+    from dataruns.core.transforms import StandardScaler
+
+    data = np.array([[1.0], [2.0], [3.0]])
+    scaler = StandardScaler().fit(data)
+    cached = SpeedUp(Pipeline(scaler))
+    first = cached(data)
+    expected = first.copy()
+    first[:] = 99.0
+    assert np.array_equal(cached(data), expected) and cached.hits == 1
+
+    scaler.fit(data * 10)
+    refitted = cached(data)
+    assert cached.misses == 2
+    assert np.array_equal(refitted, scaler.transform(data))
+    assert not np.array_equal(refitted, expected)
+    print("SpeedUp result isolation test passed ✓")
+
+
+def test_speedup_lru_eviction():
+    """The least recently used entry is evicted once the byte budget is exceeded."""
+    from dataruns.core.pipeline import SpeedUp
+
+    cached = SpeedUp(lambda x: np.full(1000, x, dtype=np.float64), max_bytes=2 * 8000)
+    cached(1)
+    cached(2)
+    cached(1)  # refresh 1, so 2 is now the oldest entry
+    cached(3)
+    assert cached.evictions == 1
+    assert cached.current_bytes <= cached.max_bytes
+    cached(1)
+    assert cached.hits == 2
+    cached(2)
+    assert cached.misses == 4
+    print("SpeedUp eviction test passed ✓")
+
+
+def test_sampled_fingerprint():
+    """Large buffers are sampled unless full_hash is requested."""
+    from dataruns.core.pipeline import fingerprint
+
+    big = np.zeros(1 << 20, dtype=np.float64)
+    tweaked = big.copy()
+    tweaked[12345] = 1.0
+    assert fingerprint(big, full_hash=True) != fingerprint(tweaked, full_hash=True)
+    assert fingerprint(big) == fingerprint(big.copy())
+
+
+if __name__ == "__main__":
+    test_speedup_decorator_hits_and_misses()
+    test_speedup_pipeline_wrapper_with_dataframe()
+    test_speedup_results_and_fitted_state()
+    test_speedup_lru_eviction()
+    test_sampled_fingerprint()
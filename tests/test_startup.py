@@ -0,0 +1,55 @@
+"""
+Startup-time regression test for ``import dataruns``.
+"""
+
+import sys
+import os
+import subprocess
+
+SRC = os.path.join(os.path.dirname(__file__), '..', 'src')
+
+# Cumulative import time budget for the dataruns package, in microseconds
+IMPORT_BUDGET_US = 100_000
+HEAVY_DEPENDENCIES = ('pandas', 'numpy', 'requests', 'openpyxl')
+
+
+def _import_times():
+    """Run ``python -X importtime -c "import dataruns"`` and parse its report."""
+    env = dict(os.environ, PYTHONPATH=SRC)
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import dataruns'],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_import_time_budget():
+    """import dataruns stays within budget and does not load heavy dependencies."""
+    times = _import_times()
+    assert 'dataruns' in times, times
+    assert times['dataruns'] < IMPORT_BUDGET_US, f"import dataruns took {times['dataruns']}us"
+    loaded = [name for name in HEAVY_DEPENDENCIES if name in times]
+    assert not loaded, f"import dataruns eagerly imported {loaded}"
+    print(f"import dataruns took {times['dataruns']}us ✓")
+
+
+def test_import_has_no_side_effects():
+    """Importing the source module does not create a logs/ directory."""
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, PYTHONPATH=os.path.abspath(SRC))
+        subprocess.run([sys.executable, '-c', 'import dataruns.source'], cwd=tmp, env=env, check=True)
+        assert not os.path.exists(os.path.join(tmp, 'logs'))
+    print("No import side effects ✓")
+
+
+if __name__ == "__main__":
+    test_import_time_budget()
+    test_import_has_no_side_effects()
@@ -0,0 +1,159 @@
+"""
+Tests for chunked execution of pipelines.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import numpy as np
+import pandas as pd
+
+
+def test_pipeline_stream_matches_batch():
+    """Streaming chunks through a fitted pipeline matches a single batch call."""
+    from dataruns.core.pipeline import Pipeline
+    from dataruns.core.transforms import StandardScaler, FillNA
+
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(100, 3))
+    scaler = StandardScaler().fit(data)
+    pipeline = Pipeline(FillNA(value=0.0), scaler)
+
+    chunks = (data[i:i + 30] for i in range(0, len(data), 30))
+    streamed = np.vstack(list(pipeline.stream(chunks)))
+    assert np.allclose(streamed, pipeline(data))
+    print("Pipeline stream test passed ✓")
+
+
+def test_pipeline_stream_rejects_unfitted_stages():
+    """Unfitted stateful stages are reported before any chunk is read."""
+    from dataruns.core.pipeline import Pipeline
+    from dataruns.core.transforms import StandardScaler, TransformComposer, DropNA
+
+    consumed = []
+
+    def chunks():
+        consumed.append(1)
+        yield pd.DataFrame({'a': [1.0, 2.0]})
+
+    pipeline = Pipeline(TransformComposer(DropNA(), StandardScaler()))
+    try:
+        pipeline.stream(chunks())
+    except ValueError as e:
+        assert 'StandardScaler' in str(e)
+    else:
+        raise AssertionError("stream() accepted an unfitted StandardScaler")
+    assert consumed == []
+    print("Pipeline stream validation test passed ✓")
+
+
+def test_partial_fit_matches_full_fit():
+    """Chunked partial_fit gives the same statistics as a full-batch fit."""
+    from dataruns.core.transforms import StandardScaler, MinMaxScaler, FillNA
+
+    rng = np.random.default_rng(1)
+    array = rng.normal(loc=1e6, scale=3.0, size=(1000, 4))
+    frame = pd.DataFrame(array, columns=list('abcd'))
+    frame.iloc[::7, 1] = np.nan
+
+    for data in (array, frame):
+        chunks = [data[i:i + 128] for i in range(0, len(data), 128)]
+        for cls, attrs in ((StandardScaler, ('mean_', 'std_')),
+                           (MinMaxScaler, ('min_', 'max_', 'scale_'))):
+            full = cls().fit(data)
+            partial = cls()
+            for chunk in chunks:
+                partial.partial_fit(chunk)
+            for attr in attrs:
+                assert np.allclose(np.asarray(getattr(full, attr)), np.asarray(getattr(partial, attr)),
+                                   rtol=1e-10, equal_nan=True), (cls.__name__, attr)
+
+    full = FillNA(method='mean').fit(frame)
+    partial = FillNA(method='mean')
+    for i in range(0, len(frame), 100):
+        partial.partial_fit(frame.iloc[i:i + 100])
+    pd.testing.assert_series_equal(full.fill_values_, partial.fill_values_)
+    print("partial_fit test passed ✓")
+
+
+def test_merge_partition_states():
+    """States fitted on separate partitions merge into the full-data state."""
+    from dataruns.core.transforms import StandardScaler, MinMaxScaler, FillNA
+
+    rng = np.random.default_rng(2)
+    data = rng.normal(size=(500, 3))
+    left, right = data[:123], data[123:]
+
+    for cls in (StandardScaler, MinMaxScaler):
+        merged = cls().fit(left).merge(cls().fit(right))
+        full = cls().fit(data)
+        assert np.allclose(merged.transform(data), full.transform(data))
+
+    merged = FillNA(method='mean').fit(left).merge(FillNA(method='mean').fit(right))
+    assert np.allclose(merged.fill_values_, data.mean(axis=0))
+
+    try:
+        StandardScaler().fit(data).partial_fit(pd.DataFrame(data))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("partial_fit accepted chunks with a different layout")
+    print("merge test passed ✓")
+
+
+def _reject_large(batch):
+    """Module level, so worker processes can unpickle it."""
+    if np.nanmax(batch) > 50:
+        raise RuntimeError("value out of range")
+    return batch
+
+
+def test_map_batches():
+    """map_batches runs fitted pipelines in worker processes and keeps row order."""
+    import glob
+    from dataruns.core.pipeline import Pipeline
+    from dataruns.core.transforms import StandardScaler, FillNA, DropNA
+
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(5_000, 4))
+    data[::9, 1] = np.nan
+    before = data.copy()
+    fill = FillNA(method='mean', copy=False).fit(data)
+    pipeline = Pipeline(fill, StandardScaler(copy=False).fit(fill.transform(data.copy())), np.abs)
+    shared = set(glob.glob('/dev/shm/psm_*'))
+
+    result = pipeline.map_batches(data, n_workers=2, batch_size=700)
+    assert np.array_equal(result, pipeline(before.copy()))
+    # workers get a read-only view of the input, copy=False stages cannot touch it
+    assert np.array_equal(data, before, equal_nan=True)
+
+    # batches may shrink, results are still concatenated in order
+    dropping = Pipeline(DropNA())
+    assert np.array_equal(dropping.map_batches(data, n_workers=2, batch_size=1_000), dropping(data))
+    frame = pd.DataFrame(data, columns=list('abcd'))
+    pd.testing.assert_frame_equal(dropping.map_batches(frame, n_workers=2, batch_size=1_200), dropping(frame))
+
+    try:
+        Pipeline(StandardScaler()).map_batches(data)
+        assert False, "unfitted stages must be rejected"
+    except ValueError:
+        pass
+    failing = data.copy()
+    failing[3_100, 0] = 100.0
+    try:
+        Pipeline(_reject_large).map_batches(failing, n_workers=2, batch_size=500)
+        assert False, "worker errors must propagate"
+    except RuntimeError:
+        pass
+    # every shared memory block was released
+    assert set(glob.glob('/dev/shm/psm_*')) == shared
+    print("map_batches test passed ✓")
+
+
+if __name__ == "__main__":
+    test_pipeline_stream_matches_batch()
+    test_pipeline_stream_rejects_unfitted_stages()
+    test_partial_fit_matches_full_fit()
+    test_merge_partition_states()
+    test_map_batches()
@@ -54,5 +54,345 @@ def test_transforms():
         traceback.print_exc()
         return False
 
+def test_fuse_affine():
+    """Chains of fitted affine transforms collapse into one equivalent kernel."""
+    from dataruns.core import (
+        Pipeline, TransformComposer, FillNA, StandardScaler, MinMaxScaler,
+        DropNA, FusedAffine, fuse_affine
+    )
+    
+    rng = np.random.default_rng(0)
+    array = rng.normal(loc=5.0, scale=2.0, size=(200, 3))
+    array[::9, 1] = np.nan
+    frame = pd.DataFrame(array, columns=['a', 'b', 'c'])
+    
+    for data in (array, frame):
+        composer = TransformComposer(FillNA(method='mean'), StandardScaler(), MinMaxScaler()).fit(data)
+        fused, report = fuse_affine(composer)
+        assert len(fused.transforms) == 1 and isinstance(fused.transforms[0], FusedAffine)
+        assert report['stages_fused'] == 3 and report['passes_eliminated'] > 0
+        assert np.allclose(np.asarray(fused.transform(data)), np.asarray(composer.transform(data)))
+    
+    # Non-affine stages split chains, and the input is only overwritten with copy=False
+    filled = np.nan_to_num(array)
+    scaler = StandardScaler().fit(filled)
+    minmax = MinMaxScaler().fit(scaler.transform(filled))
+    split, report = fuse_affine(Pipeline(scaler, DropNA(), minmax))
+    assert report['groups'] == 0 and len(split.functions) == 3
+    
+    pipeline = Pipeline(scaler, minmax)
+    fused, report = fuse_affine(pipeline, copy=False)
+    assert report['groups'] == 1 and len(fused.functions) == 1
+    expected = pipeline(filled)
+    buffer = filled.copy()
+    result = fused(buffer)
+    assert np.allclose(result, expected)
+    assert np.shares_memory(result, buffer)
+    print("fuse_affine test passed ✓")
+
+def _peak_allocation(func, *args, **kwargs):
+    """Peak bytes allocated while running func, measured with tracemalloc."""
+    import tracemalloc
+    
+    tracemalloc.start()
+    try:
+        func(*args, **kwargs)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def test_in_place_transforms():
+    """copy=False and out= reuse buffers instead of allocating new arrays."""
+    from dataruns.core import StandardScaler, MinMaxScaler, FillNA
+    
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(50_000, 20))  # 8 MB
+    data[::11, 3] = np.nan
+    
+    for cls, kwargs in ((StandardScaler, {}), (MinMaxScaler, {}), (FillNA, {'value': 0.0})):
+        copying = cls(**kwargs).fit(data)
+        expected = copying.transform(data)
+        assert _peak_allocation(copying.transform, data) >= data.nbytes
+        
+        in_place = cls(copy=False, **kwargs).fit(data)
+        owned = data.copy()
+        assert _peak_allocation(in_place.transform, owned) < data.nbytes // 4, cls.__name__
+        assert np.allclose(owned, expected, equal_nan=True)
+        assert in_place.transform(owned) is owned
+        
+        out = np.empty_like(data)
+        assert copying.transform(data, out=out) is out
+        assert np.allclose(out, expected, equal_nan=True)
+    
+    # Inputs of another dtype cannot be reused and are left untouched
+    ints = np.arange(12).reshape(4, 3)
+    scaled = StandardScaler(copy=False).fit(ints).transform(ints)
+    assert scaled.dtype == np.float64 and ints[0, 1] == 1
+    print("In-place transforms test passed ✓")
+
+def test_filter_rows_predicate():
+    """Declarative predicates filter vectorized with SQL null semantics and translate to SQL."""
+    import sqlite3
+    from dataruns.core import FilterRows, col
+
+    frame = pd.DataFrame({
+        'price': [5.0, 12.0, np.nan, 30.0, 8.0],
+        'region': ['EU', 'US', 'EU', None, 'APAC'],
+    })
+    predicate = ((col('price') > 6) & col('region').isin(['EU', 'US'])) | ~(col('price') <= 20)
+    result = FilterRows(predicate).transform(frame)
+    assert list(result.index) == [1, 3]
+
+    # NOT of an unknown comparison stays unknown, like in SQL
+    assert list(FilterRows(~(col('price') > 6)).transform(frame).index) == [0]
+    assert list(FilterRows(col('region') != 'EU').transform(frame).index) == [1, 4]
+    assert list(FilterRows(col('price').isna() | col('region').isna()).transform(frame).index) == [2, 3]
+
+    conn = sqlite3.connect(':memory:')
+    frame.to_sql('t', conn, index=False)
+    for check in (predicate, ~(col('price') > 6), col('region') != 'EU', col('price').between(5, 12),
+                  col('region').isin([]), ~col('region').isin([]), ~col('price').isin([]) | col('region').isna()):
+        clause, params = check.to_sql()
+        rows = conn.execute(f"SELECT rowid - 1 FROM t WHERE {clause}", params).fetchall()
+        assert [row[0] for row in rows] == list(FilterRows(check).transform(frame).index), repr(check)
+    conn.close()
+
+    array = np.array([[1.0, 2.0], [3.0, np.nan], [5.0, 6.0]])
+    assert np.array_equal(FilterRows(col(1) >= 2).transform(array), array[[0, 2]])
+    try:
+        bool(col('price') > 1)
+        assert False, "predicates must not be usable as booleans"
+    except TypeError:
+        pass
+    print("FilterRows predicate test passed ✓")
+
+
+def test_one_hot_encoder():
+    """Test OneHotEncoder keeps the fitted schema and handles unknown categories."""
+    from dataruns.core.transforms import OneHotEncoder
+
+    train = pd.DataFrame({
+        'price': [1.0, 2.0, 3.0, 4.0],
+        'region': ['US', 'EU', None, 'APAC'],
+        'size': pd.Categorical(['S', 'M', 'S', 'S'], categories=['S', 'M', 'L']),
+    })
+    encoder = OneHotEncoder().fit(train)
+    result = encoder.transform(train)
+    expected = pd.concat([train[['price']], pd.get_dummies(train['region'], prefix='region'),
+                          pd.get_dummies(train['size'], prefix='size')], axis=1)
+    pd.testing.assert_frame_equal(result, expected)
+
+    # a batch with an unseen and a missing category still gets every fitted column
+    batch = pd.DataFrame({'price': [5.0, 6.0], 'region': ['MARS', 'EU'], 'size': [None, 'L']})
+    result = encoder.transform(batch)
+    assert list(result.columns) == ['price'] + encoder.feature_names_out()
+    assert result.iloc[0, 1:].sum() == 0
+    assert result.loc[1, 'region_EU'] and result.loc[1, 'size_L']
+    assert encoder.modified_columns() == {'region', 'size'} | set(encoder.feature_names_out())
+
+    try:
+        OneHotEncoder(handle_unknown='error').fit(train).transform(batch)
+        assert False, "unknown categories should raise"
+    except ValueError:
+        pass
+
+    compact = OneHotEncoder(drop_first=True, dtype=np.uint8).fit(train).transform(batch)
+    assert list(compact.columns) == ['price', 'region_EU', 'region_US', 'size_M', 'size_L']
+    assert (compact.dtypes.iloc[1:] == np.uint8).all()
+    sparse = OneHotEncoder(drop_first=True, dtype=np.uint8, sparse=True).fit(train).transform(batch)
+    assert all(isinstance(dtype, pd.SparseDtype) for dtype in sparse.dtypes.iloc[1:])
+    pd.testing.assert_frame_equal(sparse.astype({name: np.uint8 for name in sparse.columns[1:]}), compact)
+
+    # sparse columns store only the nonzeros, and match the dense-buffer fallback
+    from unittest import mock
+    from dataruns.core import transforms
+    labels = pd.DataFrame({'k': np.repeat(np.arange(50), 40).astype(str)})
+    encoder = OneHotEncoder(sparse=True, dtype=bool).fit(labels)
+    built = encoder.transform(labels)
+    assert [column.sparse.npoints for _, column in built.items()] == [40] * 50
+    with mock.patch.object(transforms, '_SPARSE_INDEX', None):
+        pd.testing.assert_frame_equal(encoder.transform(labels), built)
+    print("OneHotEncoder test passed ✓")
+
+
+def test_hashing_encoder():
+    """Test HashingEncoder output width, stability and sign handling."""
+    from dataruns.core.transforms import HashingEncoder
+
+    frame = pd.DataFrame({
+        'amount': [1.0, 2.0, 3.0, 4.0],
+        'user': ['u1', 'u2', 'u1', None],
+        'url': ['a.com', 'b.com', 'c.com', 'a.com'],
+    })
+    encoder = HashingEncoder(n_features=8)
+    assert not encoder.needs_fit()
+    result = encoder.transform(frame)
+    assert list(result.columns) == ['amount'] + [f'hash_{i}' for i in range(8)]
+    hashed = result.iloc[:, 1:].to_numpy()
+    # one count per non-missing value, equal values hash alike
+    assert hashed.sum(axis=1).tolist() == [2, 2, 2, 1]
+    users = HashingEncoder(n_features=8, columns=['user']).transform(frame)
+    assert list(users.columns[:2]) == ['amount', 'url']
+    assert users.iloc[0, 2:].equals(users.iloc[2, 2:]) and users.iloc[3, 2:].sum() == 0
+
+    # rows hash the same whatever batch they arrive in
+    pd.testing.assert_frame_equal(encoder.transform(frame.iloc[2:]), result.iloc[2:])
+
+    signed = HashingEncoder(n_features=8, alternate_sign=True).transform(frame).iloc[:, 1:].to_numpy()
+    assert np.array_equal(np.abs(signed) <= np.abs(hashed), np.ones_like(hashed, dtype=bool))
+    assert set(np.unique(np.abs(signed))) <= {0.0, 1.0, 2.0}
+
+    # an int key column turns float in chunks with missing values, or object when read as text
+    ids = HashingEncoder(n_features=1024, columns=['id'])
+    chunks = [pd.DataFrame({'id': [7, 12, 3]}),
+              pd.DataFrame({'id': [7.0, np.nan, 12.0, 2.5]}),
+              pd.DataFrame({'id': pd.array(['7', None, '12', '2.5'], dtype=object)}),
+              pd.DataFrame({'id': pd.array([7, 12, None], dtype=object)}),
+              pd.DataFrame({'id': pd.array([7, 12, None], dtype='Int64')})]
+    encoded = [ids.transform(chunk).to_numpy() for chunk in chunks]
+    assert encoded[0][0].sum() == 1 and not np.array_equal(encoded[0][0], encoded[0][1])
+    for chunk in encoded[1:]:
+        assert np.array_equal(chunk[0], encoded[0][0]) and np.array_equal(chunk[1 if len(chunk) == 3 else 2], encoded[0][1])
+    assert np.array_equal(encoded[1][3], encoded[2][3]) and encoded[1][1].sum() == 0
+    print("HashingEncoder test passed ✓")
+
+
+def test_nan_kernels():
+    """Vectorized median/mode match the per-column reference and masks follow in-place changes."""
+    import warnings
+    from dataruns.core import FillNA, DropNA
+
+    rng = np.random.default_rng(0)
+    data = rng.integers(0, 4, size=(40, 12)).astype(float)
+    data[rng.random(data.shape) < 0.3] = np.nan
+    data[:, 0] = np.nan
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        medians = np.nanmedian(data, axis=0)
+    assert np.allclose(FillNA(method='median').fit(data).fill_values_, medians, equal_nan=True)
+
+    def mode_1d(column):
+        column = column[~np.isnan(column)]
+        if len(column) == 0:
+            return 0
+        values, counts = np.unique(column, return_counts=True)
+        return values[np.argmax(counts)]
+    modes = FillNA(method='mode').fit(data).fill_values_
+    assert np.array_equal(modes, [mode_1d(data[:, i]) for i in range(data.shape[1])])
+    assert FillNA(method='mode').fit(np.array([2.0, 1.0, 2.0, np.nan])).fill_values_ == 2.0
+
+    dropped = DropNA(how='all').transform(data)
+    filled = FillNA(method='mode').fit(dropped).transform(dropped)
+    assert not np.isnan(filled).any()
+    assert DropNA().transform(filled).shape == filled.shape
+
+    # a buffer refilled in place between calls is masked afresh every time
+    fill = FillNA(value=0.0)
+    buffer = np.array([[np.nan, 1.0], [2.0, 3.0]])
+    assert np.array_equal(fill.fit(buffer).transform(buffer), [[0.0, 1.0], [2.0, 3.0]])
+    buffer[:] = [[1.0, np.nan], [2.0, 3.0]]
+    assert np.array_equal(fill.transform(buffer), [[1.0, 0.0], [2.0, 3.0]])
+    assert DropNA().transform(buffer).shape == (1, 2)
+    buffer[:] = 1.0
+    assert DropNA().transform(buffer).shape == (2, 2)
+    print("NaN kernels test passed ✓")
+
+
+def test_shared_missing_mask():
+    """Consecutive NA-handling stages of a composer or pipeline compute the missing-value mask once."""
+    from unittest import mock
+    from dataruns.core import (DropNA, FillNA, MissingMask, Pipeline, StandardScaler,
+                               TransformComposer, fuse_affine)
+    from dataruns.core import transforms
+
+    rng = np.random.default_rng(1)
+    data = rng.normal(size=(60, 8))
+    data[rng.random(data.shape) < 0.2] = np.nan
+    data[:, 3] = np.nan  # all missing, so mean-filling leaves it NaN
+    fill = FillNA(method='mean').fit(data)
+    stages = [DropNA(how='all'), fill, DropNA(axis=1), FillNA(value=0.0), DropNA()]
+    expected = data
+    for stage in stages:
+        expected = stage.transform(expected)
+
+    mask = MissingMask()
+    result = TransformComposer(*stages).transform(data, mask=mask)
+    assert np.array_equal(result, expected) and mask.computed == 1
+    assert mask.known(result) and not mask.values.any()
+
+    # any other stage clears the mask, so it is computed again after it
+    scaled = TransformComposer(DropNA(how='all'), StandardScaler().fit(data), DropNA())
+    mask = MissingMask()
+    scaled.transform(data, mask=mask)
+    assert mask.computed == 2
+
+    # pipelines share one mask per call, FusedAffine included
+    created = []
+
+    class Recording(MissingMask):
+        def __init__(self):
+            super().__init__()
+            created.append(self)
+
+    affine = Pipeline(DropNA(how='all'), FillNA(value=0.0).fit(data), StandardScaler().fit(rng.normal(size=(60, 8))), DropNA())
+    fused, report = fuse_affine(affine)
+    assert report['groups'] == 1
+    with mock.patch.object(transforms, 'MissingMask', Recording):
+        for pipeline in (Pipeline(*stages), affine, fused):
+            # a buffer refilled in place gets a fresh mask on the next call
+            buffer = data.copy()
+            for refill in (None, 1.0):
+                if refill is not None:
+                    buffer[:] = refill
+                expected = buffer
+                for function in pipeline.functions:
+                    expected = function(expected)
+                assert np.allclose(pipeline(buffer), expected, equal_nan=True)
+    # the unfused scaler clears the mask, the fused kernel carries it
+    assert [recording.computed for recording in created] == [1, 1, 2, 2, 1, 1]
+    print("Shared missing mask test passed ✓")
+
+
+def test_column_threads():
+    """n_jobs splits columns into blocks without changing any result."""
+    from dataruns.core import StandardScaler, MinMaxScaler, FillNA, OneHotEncoder
+
+    rng = np.random.default_rng(0)
+    data = rng.integers(0, 6, size=(500, 37)).astype(float)
+    data[rng.random(data.shape) < 0.1] = np.nan
+    frame = pd.DataFrame(data, columns=[f"c{i}" for i in range(data.shape[1])])
+
+    for make in (lambda n_jobs: StandardScaler(n_jobs=n_jobs),
+                 lambda n_jobs: MinMaxScaler(n_jobs=n_jobs),
+                 lambda n_jobs: FillNA(method='mean', n_jobs=n_jobs),
+                 lambda n_jobs: FillNA(method='median', n_jobs=n_jobs),
+                 lambda n_jobs: FillNA(method='mode', n_jobs=n_jobs)):
+        serial = make(1).fit(data).transform(data)
+        for n_jobs in (4, -1):
+            assert np.array_equal(make(n_jobs).fit(data).transform(data), serial, equal_nan=True)
+        pd.testing.assert_frame_equal(make(4).fit(frame).transform(frame), make(1).fit(frame).transform(frame))
+
+    # 1D arrays are a single block
+    column = data[:, 0]
+    assert np.array_equal(StandardScaler(n_jobs=4).fit(column).transform(column),
+                          StandardScaler().fit(column).transform(column), equal_nan=True)
+
+    labels = pd.DataFrame({f"k{i}": rng.choice(list('abcd'), 200) for i in range(9)})
+    for kwargs in ({}, {'sparse': True, 'drop_first': True}):
+        expected = OneHotEncoder(**kwargs).fit(labels).transform(labels)
+        pd.testing.assert_frame_equal(OneHotEncoder(n_jobs=3, **kwargs).fit(labels).transform(labels), expected)
+    assert len(StandardScaler(n_jobs=4)._column_blocks(3)) == 3
+    print("Column threads test passed ✓")
+
+
 if __name__ == "__main__":
     test_transforms()
+    test_fuse_affine()
+    test_in_place_transforms()
+    test_filter_rows_predicate()
+    test_one_hot_encoder()
+    test_hashing_encoder()
+    test_nan_kernels()
+    test_shared_missing_mask()
+    test_column_threads()